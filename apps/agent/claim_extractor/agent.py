@@ -1,17 +1,22 @@
 import logging
+from typing import Optional
 
 from dotenv import load_dotenv
 from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
+from claim_extractor.config import PIPELINE_CONFIG
 from claim_extractor.nodes import (
+    STRUCTURED_OUTPUTS,
     decomposition_node,
     disambiguation_node,
+    pipeline_node,
     selection_node,
     sentence_splitter_node,
     validation_node,
 )
 from claim_extractor.schemas import State
+from utils import precompile_structured_outputs, track_run_slot
 
 load_dotenv()
 
@@ -21,7 +26,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def create_graph() -> CompiledStateGraph:
+def create_graph(streaming: Optional[bool] = None) -> CompiledStateGraph:
     """Set up the claim extraction workflow graph.
 
     The pipeline follows these steps:
@@ -30,9 +35,29 @@ def create_graph() -> CompiledStateGraph:
     3. Resolve ambiguities like pronouns
     4. Extract specific atomic claims
     5. Validate claims are properly formed
+
+    In streaming mode steps 2-5 run in a single node where each sentence
+    moves on as soon as its own previous step is done.
+
+    Args:
+        streaming: Use the streaming pipeline (defaults to PIPELINE_CONFIG)
     """
+    if streaming is None:
+        streaming = PIPELINE_CONFIG["streaming"]
+
+    # Bind output schemas once instead of on every LLM call
+    precompile_structured_outputs(STRUCTURED_OUTPUTS)
+
     workflow = StateGraph(State)
 
+    if streaming:
+        workflow.add_node("sentence_splitter", sentence_splitter_node)
+        workflow.add_node("pipeline", pipeline_node)
+        workflow.set_entry_point("sentence_splitter")
+        workflow.add_edge("sentence_splitter", "pipeline")
+        workflow.set_finish_point("pipeline")
+        return workflow.compile()
+
     # Add nodes
     workflow.add_node("sentence_splitter", sentence_splitter_node)
     workflow.add_node("selection", selection_node)
@@ -55,4 +80,5 @@ def create_graph() -> CompiledStateGraph:
     return workflow.compile()
 
 
-graph = create_graph()
+# Runs started through the server hold their API key's concurrency slot
+graph = track_run_slot(create_graph())
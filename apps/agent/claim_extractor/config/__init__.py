@@ -6,7 +6,10 @@ Central storage for all configuration settings.
 from claim_extractor.config.nodes import (
     CONTEXT_WINDOWS,
     DECOMPOSITION_CONFIG,
+    DEDUP_CONFIG,
     DISAMBIGUATION_CONFIG,
+    PIPELINE_CONFIG,
+    PREFILTER_CONFIG,
     SELECTION_CONFIG,
     VALIDATION_CONFIG,
 )
@@ -17,6 +20,9 @@ __all__ = [
     "DISAMBIGUATION_CONFIG",
     "DECOMPOSITION_CONFIG",
     "VALIDATION_CONFIG",
+    "DEDUP_CONFIG",
+    "PIPELINE_CONFIG",
+    "PREFILTER_CONFIG",
     # Context windows
     "CONTEXT_WINDOWS",
 ]
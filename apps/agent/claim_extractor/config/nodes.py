@@ -8,12 +8,18 @@ SELECTION_CONFIG = {
     "completions": 3,
     "min_successes": 2,
     "temperature": 0.2,  # Higher temp for diverse judgments
+    "max_concurrency": 10,  # Sentences voted on at once
+    "early_stop": True,  # Cancel remaining attempts once the vote is decided
+    "batch_size": 1,  # Sentences per LLM call; 1 disables batching
+    "batch_token_budget": 2000,  # Max tokens of judged sentences per batch
 }
 
 DISAMBIGUATION_CONFIG = {
     "completions": 3,
     "min_successes": 2,
     "temperature": 0.2,  # Higher temp for diverse judgments
+    "max_concurrency": 10,  # Sentences voted on at once
+    "early_stop": True,  # Cancel remaining attempts once the vote is decided
 }
 
 DECOMPOSITION_CONFIG = {
@@ -24,6 +30,38 @@ DECOMPOSITION_CONFIG = {
 
 VALIDATION_CONFIG = {
     "temperature": 0.0,  # Zero temp for consistent results
+    # Settle clear-cut claims with local rules; only ambiguous ones reach the LLM
+    "fast_path": True,
+    "fast_path_max_words": 60,  # Longer claims always go to the LLM
+    "batch_size": 1,  # Claims per LLM call; 1 disables batching
+    "batch_token_budget": 2000,  # Max tokens of claims per batch
+}
+
+# Merging of paraphrased claims after validation (loads torch and the encoder
+# on first use)
+DEDUP_CONFIG = {
+    "enabled": False,
+    "encoder": "all-MiniLM-L6-v2",  # sentence-transformers model
+    "threshold": 0.9,  # Min cosine similarity to treat claims as paraphrases
+    "batch_size": 64,  # Claims embedded per forward pass
+}
+
+# Local pre-filter ahead of LLM selection
+PREFILTER_CONFIG = {
+    "enabled": False,
+    # Written by scripts/train_prefilter.py
+    "model_path": "models/selection_prefilter.pkl",
+    "threshold": 0.9,  # Min confidence to skip the LLM for a sentence
+    # JSONL file that LLM selection outcomes are appended to, for training
+    "decision_log_path": None,
+}
+
+# Streaming pipeline - each sentence flows through selection, disambiguation,
+# decomposition and validation independently instead of stage by stage
+PIPELINE_CONFIG = {
+    "streaming": False,
+    "queue_size": 16,  # Max items waiting between two stages
+    "workers_per_stage": 10,  # Items each stage works on at once
 }
 
 # Context windows
@@ -0,0 +1,103 @@
+"""Semantic deduplication of validated claims.
+
+Paraphrased claims from neighbouring sentences would each be verified
+separately; merging them here saves a whole verification run per duplicate.
+Claims that differ in a number, a name or a negation embed just as closely as
+paraphrases, so those are never merged.
+"""
+
+import logging
+from typing import List, Sequence
+
+import numpy as np
+from utils.anchors import claim_anchors, is_negated
+from utils.embeddings import cosine_similarity_matrix, encode_texts
+
+from claim_extractor.config import DEDUP_CONFIG
+from claim_extractor.schemas import ValidatedClaim
+
+logger = logging.getLogger(__name__)
+
+
+def merge_similar_claims(
+    claims: Sequence[ValidatedClaim],
+    embeddings: np.ndarray,
+    threshold: float = DEDUP_CONFIG["threshold"],
+) -> List[ValidatedClaim]:
+    """Merge claims whose embeddings are near-identical.
+
+    Claims are visited in order; the first of a group of paraphrases is kept
+    and records the sentence indices of every claim merged into it. Only
+    claims with the same numbers and named entities (see claim_anchors) that
+    are either both negated or both not are merged.
+
+    Args:
+        claims: Claims in document order
+        embeddings: Unit-length embedding per claim
+        threshold: Min cosine similarity for two claims to be merged
+
+    Returns:
+        The kept claims, in the same order
+    """
+    similar = cosine_similarity_matrix(embeddings) >= threshold
+    anchors = [
+        (claim_anchors(claim.claim_text), is_negated(claim.claim_text))
+        for claim in claims
+    ]
+    merged_into = np.full(len(claims), -1)
+    kept = []
+
+    for i, claim in enumerate(claims):
+        if merged_into[i] >= 0:
+            continue
+
+        # Later, not yet merged claims that paraphrase this one
+        candidates = np.flatnonzero(similar[i, i + 1 :] & (merged_into[i + 1 :] < 0))
+        duplicates = [j for j in candidates + i + 1 if anchors[j] == anchors[i]]
+        merged_into[duplicates] = i
+
+        source_indices = list(claim.source_indices or [claim.original_index])
+        for j in duplicates:
+            logger.info(
+                f"Merged paraphrased claim '{claims[j].claim_text}' into "
+                f"'{claim.claim_text}'"
+            )
+            for index in claims[j].source_indices or [claims[j].original_index]:
+                if index not in source_indices:
+                    source_indices.append(index)
+
+        kept.append(claim.model_copy(update={"source_indices": source_indices}))
+
+    return kept
+
+
+def deduplicate_claims(claims: Sequence[ValidatedClaim]) -> List[ValidatedClaim]:
+    """Embed claims and merge paraphrases, if enabled.
+
+    Falls back to the input when the encoder is unavailable.
+
+    Args:
+        claims: Claims in document order
+
+    Returns:
+        Deduplicated claims in the same order
+    """
+    if not DEDUP_CONFIG["enabled"] or len(claims) < 2:
+        return list(claims)
+
+    try:
+        embeddings = encode_texts(
+            [claim.claim_text for claim in claims],
+            DEDUP_CONFIG["encoder"],
+            DEDUP_CONFIG["batch_size"],
+        )
+    except Exception as e:
+        logger.warning(f"Semantic deduplication skipped, encoder unavailable: {e}")
+        return list(claims)
+
+    deduplicated = merge_similar_claims(claims, embeddings)
+    logger.info(
+        f"Semantic deduplication merged {len(claims) - len(deduplicated)} of "
+        f"{len(claims)} claims"
+    )
+    return deduplicated
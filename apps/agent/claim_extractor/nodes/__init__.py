@@ -1,10 +1,37 @@
 """Node components for the claim extraction workflow."""
 
-from claim_extractor.nodes.decomposition import decomposition_node
-from claim_extractor.nodes.disambiguation import disambiguation_node
-from claim_extractor.nodes.selection import selection_node
+from claim_extractor.config import (
+    DECOMPOSITION_CONFIG,
+    DISAMBIGUATION_CONFIG,
+    SELECTION_CONFIG,
+)
+from claim_extractor.nodes.decomposition import DecompositionOutput, decomposition_node
+from claim_extractor.nodes.disambiguation import (
+    DisambiguationOutput,
+    disambiguation_node,
+)
+from claim_extractor.nodes.pipeline import pipeline_node
+from claim_extractor.nodes.selection import (
+    BatchSelectionOutput,
+    SelectionOutput,
+    selection_node,
+)
 from claim_extractor.nodes.sentence_splitter import sentence_splitter_node
-from claim_extractor.nodes.validation import validation_node
+from claim_extractor.nodes.validation import (
+    BatchValidationOutput,
+    ValidationOutput,
+    validation_node,
+)
+
+# (get_llm kwargs, output schema) for every structured LLM call in the graph
+STRUCTURED_OUTPUTS = [
+    ({"completions": SELECTION_CONFIG["completions"]}, SelectionOutput),
+    ({"completions": DISAMBIGUATION_CONFIG["completions"]}, DisambiguationOutput),
+    ({"completions": DECOMPOSITION_CONFIG["completions"]}, DecompositionOutput),
+    ({}, ValidationOutput),
+    ({"completions": SELECTION_CONFIG["completions"]}, BatchSelectionOutput),
+    ({}, BatchValidationOutput),
+]
 
 __all__ = [
     "sentence_splitter_node",
@@ -12,4 +39,6 @@ __all__ = [
     "disambiguation_node",
     "decomposition_node",
     "validation_node",
+    "pipeline_node",
+    "STRUCTURED_OUTPUTS",
 ]
@@ -10,16 +10,17 @@ from typing import Dict, List
 
 from pydantic import BaseModel, Field
 
-from claim_extractor.config import DECOMPOSITION_CONFIG
-from claim_extractor.prompts import DECOMPOSITION_SYSTEM_PROMPT, HUMAN_PROMPT
+from claim_extractor.config import CONTEXT_WINDOWS, DECOMPOSITION_CONFIG
+from claim_extractor.prompts import DECOMPOSITION_PROMPT
 from claim_extractor.schemas import DisambiguatedContent, PotentialClaim, State
-from utils import call_llm_with_structured_output, get_llm, remove_following_sentences
+from utils import call_llm_with_structured_output, get_llm
 
 logger = logging.getLogger(__name__)
 
 # Use only one completion here - we've already filtered and disambiguated
 COMPLETIONS = DECOMPOSITION_CONFIG["completions"]
 MIN_SUCCESSES = DECOMPOSITION_CONFIG["min_successes"]
+CONTEXT_WINDOW = CONTEXT_WINDOWS["decomposition"]
 
 
 class DecompositionOutput(BaseModel):
@@ -35,11 +36,13 @@ class DecompositionOutput(BaseModel):
 
 async def _decomposition_stage(
     disambiguated_item: DisambiguatedContent,
+    sentences: List[str],
 ) -> List[PotentialClaim]:
     """Extract atomic claims from a disambiguated sentence.
 
     Args:
         disambiguated_item: Disambiguated content to process
+        sentences: The document's sentences the context window points into
 
     Returns:
         List of potential claims
@@ -51,22 +54,20 @@ async def _decomposition_stage(
     llm = get_llm(completions=COMPLETIONS)
 
     # Get context without following sentences
-    original_context = (
-        disambiguated_item.original_selected_item.original_context_item.context_for_llm
+    context_item = disambiguated_item.original_selected_item.original_context_item
+    modified_context = context_item.render_context(
+        sentences,
+        preceding_sentences=CONTEXT_WINDOW["preceding_sentences"],
+        following_sentences=CONTEXT_WINDOW["following_sentences"],
     )
-    modified_context = remove_following_sentences(original_context)
 
     # Prep the prompt
-    messages = [
-        ("system", DECOMPOSITION_SYSTEM_PROMPT),
-        (
-            "human",
-            HUMAN_PROMPT.format(
-                excerpt=modified_context,
-                sentence=sentence,
-            ),
-        ),
-    ]
+    messages = DECOMPOSITION_PROMPT.invoke(
+        {
+            "excerpt": modified_context,
+            "sentence": sentence,
+        }
+    )
 
     # Call the LLM to extract claims
     response = await call_llm_with_structured_output(
@@ -74,6 +75,7 @@ async def _decomposition_stage(
         output_class=DecompositionOutput,
         messages=messages,
         context_desc=f"decomposition stage for sentence '{sentence}'",
+        use_cache=True,
     )
 
     # If no claims were found
@@ -124,7 +126,7 @@ async def decomposition_node(state: State) -> Dict[str, List[PotentialClaim]]:
     # Process all contents in parallel for speed
     potential_claims = await asyncio.gather(
         *(
-            _decomposition_stage(disambiguated_content)
+            _decomposition_stage(disambiguated_content, state.sentences)
             for disambiguated_content in disambiguated_contents
         )
     )
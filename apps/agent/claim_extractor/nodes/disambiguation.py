@@ -4,19 +4,19 @@ Clarifies pronouns and other references so claims make sense on their own.
 """
 
 import logging
+from functools import partial
 from typing import Dict, List, Optional, Tuple
 
 from langchain_core.language_models.chat_models import BaseChatModel
 from pydantic import BaseModel, Field
 
-from claim_extractor.config import DISAMBIGUATION_CONFIG
-from claim_extractor.prompts import DISAMBIGUATION_SYSTEM_PROMPT, HUMAN_PROMPT
+from claim_extractor.config import CONTEXT_WINDOWS, DISAMBIGUATION_CONFIG
+from claim_extractor.prompts import DISAMBIGUATION_PROMPT
 from claim_extractor.schemas import DisambiguatedContent, SelectedContent, State
 from utils import (
     call_llm_with_structured_output,
     get_llm,
     process_with_voting,
-    remove_following_sentences,
 )
 
 logger = logging.getLogger(__name__)
@@ -25,6 +25,9 @@ logger = logging.getLogger(__name__)
 # to ensure consistency in how references are resolved
 COMPLETIONS = DISAMBIGUATION_CONFIG["completions"]
 MIN_SUCCESSES = DISAMBIGUATION_CONFIG["min_successes"]
+MAX_CONCURRENCY = DISAMBIGUATION_CONFIG["max_concurrency"]
+EARLY_STOP = DISAMBIGUATION_CONFIG["early_stop"]
+CONTEXT_WINDOW = CONTEXT_WINDOWS["disambiguation"]
 
 
 class DisambiguationOutput(BaseModel):
@@ -39,13 +42,14 @@ class DisambiguationOutput(BaseModel):
 
 
 async def _single_disambiguation_attempt(
-    selected_item: SelectedContent, llm: BaseChatModel
+    selected_item: SelectedContent, llm: BaseChatModel, sentences: List[str]
 ) -> Tuple[bool, Optional[str]]:
     """Try to disambiguate a single sentence.
 
     Args:
         selected_item: Selected content to disambiguate
         llm: LLM instance
+        sentences: The document's sentences the context window points into
 
     Returns:
         (success, disambiguated_sentence)
@@ -54,21 +58,19 @@ async def _single_disambiguation_attempt(
 
     # Get context but remove following sentences
     # We don't want to rely on future info that might not be available
-    modified_context = remove_following_sentences(
-        selected_item.original_context_item.context_for_llm
+    modified_context = selected_item.original_context_item.render_context(
+        sentences,
+        preceding_sentences=CONTEXT_WINDOW["preceding_sentences"],
+        following_sentences=CONTEXT_WINDOW["following_sentences"],
     )
 
     # Prep the prompt
-    messages = [
-        ("system", DISAMBIGUATION_SYSTEM_PROMPT),
-        (
-            "human",
-            HUMAN_PROMPT.format(
-                excerpt=modified_context,
-                sentence=sentence,
-            ),
-        ),
-    ]
+    messages = DISAMBIGUATION_PROMPT.invoke(
+        {
+            "excerpt": modified_context,
+            "sentence": sentence,
+        }
+    )
 
     # Call the LLM
     response = await call_llm_with_structured_output(
@@ -131,10 +133,14 @@ async def disambiguation_node(state: State) -> Dict[str, List[DisambiguatedConte
     # Process all selected contents with voting
     disambiguated_contents = await process_with_voting(
         items=selected_contents,
-        processor=_single_disambiguation_attempt,
+        processor=partial(
+            _single_disambiguation_attempt, sentences=state.sentences
+        ),
         llm=llm,
         completions=COMPLETIONS,
         min_successes=MIN_SUCCESSES,
+        max_concurrency=MAX_CONCURRENCY,
+        early_stop=EARLY_STOP,
         result_factory=_create_disambiguated_content,
         description="sentence for disambiguation",
     )
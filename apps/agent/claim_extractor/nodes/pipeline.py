@@ -0,0 +1,229 @@
+"""Streaming pipeline node - runs every sentence through all stages independently.
+
+Alternative to the stage-by-stage graph: sentences flow through selection,
+disambiguation, decomposition and validation as soon as their previous step
+finishes, with bounded queues between stages.
+"""
+
+import asyncio
+import logging
+import time
+from collections import Counter
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from claim_extractor.config import (
+    DISAMBIGUATION_CONFIG,
+    PIPELINE_CONFIG,
+    SELECTION_CONFIG,
+)
+from claim_extractor.dedup import deduplicate_claims
+from claim_extractor.nodes.decomposition import _decomposition_stage
+from claim_extractor.nodes.disambiguation import (
+    _create_disambiguated_content,
+    _single_disambiguation_attempt,
+)
+from claim_extractor.nodes.selection import (
+    _create_selected_content,
+    _prefilter_sentences,
+    _single_selection_attempt,
+)
+from claim_extractor.prefilter import log_selection_decisions
+from claim_extractor.nodes.validation import (
+    _log_validation_paths,
+    _select_valid_claims,
+    _validate_claims,
+)
+from claim_extractor.schemas import (
+    ContextualSentence,
+    DisambiguatedContent,
+    PotentialClaim,
+    SelectedContent,
+    State,
+    ValidatedClaim,
+)
+from utils import get_llm, vote_on_item
+
+logger = logging.getLogger(__name__)
+
+QUEUE_SIZE = PIPELINE_CONFIG["queue_size"]
+WORKERS_PER_STAGE = PIPELINE_CONFIG["workers_per_stage"]
+
+# Items are tagged with (sentence index, claim position) so the final
+# output can be put back into document order
+Position = Tuple[int, int]
+StageHandler = Callable[[Any], Awaitable[List[Any]]]
+
+
+def _start_stage(
+    name: str,
+    inbox: asyncio.Queue,
+    outbox: Optional[asyncio.Queue],
+    handler: StageHandler,
+    results: Dict[Position, Any],
+) -> List[asyncio.Task]:
+    """Start the workers of one stage.
+
+    Every item taken from the inbox is handed to the handler; each output is
+    recorded in results and forwarded to the outbox (if any).
+    """
+
+    async def worker() -> None:
+        while True:
+            (index, position), item = await inbox.get()
+            try:
+                outputs = await handler(item)
+                for offset, output in enumerate(outputs):
+                    key = (index, position + offset)
+                    results[key] = output
+                    if outbox is not None:
+                        await outbox.put((key, output))
+            except Exception as e:
+                logger.error(
+                    f"Pipeline stage '{name}' failed for sentence {index}: {e}"
+                )
+            finally:
+                inbox.task_done()
+
+    return [asyncio.create_task(worker()) for _ in range(max(1, WORKERS_PER_STAGE))]
+
+
+async def _run_pipeline(
+    contextual_sentences: List[ContextualSentence], sentences: List[str]
+) -> Dict[str, Dict[Position, Any]]:
+    """Push every sentence through the four stages.
+
+    Returns:
+        Per-stage outputs keyed by (sentence index, claim position)
+    """
+    selection_llm = get_llm(completions=SELECTION_CONFIG["completions"])
+    disambiguation_llm = get_llm(completions=DISAMBIGUATION_CONFIG["completions"])
+
+    # Sentences the pre-filter settles skip LLM selection (or the pipeline)
+    preselected, uncertain = await _prefilter_sentences(contextual_sentences)
+    preselected_by_index = {
+        item.original_context_item.original_index: item for item in preselected
+    }
+    to_process = set(preselected_by_index) | {
+        item.original_index for item in uncertain
+    }
+
+    async def select(item: ContextualSentence) -> List[SelectedContent]:
+        if item.original_index in preselected_by_index:
+            return [preselected_by_index[item.original_index]]
+
+        failed_calls = set()
+        selected = await vote_on_item(
+            item,
+            partial(
+                _single_selection_attempt,
+                sentences=sentences,
+                failed_calls=failed_calls,
+            ),
+            selection_llm,
+            SELECTION_CONFIG["completions"],
+            SELECTION_CONFIG["min_successes"],
+            _create_selected_content,
+            description="sentence",
+            early_stop=SELECTION_CONFIG["early_stop"],
+        )
+        # A rejection caused by failed LLM calls says nothing about the sentence
+        if selected is not None or not failed_calls:
+            log_selection_decisions([(item.original_sentence, selected is not None)])
+        return [selected] if selected else []
+
+    async def disambiguate(item: SelectedContent) -> List[DisambiguatedContent]:
+        disambiguated = await vote_on_item(
+            item,
+            partial(_single_disambiguation_attempt, sentences=sentences),
+            disambiguation_llm,
+            DISAMBIGUATION_CONFIG["completions"],
+            DISAMBIGUATION_CONFIG["min_successes"],
+            _create_disambiguated_content,
+            description="sentence for disambiguation",
+            early_stop=DISAMBIGUATION_CONFIG["early_stop"],
+        )
+        return [disambiguated] if disambiguated else []
+
+    async def decompose(item: DisambiguatedContent) -> List[PotentialClaim]:
+        return await _decomposition_stage(item, sentences)
+
+    validation_paths: Counter = Counter()
+
+    async def validate(item: PotentialClaim) -> List[ValidatedClaim]:
+        return await _validate_claims([item], validation_paths)
+
+    stages = [
+        ("selection", select),
+        ("disambiguation", disambiguate),
+        ("decomposition", decompose),
+        ("validation", validate),
+    ]
+    queues = [asyncio.Queue(maxsize=QUEUE_SIZE) for _ in stages]
+    results: Dict[str, Dict[Position, Any]] = {name: {} for name, _ in stages}
+
+    workers: List[List[asyncio.Task]] = []
+    for i, (name, handler) in enumerate(stages):
+        outbox = queues[i + 1] if i + 1 < len(queues) else None
+        workers.append(_start_stage(name, queues[i], outbox, handler, results[name]))
+
+    try:
+        for item in contextual_sentences:
+            if item.original_index in to_process:
+                await queues[0].put(((item.original_index, 0), item))
+
+        # A stage is finished once its queue is drained, and it only
+        # acknowledges items after forwarding them, so draining in order
+        # means every item has reached the end
+        for queue, stage_workers in zip(queues, workers):
+            await queue.join()
+            for task in stage_workers:
+                task.cancel()
+    finally:
+        for stage_workers in workers:
+            for task in stage_workers:
+                task.cancel()
+
+    _log_validation_paths(validation_paths)
+    return results
+
+
+def _in_document_order(outputs: Dict[Position, Any]) -> List[Any]:
+    return [outputs[key] for key in sorted(outputs)]
+
+
+async def pipeline_node(state: State) -> Dict[str, List[Any]]:
+    """Extract and validate claims with per-sentence streaming.
+
+    Args:
+        state: Current workflow state
+
+    Returns:
+        Dictionary with the same keys the stage-by-stage nodes produce
+    """
+    contextual_sentences = state.contextual_sentences or []
+
+    if not contextual_sentences:
+        logger.warning("No sentences to process")
+        return {}
+
+    started = time.perf_counter()
+    results = await _run_pipeline(contextual_sentences, state.sentences)
+
+    potential_claims = _in_document_order(results["decomposition"])
+    validated_claims = _select_valid_claims(
+        _in_document_order(results["validation"])
+    )
+    validated_claims = await asyncio.to_thread(deduplicate_claims, validated_claims)
+
+    logger.info(
+        f"Pipeline processed {len(contextual_sentences)} sentences into "
+        f"{len(validated_claims)} validated claims in "
+        f"{time.perf_counter() - started:.2f}s"
+    )
+    return {
+        "selected_contents": _in_document_order(results["selection"]),
+        "disambiguated_contents": _in_document_order(results["disambiguation"]),
+        "potential_claims": potential_claims,
+        "validated_claims": validated_claims,
+    }
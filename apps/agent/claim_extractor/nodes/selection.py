@@ -3,15 +3,28 @@
 Filters out fluff and keeps only sentences with factual claims.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Optional, Tuple
+from functools import partial
+from typing import Dict, List, Optional, Set, Tuple
 
-from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
-from utils import call_llm_with_structured_output, get_llm, process_with_voting
-
-from claim_extractor.config import SELECTION_CONFIG
-from claim_extractor.prompts import HUMAN_PROMPT, SELECTION_SYSTEM_PROMPT
+from utils import (
+    call_llm_with_structured_output,
+    estimate_token_count,
+    get_llm,
+    pack_batches,
+    process_with_voting,
+)
+
+from claim_extractor.config import PREFILTER_CONFIG, SELECTION_CONFIG
+from claim_extractor.prefilter import (
+    PrefilterDecision,
+    classify_sentences,
+    get_prefilter,
+    log_selection_decisions,
+)
+from claim_extractor.prompts import BATCH_SELECTION_PROMPT, SELECTION_PROMPT
 from claim_extractor.schemas import ContextualSentence, SelectedContent, State
 
 logger = logging.getLogger(__name__)
@@ -19,6 +32,10 @@ logger = logging.getLogger(__name__)
 
 COMPLETIONS = SELECTION_CONFIG["completions"]
 MIN_SUCCESSES = SELECTION_CONFIG["min_successes"]
+MAX_CONCURRENCY = SELECTION_CONFIG["max_concurrency"]
+EARLY_STOP = SELECTION_CONFIG["early_stop"]
+BATCH_SIZE = SELECTION_CONFIG["batch_size"]
+BATCH_TOKEN_BUDGET = SELECTION_CONFIG["batch_token_budget"]
 
 
 class SelectionOutput(BaseModel):
@@ -35,14 +52,51 @@ class SelectionOutput(BaseModel):
     )
 
 
+class BatchSelectionItem(SelectionOutput):
+    """Selection result for one sentence of a batch."""
+
+    index: int = Field(description="Number of the sentence this result is for")
+
+
+class BatchSelectionOutput(BaseModel):
+    """Response schema for batched selection LLM calls."""
+
+    results: List[BatchSelectionItem] = Field(
+        default_factory=list, description="One result per numbered sentence"
+    )
+
+
+def _interpret_selection(
+    selection_response: Optional[SelectionOutput], sentence: str
+) -> Tuple[bool, Optional[str]]:
+    """Turn a selection response into (success, processed_sentence)."""
+    # If LLM call failed or no verifiable content
+    if (
+        not selection_response
+        or not selection_response.processed_sentence
+        or selection_response.no_verifiable_claims
+    ):
+        return False, None
+
+    # Check if we're keeping it as-is or using the processed version
+    if selection_response.remains_unchanged:
+        return True, sentence
+    return True, selection_response.processed_sentence.strip()
+
+
 async def _single_selection_attempt(
-    contextual_item: ContextualSentence, llm
+    contextual_item: ContextualSentence,
+    llm,
+    sentences: List[str],
+    failed_calls: Optional[Set[int]] = None,
 ) -> Tuple[bool, Optional[str]]:
     """Make a single selection attempt.
 
     Args:
         contextual_item: Sentence with context
         llm: LLM instance
+        sentences: The document's sentences the context window points into
+        failed_calls: Collects the indices of sentences whose LLM call failed
 
     Returns:
         (success, processed_sentence)
@@ -50,16 +104,9 @@ async def _single_selection_attempt(
     sentence = contextual_item.original_sentence
 
     # Prepare the prompt
-    messages = ChatPromptTemplate(
-        [
-            ("system", SELECTION_SYSTEM_PROMPT),
-            ("human", HUMAN_PROMPT),
-        ]
-    )
-
-    prompt_messages = messages.invoke(
+    prompt_messages = SELECTION_PROMPT.invoke(
         {
-            "excerpt": contextual_item.context_for_llm,
+            "excerpt": contextual_item.render_context(sentences),
             "sentence": sentence,
         }
     )
@@ -71,22 +118,10 @@ async def _single_selection_attempt(
         messages=prompt_messages,
         context_desc=f"selection attempt for '{sentence}'",
     )
+    if selection_response is None and failed_calls is not None:
+        failed_calls.add(contextual_item.original_index)
 
-    # If LLM call failed or no verifiable content
-    if (
-        not selection_response
-        or not selection_response.processed_sentence
-        or selection_response.no_verifiable_claims
-    ):
-        return False, None
-
-    # Check if we're keeping it as-is or using the processed version
-    if selection_response.remains_unchanged:
-        processed = sentence
-    else:
-        processed = selection_response.processed_sentence.strip()
-
-    return True, processed
+    return _interpret_selection(selection_response, sentence)
 
 
 def _create_selected_content(
@@ -109,6 +144,206 @@ def _create_selected_content(
     )
 
 
+def _render_batch_excerpt(
+    batch: List[ContextualSentence], sentences: List[str]
+) -> str:
+    """Render the union of the batch's context windows with numbered sentences."""
+    start = min(item.context_start for item in batch)
+    end = max(item.context_end for item in batch)
+
+    parts = []
+    if batch[0].metadata:
+        parts.append(f"[Document Metadata: {batch[0].metadata}]")
+    parts.extend(f"[{i}] {sentences[i]}" for i in range(start, end))
+    return "\n".join(parts)
+
+
+async def _single_batch_selection_attempt(
+    batch: List[ContextualSentence], llm, sentences: List[str]
+) -> Dict[int, Tuple[bool, Optional[str]]]:
+    """Make one selection attempt covering every sentence of a batch.
+
+    Args:
+        batch: Sentences with context
+        llm: LLM instance
+        sentences: The document's sentences the context windows point into
+
+    Returns:
+        (success, processed_sentence) keyed by sentence index; sentences the
+        response did not cover are left out
+    """
+    prompt_messages = BATCH_SELECTION_PROMPT.invoke(
+        {
+            "excerpt": _render_batch_excerpt(batch, sentences),
+            "sentence_indices": ", ".join(
+                str(item.original_index) for item in batch
+            ),
+        }
+    )
+
+    response = await call_llm_with_structured_output(
+        llm=llm,
+        output_class=BatchSelectionOutput,
+        messages=prompt_messages,
+        context_desc=f"batch selection attempt for {len(batch)} sentences",
+    )
+    if not response:
+        return {}
+
+    by_index = {item.original_index: item for item in batch}
+    outcomes = {}
+    for result in response.results:
+        item = by_index.get(result.index)
+        if item is not None and result.index not in outcomes:
+            outcomes[result.index] = _interpret_selection(
+                result, item.original_sentence
+            )
+    return outcomes
+
+
+async def _select_batch(
+    batch: List[ContextualSentence], llm, sentences: List[str]
+) -> Tuple[List[SelectedContent], List[ContextualSentence]]:
+    """Vote on a batch of sentences with COMPLETIONS batched attempts.
+
+    Returns:
+        (selected contents, sentences that need individual voting because
+        some attempt did not cover them)
+    """
+    attempts = await asyncio.gather(
+        *[
+            _single_batch_selection_attempt(batch, llm, sentences)
+            for _ in range(COMPLETIONS)
+        ]
+    )
+
+    selected = []
+    fallback = []
+    for item in batch:
+        votes = [attempt.get(item.original_index) for attempt in attempts]
+        if any(vote is None for vote in votes):
+            fallback.append(item)
+            continue
+
+        successes = [processed for success, processed in votes if success]
+        if len(successes) >= MIN_SUCCESSES and successes[0]:
+            selected.append(_create_selected_content(successes[0], item))
+        else:
+            logger.info(
+                f"Not enough successes ({len(successes)}/{MIN_SUCCESSES}) "
+                f"for sentence: '{item.original_sentence}'"
+            )
+
+    return selected, fallback
+
+
+async def _select_batched(
+    contextual_sentences: List[ContextualSentence],
+    llm,
+    sentences: List[str],
+    failed_calls: Optional[Set[int]] = None,
+) -> List[SelectedContent]:
+    """Run voted selection over packed batches of neighbouring sentences.
+
+    Args:
+        contextual_sentences: Sentences to select from
+        llm: LLM instance
+        sentences: The document's sentences the context windows point into
+        failed_calls: Collects the indices of sentences whose individual LLM
+            call failed
+
+    Returns:
+        Selected contents in document order
+    """
+    batches = pack_batches(
+        contextual_sentences,
+        lambda item: estimate_token_count(item.original_sentence),
+        BATCH_SIZE,
+        BATCH_TOKEN_BUDGET,
+    )
+    logger.info(
+        f"Selecting from {len(contextual_sentences)} sentences in "
+        f"{len(batches)} batches"
+    )
+
+    semaphore = asyncio.Semaphore(max(1, MAX_CONCURRENCY))
+
+    async def run(batch: List[ContextualSentence]):
+        async with semaphore:
+            return await _select_batch(batch, llm, sentences)
+
+    batch_results = await asyncio.gather(*[run(batch) for batch in batches])
+    selected = [content for contents, _ in batch_results for content in contents]
+    fallback = [item for _, items in batch_results for item in items]
+
+    if fallback:
+        logger.warning(
+            f"Batch selection missed {len(fallback)} sentences, "
+            f"voting on them individually"
+        )
+        selected += await process_with_voting(
+            items=fallback,
+            processor=partial(
+                _single_selection_attempt,
+                sentences=sentences,
+                failed_calls=failed_calls,
+            ),
+            llm=llm,
+            completions=COMPLETIONS,
+            min_successes=MIN_SUCCESSES,
+            max_concurrency=MAX_CONCURRENCY,
+            early_stop=EARLY_STOP,
+            result_factory=_create_selected_content,
+            description="sentence",
+        )
+
+    return sorted(
+        selected, key=lambda item: item.original_context_item.original_index
+    )
+
+
+async def _prefilter_sentences(
+    contextual_sentences: List[ContextualSentence],
+) -> Tuple[List[SelectedContent], List[ContextualSentence]]:
+    """Settle clear-cut sentences locally before LLM selection.
+
+    Args:
+        contextual_sentences: Sentences to select from
+
+    Returns:
+        (sentences selected without the LLM, sentences still needing the LLM)
+    """
+    prefilter = get_prefilter()
+    if prefilter is None:
+        return [], contextual_sentences
+
+    try:
+        decisions = await asyncio.to_thread(
+            classify_sentences,
+            prefilter,
+            [item.original_sentence for item in contextual_sentences],
+            PREFILTER_CONFIG["threshold"],
+        )
+    except Exception as e:
+        logger.error(f"Pre-filter failed, sending all sentences to the LLM: {e}")
+        return [], contextual_sentences
+
+    preselected = []
+    uncertain = []
+    for item, decision in zip(contextual_sentences, decisions):
+        if decision == PrefilterDecision.VERIFIABLE:
+            preselected.append(_create_selected_content(item.original_sentence, item))
+        elif decision == PrefilterDecision.UNCERTAIN:
+            uncertain.append(item)
+
+    logger.info(
+        f"Pre-filter: {len(preselected)} verifiable, "
+        f"{len(contextual_sentences) - len(preselected) - len(uncertain)} "
+        f"non-verifiable, {len(uncertain)} sent to LLM selection"
+    )
+    return preselected, uncertain
+
+
 async def selection_node(state: State) -> Dict[str, List[SelectedContent]]:
     """Filter sentences that contain verifiable claims.
 
@@ -124,18 +359,52 @@ async def selection_node(state: State) -> Dict[str, List[SelectedContent]]:
         logger.warning("No sentences to process")
         return {}
 
+    # Settle obvious cases locally; only uncertain sentences get voted on
+    preselected, uncertain = await _prefilter_sentences(contextual_sentences)
+
     # Get LLM with temperature 0.2 since we're using multiple completions
     llm = get_llm(completions=COMPLETIONS)
+    failed_calls: Set[int] = set()
 
-    # Process all sentences with voting
-    selected_contents = await process_with_voting(
-        items=contextual_sentences,
-        processor=_single_selection_attempt,
-        llm=llm,
-        completions=COMPLETIONS,
-        min_successes=MIN_SUCCESSES,
-        result_factory=_create_selected_content,
-        description="sentence",
+    # Process remaining sentences with voting, several per call if configured
+    if BATCH_SIZE > 1:
+        voted_contents = await _select_batched(
+            uncertain, llm, state.sentences, failed_calls
+        )
+    else:
+        voted_contents = await process_with_voting(
+            items=uncertain,
+            processor=partial(
+                _single_selection_attempt,
+                sentences=state.sentences,
+                failed_calls=failed_calls,
+            ),
+            llm=llm,
+            completions=COMPLETIONS,
+            min_successes=MIN_SUCCESSES,
+            max_concurrency=MAX_CONCURRENCY,
+            early_stop=EARLY_STOP,
+            result_factory=_create_selected_content,
+            description="sentence",
+        )
+
+    # Record LLM outcomes so the pre-filter can be (re)trained on them. A
+    # rejection caused by failed LLM calls says nothing about the sentence.
+    voted_indices = {
+        item.original_context_item.original_index for item in voted_contents
+    }
+    log_selection_decisions(
+        [
+            (item.original_sentence, item.original_index in voted_indices)
+            for item in uncertain
+            if item.original_index in voted_indices
+            or item.original_index not in failed_calls
+        ]
+    )
+
+    selected_contents = sorted(
+        preselected + voted_contents,
+        key=lambda item: item.original_context_item.original_index,
     )
 
     if not selected_contents:
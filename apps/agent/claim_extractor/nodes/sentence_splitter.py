@@ -4,7 +4,7 @@ Chunks input text into sentences and builds context windows for each one.
 """
 
 import logging
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import nltk
 
@@ -38,7 +38,7 @@ async def _sentence_splitter_and_context_creator(
     f_sentences: int = 1,
     include_metadata: bool = False,
     metadata: Optional[str] = None,
-) -> List[ContextualSentence]:
+) -> Tuple[List[str], List[ContextualSentence]]:
     """Split text into sentences and add context windows.
 
     Args:
@@ -49,7 +49,7 @@ async def _sentence_splitter_and_context_creator(
         metadata: Source metadata
 
     Returns:
-        List of sentences with context
+        The document's sentences and the per-sentence context windows
     """
     logger.info("Stage 1: Sentence Splitting and Context Creation")
 
@@ -86,37 +86,15 @@ async def _sentence_splitter_and_context_creator(
     contextual_sentences: List[ContextualSentence] = []
 
     for i, sentence in enumerate(merged_sentences):
-        context_parts: List[str] = []
-
-        # Add metadata if available
-        if include_metadata and metadata:
-            context_parts.append(f"[Document Metadata: {metadata}]")
-
-        # Add preceding sentences
-        start_index = max(0, i - p_sentences)
-        if start_index < i:
-            context_parts.append("\n[Preceding Sentences:]")
-            for j in range(start_index, i):
-                context_parts.append(merged_sentences[j])
-
-        # Add the sentence itself
-        context_parts.append(f"\n[Sentence of Interest for current task:]\n{sentence}")
-
-        # Add following sentences
-        end_index = min(len(merged_sentences), i + 1 + f_sentences)
-        if (i + 1) < end_index:
-            context_parts.append("\n[Following Sentences:]")
-            for j in range(i + 1, end_index):
-                context_parts.append(merged_sentences[j])
-
-        # Package it up
-        full_context_str = "\n".join(context_parts)
+        # Store the window as indices into merged_sentences; the context
+        # text is rendered only when a prompt needs it
         contextual_sentences.append(
             ContextualSentence(
                 original_sentence=sentence,
-                context_for_llm=full_context_str,
-                metadata=metadata,
+                metadata=metadata if include_metadata else None,
                 original_index=i,
+                context_start=max(0, i - p_sentences),
+                context_end=min(len(merged_sentences), i + 1 + f_sentences),
             )
         )
 
@@ -125,17 +103,17 @@ async def _sentence_splitter_and_context_creator(
         logger.debug(f"Context created for: '{sentence_preview}'")
 
     logger.info(f"Processed {len(contextual_sentences)} sentences with context")
-    return contextual_sentences
+    return merged_sentences, contextual_sentences
 
 
-async def sentence_splitter_node(state: State) -> Dict[str, List[ContextualSentence]]:
+async def sentence_splitter_node(state: State) -> Dict[str, List[Any]]:
     """Split text into sentences and create context windows.
 
     Args:
         state: Current workflow state
 
     Returns:
-        Dictionary with contextual_sentences key
+        Dictionary with sentences and contextual_sentences keys
     """
     # Get what we need from state
     answer_text = state.answer_text
@@ -146,8 +124,8 @@ async def sentence_splitter_node(state: State) -> Dict[str, List[ContextualSente
     f_sentences = CONTEXT_WINDOWS["selection"]["following_sentences"]
 
     # Process the text
-    contextual_sentences = await _sentence_splitter_and_context_creator(
+    sentences, contextual_sentences = await _sentence_splitter_and_context_creator(
         answer_text, p_sentences, f_sentences, bool(metadata), metadata
     )
 
-    return {"contextual_sentences": contextual_sentences}
+    return {"sentences": sentences, "contextual_sentences": contextual_sentences}
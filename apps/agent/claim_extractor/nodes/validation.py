@@ -5,15 +5,28 @@ Makes sure claims are complete declarative sentences ready for fact-checking.
 
 import asyncio
 import logging
-from typing import Dict, Sequence
+from collections import Counter
+from typing import Dict, List, Optional, Sequence
 
 from pydantic import BaseModel, Field
-from claim_extractor.prompts import VALIDATION_HUMAN_PROMPT, VALIDATION_SYSTEM_PROMPT
+from claim_extractor.config import VALIDATION_CONFIG
+from claim_extractor.dedup import deduplicate_claims
+from claim_extractor.prompts import BATCH_VALIDATION_PROMPT, VALIDATION_PROMPT
 from claim_extractor.schemas import PotentialClaim, State, ValidatedClaim
-from utils import get_llm, call_llm_with_structured_output
+from claim_extractor.validation_rules import RuleDecision, check_claim
+from utils import (
+    call_llm_with_structured_output,
+    estimate_token_count,
+    get_llm,
+    pack_batches,
+)
 
 logger = logging.getLogger(__name__)
 
+FAST_PATH = VALIDATION_CONFIG["fast_path"]
+BATCH_SIZE = VALIDATION_CONFIG["batch_size"]
+BATCH_TOKEN_BUDGET = VALIDATION_CONFIG["batch_token_budget"]
+
 
 class ValidationOutput(BaseModel):
     """Response schema for validation LLM calls."""
@@ -23,6 +36,40 @@ class ValidationOutput(BaseModel):
     )
 
 
+class BatchValidationItem(ValidationOutput):
+    """Validation result for one claim of a batch."""
+
+    index: int = Field(description="Number of the claim this result is for")
+
+
+class BatchValidationOutput(BaseModel):
+    """Response schema for batched validation LLM calls."""
+
+    results: List[BatchValidationItem] = Field(
+        default_factory=list, description="One result per numbered claim"
+    )
+
+
+def _make_validated_claim(
+    potential_claim: PotentialClaim, is_valid: bool
+) -> ValidatedClaim:
+    """Log the validation outcome and package it."""
+    log_level = logging.INFO if is_valid else logging.WARNING
+    logger.log(
+        log_level,
+        f"Claim validation {'succeeded' if is_valid else 'failed'}: '{potential_claim.claim_text}'",
+    )
+
+    return ValidatedClaim(
+        claim_text=potential_claim.claim_text,
+        is_complete_declarative=is_valid,
+        disambiguated_sentence=potential_claim.disambiguated_sentence,
+        original_sentence=potential_claim.original_sentence,
+        original_index=potential_claim.original_index,
+        source_indices=[potential_claim.original_index],
+    )
+
+
 async def _validate_claim(potential_claim: PotentialClaim) -> ValidatedClaim:
     """Check if a claim is a properly formed complete sentence.
 
@@ -34,10 +81,7 @@ async def _validate_claim(potential_claim: PotentialClaim) -> ValidatedClaim:
     """
     logger.debug(f"Validating claim: '{potential_claim.claim_text}'")
 
-    messages = [
-        ("system", VALIDATION_SYSTEM_PROMPT),
-        ("human", VALIDATION_HUMAN_PROMPT.format(claim=potential_claim.claim_text)),
-    ]
+    messages = VALIDATION_PROMPT.invoke({"claim": potential_claim.claim_text})
 
     # Use zero-temp LLM for consistent results
     llm = get_llm()  # Uses default temperature for consistent results
@@ -48,50 +92,170 @@ async def _validate_claim(potential_claim: PotentialClaim) -> ValidatedClaim:
         output_class=ValidationOutput,
         messages=messages,
         context_desc=f"validation of claim '{potential_claim.claim_text}'",
+        use_cache=True,
     )
 
     # Check if valid
-    is_valid = False
-    if response and response.is_complete_declarative:
-        is_valid = True
+    is_valid = bool(response and response.is_complete_declarative)
 
-    log_level = logging.INFO if is_valid else logging.WARNING
-    logger.log(
-        log_level,
-        f"Claim validation {'succeeded' if is_valid else 'failed'}: '{potential_claim.claim_text}'",
+    return _make_validated_claim(potential_claim, is_valid)
+
+
+async def _validate_claim_batch(
+    potential_claims: List[PotentialClaim],
+) -> List[ValidatedClaim]:
+    """Validate several claims with one LLM call.
+
+    Claims missing from a malformed or partial response are validated
+    individually instead.
+
+    Args:
+        potential_claims: Claims to validate
+
+    Returns:
+        Validation results in the same order
+    """
+    if len(potential_claims) == 1:
+        return [await _validate_claim(potential_claims[0])]
+
+    claims_text = "\n".join(
+        f"[{i}] {claim.claim_text}" for i, claim in enumerate(potential_claims)
     )
+    messages = BATCH_VALIDATION_PROMPT.invoke({"claims": claims_text})
 
-    # Return result
-    return ValidatedClaim(
-        claim_text=potential_claim.claim_text,
-        is_complete_declarative=is_valid,
-        disambiguated_sentence=potential_claim.disambiguated_sentence,
-        original_sentence=potential_claim.original_sentence,
-        original_index=potential_claim.original_index,
+    response = await call_llm_with_structured_output(
+        llm=get_llm(),
+        output_class=BatchValidationOutput,
+        messages=messages,
+        context_desc=f"batch validation of {len(potential_claims)} claims",
+        use_cache=True,
     )
 
+    verdicts: Dict[int, bool] = {}
+    if response:
+        for result in response.results:
+            if 0 <= result.index < len(potential_claims):
+                verdicts.setdefault(result.index, result.is_complete_declarative)
+
+    missing = [i for i in range(len(potential_claims)) if i not in verdicts]
+    if missing:
+        logger.warning(
+            f"Batch validation returned no result for {len(missing)} of "
+            f"{len(potential_claims)} claims, validating them individually"
+        )
+
+    fallback_results = await asyncio.gather(
+        *[_validate_claim(potential_claims[i]) for i in missing]
+    )
+    results = dict(zip(missing, fallback_results))
+
+    return [
+        results[i]
+        if i in results
+        else _make_validated_claim(claim, verdicts[i])
+        for i, claim in enumerate(potential_claims)
+    ]
 
-async def validation_node(state: State) -> Dict[str, Sequence[ValidatedClaim]]:
-    """Validate claims as complete, properly formed sentences.
+
+async def _validate_with_llm(
+    potential_claims: List[PotentialClaim],
+) -> List[ValidatedClaim]:
+    """Validate claims with the LLM in parallel, batching them when configured.
 
     Args:
-        state: Current workflow state
+        potential_claims: Claims to validate
 
     Returns:
-        Dictionary with validated_claims key
+        Validation results in the same order
     """
-    potential_claims = state.potential_claims or []
+    if BATCH_SIZE <= 1:
+        return await asyncio.gather(
+            *[_validate_claim(claim) for claim in potential_claims]
+        )
 
-    if not potential_claims:
-        logger.warning("No claims to validate")
-        return {}
+    batches = pack_batches(
+        potential_claims,
+        lambda claim: estimate_token_count(claim.claim_text),
+        BATCH_SIZE,
+        BATCH_TOKEN_BUDGET,
+    )
+    logger.info(f"Validating {len(potential_claims)} claims in {len(batches)} batches")
 
-    # Validate all claims in parallel
-    validation_results = await asyncio.gather(
-        *[_validate_claim(claim) for claim in potential_claims]
+    batch_results = await asyncio.gather(
+        *[_validate_claim_batch(batch) for batch in batches]
+    )
+    return [result for batch in batch_results for result in batch]
+
+
+async def _validate_claims(
+    potential_claims: List[PotentialClaim], paths: Optional[Counter] = None
+) -> List[ValidatedClaim]:
+    """Validate claims, settling clear-cut ones with local rules.
+
+    Args:
+        potential_claims: Claims to validate
+        paths: Optional counter of how many claims took each path
+
+    Returns:
+        Validation results in the same order
+    """
+    if FAST_PATH:
+        decisions = [check_claim(claim.claim_text) for claim in potential_claims]
+    else:
+        decisions = [(RuleDecision.UNCERTAIN, "fast path disabled")] * len(
+            potential_claims
+        )
+
+    escalated = [
+        claim
+        for claim, (decision, _) in zip(potential_claims, decisions)
+        if decision == RuleDecision.UNCERTAIN
+    ]
+    llm_results = iter(await _validate_with_llm(escalated) if escalated else [])
+
+    results = []
+    for claim, (decision, reason) in zip(potential_claims, decisions):
+        if decision == RuleDecision.UNCERTAIN:
+            results.append(next(llm_results))
+            path = "llm"
+        else:
+            logger.debug(f"Fast-path validation ({reason}): '{claim.claim_text}'")
+            results.append(_make_validated_claim(claim, decision == RuleDecision.VALID))
+            path = f"fast_{decision.value}"
+        if paths is not None:
+            paths[path] += 1
+
+    return results
+
+
+def _log_validation_paths(paths: Counter) -> None:
+    """Log what fraction of claims each validation path decided."""
+    total = sum(paths.values())
+    if not total:
+        return
+
+    summary = ", ".join(
+        f"{paths[path]} {label} ({paths[path] / total:.0%})"
+        for path, label in [
+            ("fast_valid", "passed by rules"),
+            ("fast_invalid", "failed by rules"),
+            ("llm", "sent to the LLM"),
+        ]
     )
+    logger.info(f"Validation paths for {total} claims: {summary}")
+
 
-    # Filter out invalid and duplicate claims
+def _select_valid_claims(
+    validation_results: Sequence[ValidatedClaim],
+) -> List[ValidatedClaim]:
+    """Filter out invalid and duplicate claims, keeping the first occurrence.
+
+    Args:
+        validation_results: Validation results in claim order
+
+    Returns:
+        Valid, unique claims in the same order
+    """
     validated_claims = []
     seen_claims = set()
 
@@ -111,5 +275,33 @@ async def validation_node(state: State) -> Dict[str, Sequence[ValidatedClaim]]:
             )
             logger.info(f"Discarded claim ({reason}): '{validated.claim_text}'")
 
+    return validated_claims
+
+
+async def validation_node(state: State) -> Dict[str, Sequence[ValidatedClaim]]:
+    """Validate claims as complete, properly formed sentences.
+
+    Args:
+        state: Current workflow state
+
+    Returns:
+        Dictionary with validated_claims key
+    """
+    potential_claims = state.potential_claims or []
+
+    if not potential_claims:
+        logger.warning("No claims to validate")
+        return {}
+
+    # Validate all claims in parallel
+    paths: Counter = Counter()
+    validation_results = await _validate_claims(potential_claims, paths)
+    _log_validation_paths(paths)
+
+    validated_claims = _select_valid_claims(validation_results)
+
+    # Merge paraphrases so each is verified only once
+    validated_claims = await asyncio.to_thread(deduplicate_claims, validated_claims)
+
     logger.info(f"Validated {len(validated_claims)} of {len(potential_claims)} claims")
     return {"validated_claims": validated_claims}
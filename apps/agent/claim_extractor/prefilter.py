@@ -0,0 +1,179 @@
+"""Local sentence pre-filter for the selection stage.
+
+A cheap classifier that settles obviously (non-)verifiable sentences before
+they reach the voted LLM selection. Only uncertain sentences cost LLM calls.
+"""
+
+import json
+import logging
+import pickle
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, List, Optional, Protocol, Sequence, Tuple
+
+from utils.embeddings import DEFAULT_ENCODER, encode_texts
+
+from claim_extractor.config import PREFILTER_CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+class PrefilterDecision(str, Enum):
+    """What the pre-filter concluded about a sentence."""
+
+    NON_VERIFIABLE = "non_verifiable"
+    VERIFIABLE = "verifiable"
+    UNCERTAIN = "uncertain"
+
+
+class SentenceClassifier(Protocol):
+    """Anything that can score sentences for verifiability."""
+
+    def predict_verifiable_proba(self, sentences: Sequence[str]) -> List[float]:
+        """Probability that each sentence contains a verifiable proposition."""
+        ...
+
+
+class EmbeddingPrefilter:
+    """Sentence-embedding + logistic-regression verifiability classifier.
+
+    Embeddings come from sentence-transformers; the classifier is a
+    scikit-learn logistic regression, calibrated when there is enough data.
+    """
+
+    def __init__(self, encoder_name: str = DEFAULT_ENCODER, estimator: Any = None):
+        self.encoder_name = encoder_name
+        self.estimator = estimator
+
+    def _encode(self, sentences: Sequence[str]) -> Any:
+        return encode_texts(sentences, self.encoder_name)
+
+    def fit(
+        self, sentences: Sequence[str], labels: Sequence[bool]
+    ) -> "EmbeddingPrefilter":
+        """Train on sentences labelled by the LLM selection stage.
+
+        Args:
+            sentences: Sentences seen by selection
+            labels: Whether selection kept each sentence
+
+        Returns:
+            The fitted pre-filter
+        """
+        from sklearn.calibration import CalibratedClassifierCV
+        from sklearn.linear_model import LogisticRegression
+
+        embeddings = self._encode(sentences)
+        base = LogisticRegression(max_iter=1000, class_weight="balanced")
+
+        # Calibrate probabilities when each class has enough examples
+        minority = min(sum(labels), len(labels) - sum(labels))
+        if minority >= 10:
+            self.estimator = CalibratedClassifierCV(base, cv=5, method="sigmoid")
+        else:
+            self.estimator = base
+
+        self.estimator.fit(embeddings, list(labels))
+        return self
+
+    def predict_verifiable_proba(self, sentences: Sequence[str]) -> List[float]:
+        if not sentences:
+            return []
+        if self.estimator is None:
+            raise ValueError("Pre-filter has not been trained")
+        probabilities = self.estimator.predict_proba(self._encode(sentences))
+        positive = list(self.estimator.classes_).index(True)
+        return [float(row[positive]) for row in probabilities]
+
+    def save(self, path: str) -> None:
+        """Persist the trained estimator (the encoder is referenced by name)."""
+        with open(path, "wb") as f:
+            pickle.dump(
+                {"encoder_name": self.encoder_name, "estimator": self.estimator}, f
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "EmbeddingPrefilter":
+        """Load a pre-filter saved with save()."""
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        return cls(encoder_name=data["encoder_name"], estimator=data["estimator"])
+
+
+def classify_sentences(
+    classifier: SentenceClassifier,
+    sentences: Sequence[str],
+    threshold: float = PREFILTER_CONFIG["threshold"],
+) -> List[PrefilterDecision]:
+    """Bucket sentences by classifier confidence.
+
+    Args:
+        classifier: Verifiability classifier
+        sentences: Sentences to classify
+        threshold: Minimum confidence to decide without the LLM
+
+    Returns:
+        A decision per sentence
+    """
+    decisions = []
+    for probability in classifier.predict_verifiable_proba(sentences):
+        if probability >= threshold:
+            decisions.append(PrefilterDecision.VERIFIABLE)
+        elif 1.0 - probability >= threshold:
+            decisions.append(PrefilterDecision.NON_VERIFIABLE)
+        else:
+            decisions.append(PrefilterDecision.UNCERTAIN)
+    return decisions
+
+
+@lru_cache(maxsize=1)
+def get_prefilter() -> Optional[SentenceClassifier]:
+    """Load the configured pre-filter, or None when disabled or unavailable."""
+    if not PREFILTER_CONFIG["enabled"]:
+        return None
+
+    model_path = PREFILTER_CONFIG["model_path"]
+    if not model_path or not Path(model_path).exists():
+        logger.warning(f"Pre-filter enabled but no model found at '{model_path}'")
+        return None
+
+    try:
+        return EmbeddingPrefilter.load(model_path)
+    except Exception as e:
+        logger.error(f"Failed to load pre-filter from '{model_path}': {e}")
+        return None
+
+
+def log_selection_decisions(decisions: Sequence[Tuple[str, bool]]) -> None:
+    """Append LLM selection outcomes to the training log, if configured.
+
+    Args:
+        decisions: (sentence, was selected) pairs
+    """
+    log_path = PREFILTER_CONFIG["decision_log_path"]
+    if not log_path or not decisions:
+        return
+
+    try:
+        with open(log_path, "a", encoding="utf-8") as f:
+            for sentence, selected in decisions:
+                entry = {"sentence": sentence, "selected": selected}
+                f.write(json.dumps(entry) + "\n")
+    except OSError as e:
+        logger.warning(f"Could not write selection decisions to '{log_path}': {e}")
+
+
+def load_selection_log(log_path: str) -> Tuple[List[str], List[bool]]:
+    """Read a selection decision log written by log_selection_decisions.
+
+    Later entries win when the same sentence was logged more than once.
+    """
+    labels = {}
+    with open(log_path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                labels[entry["sentence"]] = bool(entry["selected"])
+
+    return list(labels), list(labels.values())
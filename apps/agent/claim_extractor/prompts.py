@@ -1,3 +1,5 @@
+from langchain_core.prompts import ChatPromptTemplate
+
 ### HUMAN PROMPTS ###
 
 HUMAN_PROMPT = """
@@ -12,6 +14,18 @@ Claim:
 {claim}
 """
 
+BATCH_SELECTION_HUMAN_PROMPT = """
+    Excerpt:
+    {excerpt}
+    Sentences of interest:
+    {sentence_indices}
+"""
+
+BATCH_VALIDATION_HUMAN_PROMPT = """
+Claims:
+{claims}
+"""
+
 ### SYSTEM PROMPTS ###
 
 SELECTION_SYSTEM_PROMPT = """
@@ -198,3 +212,41 @@ Claim: Sourcing materials from sustainable suppliers
 C = Sourcing materials from sustainable suppliers
 In isolation, is C a complete, declarative sentence? It's missing a subject and a verb, so C is not a complete, declarative sentence.
 """
+
+BATCH_INSTRUCTIONS = """
+## Batch mode
+You will be given several numbered items instead of one. Apply the task above to each item independently, exactly as if it were the only item. Return exactly one entry in "results" for every item, with "index" set to the item's number.
+"""
+
+### COMPILED TEMPLATES ###
+# Parsed once at import time and reused for every request
+
+SELECTION_PROMPT = ChatPromptTemplate.from_messages(
+    [("system", SELECTION_SYSTEM_PROMPT), ("human", HUMAN_PROMPT)]
+)
+
+DISAMBIGUATION_PROMPT = ChatPromptTemplate.from_messages(
+    [("system", DISAMBIGUATION_SYSTEM_PROMPT), ("human", HUMAN_PROMPT)]
+)
+
+DECOMPOSITION_PROMPT = ChatPromptTemplate.from_messages(
+    [("system", DECOMPOSITION_SYSTEM_PROMPT), ("human", HUMAN_PROMPT)]
+)
+
+VALIDATION_PROMPT = ChatPromptTemplate.from_messages(
+    [("system", VALIDATION_SYSTEM_PROMPT), ("human", VALIDATION_HUMAN_PROMPT)]
+)
+
+BATCH_SELECTION_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        ("system", SELECTION_SYSTEM_PROMPT + BATCH_INSTRUCTIONS),
+        ("human", BATCH_SELECTION_HUMAN_PROMPT),
+    ]
+)
+
+BATCH_VALIDATION_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        ("system", VALIDATION_SYSTEM_PROMPT + BATCH_INSTRUCTIONS),
+        ("human", BATCH_VALIDATION_HUMAN_PROMPT),
+    ]
+)
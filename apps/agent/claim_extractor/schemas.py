@@ -10,18 +10,68 @@ from pydantic import BaseModel, Field
 
 
 class ContextualSentence(BaseModel):
-    """A sentence with its surrounding context."""
+    """A sentence with its surrounding context.
+
+    The context is stored as a window of indices into the document's shared
+    sentence list (State.sentences) and only rendered when a prompt is built.
+    """
 
     original_sentence: str = Field(description="The raw sentence from the source text")
-    context_for_llm: str = Field(
-        description="Full context for the LLM including surrounding sentences and metadata"
-    )
     metadata: Optional[str] = Field(
         default=None, description="Additional metadata about the source"
     )
     original_index: int = Field(
         description="Index of the sentence in the original text"
     )
+    context_start: int = Field(
+        description="Index of the first sentence in the context window"
+    )
+    context_end: int = Field(
+        description="Index one past the last sentence in the context window"
+    )
+
+    def render_context(
+        self,
+        sentences: List[str],
+        preceding_sentences: Optional[int] = None,
+        following_sentences: Optional[int] = None,
+    ) -> str:
+        """Build the context string for the LLM.
+
+        Args:
+            sentences: The document's sentence list
+            preceding_sentences: Narrow the window to this many preceding sentences
+            following_sentences: Narrow the window to this many following sentences
+
+        Returns:
+            Context with metadata, preceding, current and following sentences
+        """
+        index = self.original_index
+        start = self.context_start
+        end = self.context_end
+        if preceding_sentences is not None:
+            start = max(start, index - preceding_sentences)
+        if following_sentences is not None:
+            end = min(end, index + 1 + following_sentences)
+
+        context_parts: List[str] = []
+
+        if self.metadata:
+            context_parts.append(f"[Document Metadata: {self.metadata}]")
+
+        if start < index:
+            context_parts.append("\n[Preceding Sentences:]")
+            context_parts.extend(sentences[start:index])
+
+        context_parts.append(
+            f"\n[Sentence of Interest for current task:]\n{self.original_sentence}"
+        )
+
+        if index + 1 < end:
+            context_parts.append("\n[Following Sentences:]")
+            context_parts.extend(sentences[index + 1 : end])
+
+        return "\n".join(context_parts)
 
 
 class SelectedContent(BaseModel):
@@ -77,12 +127,21 @@ class ValidatedClaim(BaseModel):
     original_index: int = Field(
         description="Index of the original sentence in the answer text"
     )
+    source_indices: List[int] = Field(
+        default_factory=list,
+        description="Indices of every sentence this claim stands for, including "
+        "sentences whose paraphrased claims were merged into it",
+    )
 
 
 class State(BaseModel):
     """The workflow graph state object."""
 
     answer_text: str = Field(description="The answer text being analyzed")
+    sentences: List[str] = Field(
+        default_factory=list,
+        description="All sentences of the document, shared by every context window",
+    )
     contextual_sentences: List[ContextualSentence] = Field(
         default_factory=list, description="Sentences with their surrounding context"
     )
@@ -0,0 +1,172 @@
+"""Rule-based fast path for claim validation.
+
+Decides claims that are obviously (not) complete declarative sentences from
+their surface structure, so only ambiguous ones need an LLM call.
+"""
+
+import re
+from enum import Enum
+from typing import Tuple
+
+from claim_extractor.config import VALIDATION_CONFIG
+
+
+class RuleDecision(str, Enum):
+    """Outcome of the rule-based validator."""
+
+    VALID = "valid"
+    INVALID = "invalid"
+    UNCERTAIN = "uncertain"
+
+
+_WORD_PATTERN = re.compile(r"[A-Za-z0-9][\w'’%$.,-]*")
+_CLAUSE_COMMA_PATTERN = re.compile(r",(?!\d)")
+
+_INTERROGATIVES = set("who whom whose what which when where why how".split())
+
+# Finite auxiliaries and copulas; any of these makes a main verb very likely
+_FINITE_VERBS = set(
+    "is are was were am has have had does do did will would can could may might "
+    "must shall should isn't aren't wasn't weren't hasn't haven't hadn't "
+    "doesn't don't didn't won't can't cannot".split()
+)
+
+# Verbs that open imperatives but are rarely the subject of a claim
+_IMPERATIVE_OPENERS = set(
+    "please let consider ensure remember imagine note check see try avoid "
+    "make never don't".split()
+)
+
+# Words opening a relative or complement clause inside a noun phrase
+_RELATIVE_MARKERS = set("who whom whose which that where".split())
+
+_PRONOUNS = set("he she it they we i you".split())
+
+_SUBORDINATORS = set(
+    "because although though while if unless whereas whether since after "
+    "before until which that".split()
+)
+
+# A claim ending in one of these was cut off mid-sentence
+_DANGLING_WORDS = set(
+    "and or but of the a an to with for by in on at from that which "
+    "because".split()
+)
+
+_DETERMINERS = set(
+    "the a an this that these those its his her their our several many "
+    "some no".split()
+)
+
+
+def _words(text: str) -> list:
+    return [word.rstrip(".,;:!") for word in _WORD_PATTERN.findall(text)]
+
+
+def _main_clause(words: list) -> list:
+    """Words before the first relative clause ("The man who was elected")."""
+    for i in range(1, len(words)):
+        if words[i].lower() in _RELATIVE_MARKERS:
+            return words[:i]
+    return words
+
+
+def _is_subject_end(word: str) -> bool:
+    """Whether a word can end the subject right before an inflected verb."""
+    lowered = word.lower()
+    if lowered in _PRONOUNS or word[:1].isdigit():
+        return True
+    return word[:1].isupper() and lowered not in _DETERMINERS
+
+
+def _has_main_verb(words: list) -> bool:
+    """Whether the main clause has a subject, then a finite verb, then more.
+
+    Inflected lexical verbs only count where the position rules out a noun or
+    participle: before a determiner ("The company acquired a startup") or
+    right after a proper noun, pronoun or number ("Tesla produces cars",
+    "Apollo 11 landed humans"), but not "The proposed law".
+    """
+    clause = _main_clause(words)
+    lowered = [word.lower() for word in clause]
+
+    # The verb needs a subject before it and something after it ("He is")
+    for i in range(1, len(clause) - 1):
+        word = lowered[i]
+        if word in _FINITE_VERBS:
+            return True
+        if not clause[i].islower() or len(word) < 4:
+            continue
+        is_past = word.endswith("ed")
+        if not (is_past or (word.endswith("s") and not word.endswith("ss"))):
+            continue
+        if lowered[i + 1] in _DETERMINERS or _is_subject_end(clause[i - 1]):
+            return True
+    return False
+
+
+def _brackets_balanced(text: str) -> bool:
+    return all(text.count(left) == text.count(right) for left, right in ("()", "[]"))
+
+
+def check_claim(
+    claim_text: str,
+    max_words: int = VALIDATION_CONFIG["fast_path_max_words"],
+) -> Tuple[RuleDecision, str]:
+    """Decide from surface structure whether a claim is a declarative sentence.
+
+    Decomposition emits claims with bracketed clarifications and often without
+    a final period, so neither counts against a claim.
+
+    Args:
+        claim_text: Claim to check
+        max_words: Longer claims are left to the LLM
+
+    Returns:
+        (decision, reason)
+    """
+    text = claim_text.strip().strip("\"'“”")
+    if not any(char.isalpha() for char in text):
+        return RuleDecision.INVALID, "no words"
+
+    unbracketed = text.replace("[", " ").replace("]", " ")
+    words = _words(unbracketed)
+    if len(words) < 2:
+        return RuleDecision.INVALID, "single word"
+
+    first = words[0].lower()
+    last = words[-1].lower()
+
+    if text.endswith("?"):
+        return RuleDecision.INVALID, "question"
+    if first in _INTERROGATIVES and words[1].lower() in _FINITE_VERBS:
+        return RuleDecision.INVALID, "question without question mark"
+    if first in _INTERROGATIVES:
+        return RuleDecision.UNCERTAIN, "possible question"
+    if first in _IMPERATIVE_OPENERS and words[1].lower() not in _FINITE_VERBS:
+        return RuleDecision.INVALID, "imperative"
+    if text.endswith((":", ",", ";", "-")) or (
+        last in _DANGLING_WORDS and not text.endswith(".")
+    ):
+        return RuleDecision.INVALID, "fragment"
+
+    if len(words) > max_words:
+        return RuleDecision.UNCERTAIN, "long claim"
+    if not _brackets_balanced(text):
+        return RuleDecision.UNCERTAIN, "unbalanced brackets"
+    if not (text[0].isupper() or text[0].isdigit() or text[0] == "["):
+        return RuleDecision.UNCERTAIN, "does not start a sentence"
+    if text.endswith(("!", "...", "…")):
+        return RuleDecision.UNCERTAIN, "unusual ending"
+    if first in _SUBORDINATORS:
+        # The opening clause's verb is not the main verb; look past its comma
+        # (not a digit separator as in "1,000")
+        clauses = _CLAUSE_COMMA_PATTERN.split(unbracketed, maxsplit=1)
+        if len(clauses) < 2:
+            return RuleDecision.UNCERTAIN, "possible subordinate clause"
+        if not _has_main_verb(_words(clauses[1])):
+            return RuleDecision.UNCERTAIN, "no main-clause verb after subordinate"
+    elif not _has_main_verb(words):
+        return RuleDecision.UNCERTAIN, "no main-clause verb found"
+
+    return RuleDecision.VALID, "declarative structure"
@@ -3,7 +3,8 @@
 A pipeline for evaluating the accuracy of factual claims using web searches.
 """
 
-from claim_verifier.agent import create_graph, graph
+from claim_verifier.agent import create_graph, evidence_graph, graph
+from claim_verifier.nodes import evaluate_claims
 from claim_verifier.schemas import (
     Evidence,
     Verdict,
@@ -16,6 +17,8 @@ __all__ = [
     # Main functionality
     "create_graph",
     "graph",
+    "evidence_graph",
+    "evaluate_claims",
     # Data models
     "ClaimVerifierState",
     "Evidence",
@@ -5,12 +5,14 @@ from langgraph.graph import END, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
 from claim_verifier.nodes import (
+    STRUCTURED_OUTPUTS,
     evaluate_evidence_node,
     generate_search_query_node,
     retrieve_evidence_node,
     search_decision_node,
 )
 from claim_verifier.schemas import ClaimVerifierState
+from utils import precompile_structured_outputs, track_run_slot
 
 load_dotenv()
 
@@ -20,7 +22,11 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def create_graph() -> CompiledStateGraph:
+def _skip_evaluation(state: ClaimVerifierState) -> dict:
+    return {}
+
+
+def create_graph(evaluate: bool = True) -> CompiledStateGraph:
     """Set up the iterative claim verification workflow.
 
     The pipeline follows these steps:
@@ -28,13 +34,23 @@ def create_graph() -> CompiledStateGraph:
     2. Retrieve evidence from web search
     3. Decide whether to continue searching or evaluate
     4. Either generate new query or make final evaluation
+
+    Args:
+        evaluate: Make the final evaluation; without it the graph only
+            gathers evidence (for callers that evaluate several claims at once)
     """
+    # Bind output schemas once instead of on every LLM call
+    precompile_structured_outputs(STRUCTURED_OUTPUTS)
+
     workflow = StateGraph(ClaimVerifierState)
 
     workflow.add_node("generate_search_query", generate_search_query_node)
     workflow.add_node("retrieve_evidence", retrieve_evidence_node)
     workflow.add_node("search_decision", search_decision_node)
-    workflow.add_node("evaluate_evidence", evaluate_evidence_node)
+    # search_decision routes to "evaluate_evidence" either way
+    workflow.add_node(
+        "evaluate_evidence", evaluate_evidence_node if evaluate else _skip_evaluation
+    )
 
     workflow.set_entry_point("generate_search_query")
 
@@ -46,4 +62,6 @@ def create_graph() -> CompiledStateGraph:
     return workflow.compile()
 
 
-graph = create_graph()
+# Runs started through the server hold their API key's concurrency slot
+graph = track_run_slot(create_graph())
+evidence_graph = create_graph(evaluate=False)
@@ -7,7 +7,9 @@ from claim_verifier.config.nodes import (
     QUERY_GENERATION_CONFIG,
     EVIDENCE_RETRIEVAL_CONFIG,
     EVIDENCE_EVALUATION_CONFIG,
+    EVIDENCE_MANAGEMENT_CONFIG,
     ITERATIVE_SEARCH_CONFIG,
+    SUFFICIENCY_CONFIG,
 )
 
 __all__ = [
@@ -15,5 +17,7 @@ __all__ = [
     "QUERY_GENERATION_CONFIG",
     "EVIDENCE_RETRIEVAL_CONFIG",
     "EVIDENCE_EVALUATION_CONFIG",
+    "EVIDENCE_MANAGEMENT_CONFIG",
     "ITERATIVE_SEARCH_CONFIG",
+    "SUFFICIENCY_CONFIG",
 ]
@@ -6,17 +6,52 @@ Contains settings for the claim verification pipeline nodes.
 # Node settings
 QUERY_GENERATION_CONFIG = {
     "temperature": 0.0,  # Zero temp for consistent results
+    # Diverse queries generated and searched in parallel per iteration;
+    # 1 keeps the one-query-per-iteration loop
+    "queries_per_iteration": 1,
 }
 
 EVIDENCE_RETRIEVAL_CONFIG = {
     "results_per_query": 3,  # Number of search results to fetch per query
     "search_provider": "exa",  # Search provider: "exa" or "tavily"
+    # Per-provider client limits
+    "providers": {
+        "exa": {"max_concurrency": 10, "timeout": 30.0},
+        "tavily": {"max_concurrency": 10, "timeout": 30.0},
+    },
+}
+
+# Dedup, rerank and token cap applied to evidence before LLM calls
+EVIDENCE_MANAGEMENT_CONFIG = {
+    "enabled": True,
+    "rerank_method": "bm25",  # "bm25" or "embedding"
+    "encoder": "all-MiniLM-L6-v2",  # sentence-transformers model for "embedding"
+    "fingerprint_max_distance": 3,  # Max SimHash bit difference for copies
+    "max_item_tokens": 2000,  # Longer snippets are truncated
+    "evaluation_token_budget": 12000,  # Evidence tokens sent to evaluation
+    "decision_token_budget": 4000,  # Evidence tokens considered by search decision
 }
 
 EVIDENCE_EVALUATION_CONFIG = {
     "temperature": 0.0,  # Zero temp for consistent results
 }
 
+# Local evidence-sufficiency estimate that can skip the search decision LLM
+SUFFICIENCY_CONFIG = {
+    "enabled": True,
+    "relevance_method": "lexical",  # "lexical" or "embedding"
+    "encoder": "all-MiniLM-L6-v2",  # sentence-transformers model for "embedding"
+    "target_evidence": 6,  # Distinct snippets for a full evidence-count score
+    "target_domains": 4,  # Distinct domains for a full diversity score
+    "relevance_floor": 0.5,  # Min claim relevance for a snippet to take a stance
+    "weights": {"count": 0.2, "diversity": 0.2, "relevance": 0.3, "agreement": 0.3},
+    "stop_threshold": 0.8,  # Score at or above: evaluate without asking the LLM
+    "continue_threshold": 0.3,  # Score at or below: search again without the LLM
+    "min_evidence_to_stop": 4,  # Never stop locally with fewer snippets
+    # Share of confident local decisions still checked against the LLM
+    "audit_sample_rate": 0.1,
+}
+
 ITERATIVE_SEARCH_CONFIG = {
     "max_iterations": 5,
 }
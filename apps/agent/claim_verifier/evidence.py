@@ -0,0 +1,225 @@
+"""Evidence management - dedup, rerank and cap evidence before LLM calls.
+
+Evidence accumulates across search iterations with repeated URLs and
+syndicated copies of the same article. This trims it to the most relevant,
+distinct snippets that fit a token budget.
+"""
+
+import hashlib
+import logging
+import math
+import re
+from collections import Counter
+from typing import List, Optional, Sequence
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from utils import estimate_token_count, truncate_to_tokens
+from utils.embeddings import encode_texts
+
+from claim_verifier.config import EVIDENCE_MANAGEMENT_CONFIG
+from claim_verifier.schemas import Evidence
+
+logger = logging.getLogger(__name__)
+
+_TRACKING_PARAMS = re.compile(r"^(utm_\w+|fbclid|gclid|mc_cid|mc_eid|ref|ref_src)$")
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def canonical_url(url: str) -> str:
+    """Normalize a URL so trivially different links to one page compare equal."""
+    if not url:
+        return ""
+
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower().removeprefix("www.")
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not _TRACKING_PARAMS.match(key)
+        )
+    )
+    return urlunsplit(("https", host, parts.path.rstrip("/"), query, ""))
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def content_fingerprint(text: str, shingle_size: int = 3) -> int:
+    """64-bit SimHash of word shingles; near-identical texts differ in few bits."""
+    tokens = _tokens(text)
+    shingles = [
+        " ".join(tokens[i : i + shingle_size])
+        for i in range(max(1, len(tokens) - shingle_size + 1))
+    ]
+
+    weights = [0] * 64
+    for shingle in shingles:
+        digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "big")
+        for bit in range(64):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def dedup_evidence(
+    evidence: Sequence[Evidence],
+    max_distance: int = EVIDENCE_MANAGEMENT_CONFIG["fingerprint_max_distance"],
+) -> List[Evidence]:
+    """Drop evidence with a repeated canonical URL or near-duplicate text.
+
+    Args:
+        evidence: Evidence in arrival order
+        max_distance: Max SimHash bit difference for texts to count as copies
+
+    Returns:
+        The first occurrence of each distinct item
+    """
+    seen_urls = set()
+    fingerprints: List[int] = []
+    unique = []
+
+    for item in evidence:
+        url = canonical_url(item.url)
+        if url and url in seen_urls:
+            continue
+
+        fingerprint = content_fingerprint(f"{item.title or ''} {item.text}")
+        if any(
+            bin(fingerprint ^ seen).count("1") <= max_distance for seen in fingerprints
+        ):
+            continue
+
+        if url:
+            seen_urls.add(url)
+        fingerprints.append(fingerprint)
+        unique.append(item)
+
+    return unique
+
+
+def _bm25_scores(
+    query: str, documents: Sequence[str], k1: float = 1.5, b: float = 0.75
+) -> List[float]:
+    """Okapi BM25 score of each document for the query."""
+    tokenized = [_tokens(document) for document in documents]
+    average_length = sum(len(tokens) for tokens in tokenized) / len(tokenized) or 1.0
+    document_frequency = Counter(
+        token for tokens in tokenized for token in set(tokens)
+    )
+
+    scores = []
+    for tokens in tokenized:
+        frequencies = Counter(tokens)
+        score = 0.0
+        for term in set(_tokens(query)):
+            if term not in frequencies:
+                continue
+            idf = math.log(
+                1
+                + (len(tokenized) - document_frequency[term] + 0.5)
+                / (document_frequency[term] + 0.5)
+            )
+            tf = frequencies[term]
+            score += idf * tf * (k1 + 1) / (
+                tf + k1 * (1 - b + b * len(tokens) / average_length)
+            )
+        scores.append(score)
+    return scores
+
+
+def _embedding_scores(query: str, documents: Sequence[str]) -> List[float]:
+    """Cosine similarity of each document to the query."""
+    embeddings = encode_texts(
+        [query, *documents], EVIDENCE_MANAGEMENT_CONFIG["encoder"]
+    )
+    return [float(score) for score in embeddings[1:] @ embeddings[0]]
+
+
+def rerank_evidence(
+    claim_text: str, evidence: Sequence[Evidence], method: Optional[str] = None
+) -> List[Evidence]:
+    """Order evidence by relevance to the claim.
+
+    Args:
+        claim_text: The claim being verified
+        evidence: Evidence to rank
+        method: "bm25" or "embedding" (defaults to the configured method);
+            embedding ranking falls back to BM25 if no encoder is available
+
+    Returns:
+        Evidence, most relevant first (ties keep arrival order)
+    """
+    if len(evidence) < 2:
+        return list(evidence)
+
+    method = method or EVIDENCE_MANAGEMENT_CONFIG["rerank_method"]
+    documents = [f"{item.title or ''} {item.text}" for item in evidence]
+
+    scores = None
+    if method == "embedding":
+        try:
+            scores = _embedding_scores(claim_text, documents)
+        except Exception as e:
+            logger.warning(f"Embedding rerank unavailable, using BM25: {e}")
+    if scores is None:
+        scores = _bm25_scores(claim_text, documents)
+
+    order = sorted(range(len(evidence)), key=lambda i: -scores[i])
+    return [evidence[i] for i in order]
+
+
+def cap_evidence(
+    evidence: Sequence[Evidence],
+    token_budget: int,
+    max_item_tokens: int = EVIDENCE_MANAGEMENT_CONFIG["max_item_tokens"],
+) -> List[Evidence]:
+    """Keep evidence, in order, while it fits the token budget.
+
+    Over-long snippets are truncated to max_item_tokens first; items that no
+    longer fit are skipped in favour of smaller ones further down. At least
+    one item is always kept.
+    """
+    capped = []
+    used = 0
+
+    for item in evidence:
+        text = truncate_to_tokens(item.text, max_item_tokens)
+        if len(text) < len(item.text):
+            item = item.model_copy(update={"text": text})
+        cost = estimate_token_count(f"{item.url} {item.title or ''} {item.text}")
+        if capped and used + cost > token_budget:
+            continue
+        capped.append(item)
+        used += cost
+
+    return capped
+
+
+def prepare_evidence(
+    claim_text: str, evidence: Sequence[Evidence], token_budget: int
+) -> List[Evidence]:
+    """Dedup, rerank and cap evidence for an LLM call.
+
+    Args:
+        claim_text: The claim being verified
+        evidence: All evidence gathered so far
+        token_budget: Token budget for the evidence
+
+    Returns:
+        The most relevant distinct evidence that fits the budget
+    """
+    if not EVIDENCE_MANAGEMENT_CONFIG["enabled"] or not evidence:
+        return list(evidence)
+
+    unique = dedup_evidence(evidence)
+    ranked = rerank_evidence(claim_text, unique)
+    capped = cap_evidence(ranked, token_budget)
+
+    logger.info(
+        f"Evidence prepared: {len(evidence)} gathered, {len(unique)} distinct, "
+        f"{len(capped)} kept within {token_budget} tokens"
+    )
+    return capped
@@ -1,13 +1,38 @@
 """Node components for the claim verification workflow."""
 
-from claim_verifier.nodes.generate_search_query import generate_search_query_node
+from claim_verifier.nodes.generate_search_query import (
+    MultiQueryGenerationOutput,
+    QueryGenerationOutput,
+    generate_search_query_node,
+)
 from claim_verifier.nodes.retrieve_evidence import retrieve_evidence_node
-from claim_verifier.nodes.evaluate_evidence import evaluate_evidence_node
-from claim_verifier.nodes.search_decision import search_decision_node
+from claim_verifier.nodes.evaluate_evidence import (
+    ClusterEvaluationOutput,
+    EvidenceEvaluationOutput,
+    evaluate_claim,
+    evaluate_claims,
+    evaluate_evidence_node,
+)
+from claim_verifier.nodes.search_decision import (
+    SearchDecisionOutput,
+    search_decision_node,
+)
+
+# (get_llm kwargs, output schema) for every structured LLM call in the graph
+STRUCTURED_OUTPUTS = [
+    ({}, QueryGenerationOutput),
+    ({}, MultiQueryGenerationOutput),
+    ({}, SearchDecisionOutput),
+    ({"model_name": "openai:gpt-4.1"}, EvidenceEvaluationOutput),
+    ({"model_name": "openai:gpt-4.1"}, ClusterEvaluationOutput),
+]
 
 __all__ = [
     "generate_search_query_node",
     "retrieve_evidence_node",
     "evaluate_evidence_node",
+    "evaluate_claim",
+    "evaluate_claims",
     "search_decision_node",
+    "STRUCTURED_OUTPUTS",
 ]
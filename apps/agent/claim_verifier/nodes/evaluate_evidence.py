@@ -3,8 +3,9 @@
 Analyzes evidence snippets to assess if a claim is supported, refuted, or inconclusive.
 """
 
+import asyncio
 import logging
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 from utils import (
@@ -13,8 +14,14 @@ from utils import (
     truncate_evidence_for_token_limit,
 )
 
+from claim_verifier.config import EVIDENCE_MANAGEMENT_CONFIG
+from claim_verifier.evidence import prepare_evidence
+from claim_extractor.schemas import ValidatedClaim
 from claim_verifier.prompts import (
+    CLUSTER_EVALUATION_HUMAN_PROMPT,
+    CLUSTER_EVALUATION_PROMPT,
     EVIDENCE_EVALUATION_HUMAN_PROMPT,
+    EVIDENCE_EVALUATION_PROMPT,
     EVIDENCE_EVALUATION_SYSTEM_PROMPT,
     get_current_timestamp,
 )
@@ -41,53 +48,142 @@ class EvidenceEvaluationOutput(BaseModel):
     )
 
 
+def _format_evidence_snippet(i: int, s: Evidence) -> str:
+    return (
+        f"Source {i + 1}: {s.url}\n"
+        + (f"Title: {s.title}\n" if s.title else "")
+        + f"Snippet: {s.text.strip()}\n---"
+    )
+
+
 def _format_evidence_snippets(snippets: List[Evidence]) -> str:
     if not snippets:
         return "No relevant evidence snippets were found."
 
     return "\n\n".join(
-        [
-            f"Source {i + 1}: {s.url}\n"
-            + (f"Title: {s.title}\n" if s.title else "")
-            + f"Snippet: {s.text.strip()}\n---"
-            for i, s in enumerate(snippets)
-        ]
+        [_format_evidence_snippet(i, s) for i, s in enumerate(snippets)]
     )
 
 
-async def evaluate_evidence_node(state: ClaimVerifierState) -> dict:
-    claim = state.claim
-    evidence_snippets = state.evidence
-    iteration_count = state.iteration_count
+class ClaimEvaluationItem(EvidenceEvaluationOutput):
+    index: int = Field(description="Number of the claim this verdict is for")
 
-    logger.info(
-        f"Final evaluation for claim '{claim.claim_text}' "
-        f"with {len(evidence_snippets)} evidence snippets "
-        f"after {iteration_count} iterations"
+
+class ClusterEvaluationOutput(BaseModel):
+    results: List[ClaimEvaluationItem] = Field(
+        description="One verdict per numbered claim, each judged independently against the shared evidence"
+    )
+
+
+def _failed_verdict(claim: ValidatedClaim) -> Verdict:
+    return Verdict(
+        claim_text=claim.claim_text,
+        disambiguated_sentence=claim.disambiguated_sentence,
+        original_sentence=claim.original_sentence,
+        original_index=claim.original_index,
+        source_indices=claim.source_indices or [claim.original_index],
+        result=VerificationResult.REFUTED,
+        reasoning="Failed to evaluate the evidence due to technical issues.",
+        sources=[],
     )
 
-    system_prompt = EVIDENCE_EVALUATION_SYSTEM_PROMPT.format(
-        current_time=get_current_timestamp()
+
+def _make_verdict(
+    claim: ValidatedClaim,
+    response: EvidenceEvaluationOutput,
+    shown_evidence: List[Evidence],
+    all_evidence: List[Evidence],
+) -> Verdict:
+    try:
+        result = VerificationResult(response.verdict)
+    except ValueError:
+        logger.warning(f"Invalid verdict '{response.verdict}', defaulting to REFUTED")
+        result = VerificationResult.REFUTED
+
+    influential_urls = (
+        {
+            shown_evidence[idx - 1].url
+            for idx in response.influential_source_indices
+            if 1 <= idx <= len(shown_evidence)
+        }
+        if response.influential_source_indices
+        else set()
     )
 
-    truncated_evidence = truncate_evidence_for_token_limit(
-        evidence_items=evidence_snippets,
+    sources = [
+        Evidence(
+            url=source.url,
+            text=source.text,
+            title=source.title,
+            is_influential=source.url in influential_urls,
+        )
+        for source in {source.url: source for source in all_evidence}.values()
+    ]
+
+    return Verdict(
         claim_text=claim.claim_text,
+        disambiguated_sentence=claim.disambiguated_sentence,
+        original_sentence=claim.original_sentence,
+        original_index=claim.original_index,
+        source_indices=claim.source_indices or [claim.original_index],
+        result=result,
+        reasoning=response.reasoning,
+        sources=sources,
+    )
+
+
+def _log_verdict(verdict: Verdict) -> None:
+    influential_count = sum(source.is_influential for source in verdict.sources)
+    logger.info(
+        f"Verdict '{verdict.result}' for '{verdict.claim_text}': {verdict.reasoning} "
+        f"({len(verdict.sources)} sources, {influential_count} influential)"
+    )
+
+
+async def _select_evidence(
+    claim_text: str, evidence: List[Evidence], system_prompt: str, human_prompt: str
+) -> List[Evidence]:
+    """Most relevant distinct evidence first, within the token budget."""
+    prepared_evidence = await asyncio.to_thread(
+        prepare_evidence,
+        claim_text,
+        evidence,
+        EVIDENCE_MANAGEMENT_CONFIG["evaluation_token_budget"],
+    )
+
+    return truncate_evidence_for_token_limit(
+        evidence_items=prepared_evidence,
+        claim_text=claim_text,
         system_prompt=system_prompt,
-        human_prompt_template=EVIDENCE_EVALUATION_HUMAN_PROMPT,
-        format_evidence_func=_format_evidence_snippets,
-    )
-
-    messages = [
-        ("system", system_prompt),
-        (
-            "human",
-            EVIDENCE_EVALUATION_HUMAN_PROMPT.format(
-                claim_text=claim.claim_text,
-                evidence_snippets=_format_evidence_snippets(truncated_evidence),
-            ),
-        ),
-    ]
+        human_prompt_template=human_prompt,
+        format_item_func=_format_evidence_snippet,
+    )
+
+
+async def evaluate_claim(claim: ValidatedClaim, evidence: List[Evidence]) -> Verdict:
+    """Judge one claim against the evidence gathered for it.
+
+    Args:
+        claim: The claim to judge
+        evidence: All evidence gathered for the claim
+
+    Returns:
+        The verdict
+    """
+    current_time = get_current_timestamp()
+    system_prompt = EVIDENCE_EVALUATION_SYSTEM_PROMPT.format(current_time=current_time)
+
+    truncated_evidence = await _select_evidence(
+        claim.claim_text, evidence, system_prompt, EVIDENCE_EVALUATION_HUMAN_PROMPT
+    )
+
+    messages = EVIDENCE_EVALUATION_PROMPT.invoke(
+        {
+            "current_time": current_time,
+            "claim_text": claim.claim_text,
+            "evidence_snippets": _format_evidence_snippets(truncated_evidence),
+        }
+    )
 
     llm = get_llm(model_name="openai:gpt-4.1")
 
@@ -100,60 +196,92 @@ async def evaluate_evidence_node(state: ClaimVerifierState) -> dict:
 
     if not response:
         logger.warning(f"Failed to evaluate evidence for claim: '{claim.claim_text}'")
-        verdict = Verdict(
-            claim_text=claim.claim_text,
-            disambiguated_sentence=claim.disambiguated_sentence,
-            original_sentence=claim.original_sentence,
-            original_index=claim.original_index,
-            result=VerificationResult.REFUTED,
-            reasoning="Failed to evaluate the evidence due to technical issues.",
-            sources=[],
-        )
+        verdict = _failed_verdict(claim)
     else:
-        try:
-            result = VerificationResult(response.verdict)
-        except ValueError:
-            logger.warning(
-                f"Invalid verdict '{response.verdict}', defaulting to REFUTED"
-            )
-            result = VerificationResult.REFUTED
-
-        influential_urls = (
-            {
-                truncated_evidence[idx - 1].url
-                for idx in response.influential_source_indices
-                if 1 <= idx <= len(truncated_evidence)
-            }
-            if response.influential_source_indices
-            else set()
-        )
+        verdict = _make_verdict(claim, response, truncated_evidence, evidence)
+
+    _log_verdict(verdict)
+    return verdict
+
+
+async def evaluate_claims(
+    claims: List[ValidatedClaim], evidence: List[Evidence]
+) -> List[Verdict]:
+    """Judge related claims against their pooled evidence in one LLM call.
+
+    The evidence is shown once for the whole group. Claims the response
+    leaves out are evaluated individually.
+
+    Args:
+        claims: Related claims
+        evidence: Evidence gathered for the group
+
+    Returns:
+        One verdict per claim, in order
+    """
+    if len(claims) == 1:
+        return [await evaluate_claim(claims[0], evidence)]
+
+    current_time = get_current_timestamp()
+    system_prompt = EVIDENCE_EVALUATION_SYSTEM_PROMPT.format(current_time=current_time)
+    numbered_claims = "\n".join(
+        f"{index}. {claim.claim_text}" for index, claim in enumerate(claims, 1)
+    )
+
+    truncated_evidence = await _select_evidence(
+        numbered_claims, evidence, system_prompt, CLUSTER_EVALUATION_HUMAN_PROMPT
+    )
+
+    messages = CLUSTER_EVALUATION_PROMPT.invoke(
+        {
+            "current_time": current_time,
+            "claim_text": numbered_claims,
+            "evidence_snippets": _format_evidence_snippets(truncated_evidence),
+        }
+    )
+
+    response = await call_llm_with_structured_output(
+        llm=get_llm(model_name="openai:gpt-4.1"),
+        output_class=ClusterEvaluationOutput,
+        messages=messages,
+        context_desc=f"evidence evaluation for {len(claims)} related claims",
+    )
+
+    if not response:
+        logger.warning(f"Failed to evaluate {len(claims)} related claims together")
 
-        sources = [
-            Evidence(
-                url=source.url,
-                text=source.text,
-                title=source.title,
-                is_influential=source.url in influential_urls,
+    verdicts: List[Optional[Verdict]] = [None] * len(claims)
+    for item in response.results if response else []:
+        if 1 <= item.index <= len(claims) and verdicts[item.index - 1] is None:
+            verdicts[item.index - 1] = _make_verdict(
+                claims[item.index - 1], item, truncated_evidence, evidence
             )
-            for source in {source.url: source for source in evidence_snippets}.values()
-        ]
-
-        verdict = Verdict(
-            claim_text=claim.claim_text,
-            disambiguated_sentence=claim.disambiguated_sentence,
-            original_sentence=claim.original_sentence,
-            original_index=claim.original_index,
-            result=result,
-            reasoning=response.reasoning,
-            sources=sources,
+
+    missing = [index for index, verdict in enumerate(verdicts) if verdict is None]
+    if missing:
+        logger.info(f"Evaluating {len(missing)} claim(s) left out of the group verdict")
+        fallback = await asyncio.gather(
+            *(evaluate_claim(claims[index], evidence) for index in missing)
         )
+        for index, verdict in zip(missing, fallback):
+            verdicts[index] = verdict
+
+    for index, verdict in enumerate(verdicts):
+        if index not in missing:
+            _log_verdict(verdict)
+
+    return verdicts
+
+
+async def evaluate_evidence_node(state: ClaimVerifierState) -> dict:
+    claim = state.claim
+    evidence_snippets = state.evidence
+    iteration_count = state.iteration_count
 
-    # Log final result
-    influential_count = sum(source.is_influential for source in verdict.sources)
     logger.info(
-        f"Verdict '{verdict.result}' for '{claim.claim_text}': {verdict.reasoning} "
-        f"({len(verdict.sources)} sources, {influential_count} influential)"
+        f"Final evaluation for claim '{claim.claim_text}' "
+        f"with {len(evidence_snippets)} evidence snippets "
+        f"after {iteration_count} iterations"
     )
 
-    return {"verdict": verdict}
- 
\ No newline at end of file
+    return {"verdict": await evaluate_claim(claim, evidence_snippets)}
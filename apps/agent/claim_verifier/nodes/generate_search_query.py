@@ -4,21 +4,25 @@ Generates optimized queries to find evidence related to a claim.
 """
 
 import logging
-from typing import Dict
+from typing import Any, Dict, List
 
 from pydantic import BaseModel, Field
 
+from claim_verifier.config import QUERY_GENERATION_CONFIG
 from claim_verifier.prompts import (
-    QUERY_GENERATION_HUMAN_PROMPT,
-    QUERY_GENERATION_INITIAL_SYSTEM_PROMPT,
-    QUERY_GENERATION_ITERATIVE_SYSTEM_PROMPT,
+    MULTI_QUERY_GENERATION_PROMPT,
+    QUERY_GENERATION_INITIAL_PROMPT,
+    QUERY_GENERATION_ITERATIVE_PROMPT,
     get_current_timestamp,
 )
 from claim_verifier.schemas import ClaimVerifierState
+from claim_verifier.search_cache import normalize_query
 from utils import get_llm, call_llm_with_structured_output
 
 logger = logging.getLogger(__name__)
 
+QUERIES_PER_ITERATION = QUERY_GENERATION_CONFIG["queries_per_iteration"]
+
 
 class QueryGenerationOutput(BaseModel):
     """Search query generation response.
@@ -33,10 +37,70 @@ class QueryGenerationOutput(BaseModel):
     )
 
 
+class MultiQueryGenerationOutput(BaseModel):
+    """Several diverse search queries for one iteration, run in parallel."""
+
+    queries: List[str] = Field(
+        default_factory=list,
+        description="Diverse, optimized search queries that each cover a different aspect of the claim: key entities and specific details, search-friendly terms without special characters, supporting AND refuting evidence, authoritative sources",
+    )
+
+
+def _new_queries(candidates: List[str], previous: List[str], limit: int) -> List[str]:
+    """Drop blank, repeated and previously used queries, keeping at most limit."""
+    seen = {normalize_query(query) for query in previous}
+    queries = []
+    for query in candidates:
+        normalized = normalize_query(query)
+        if normalized and normalized not in seen:
+            seen.add(normalized)
+            queries.append(query.strip())
+    return queries[:limit]
+
+
+async def _generate_multiple_queries(
+    state: ClaimVerifierState, context: str
+) -> Dict[str, Any]:
+    """Generate QUERIES_PER_ITERATION diverse queries for this iteration."""
+    claim = state.claim
+
+    messages = MULTI_QUERY_GENERATION_PROMPT.invoke(
+        {
+            "current_time": get_current_timestamp(),
+            "iteration_count": state.iteration_count + 1,
+            "context": context or "None (first iteration)",
+            "query_count": QUERIES_PER_ITERATION,
+            "claim_text": claim.claim_text,
+        }
+    )
+
+    response = await call_llm_with_structured_output(
+        llm=get_llm(),
+        output_class=MultiQueryGenerationOutput,
+        messages=messages,
+        context_desc=f"multi-query generation for claim '{claim.claim_text}'",
+    )
+
+    queries = _new_queries(
+        response.queries if response else [], state.all_queries, QUERIES_PER_ITERATION
+    )
+    if not queries:
+        logger.warning(f"Failed to generate queries for claim: '{claim.claim_text}'")
+        return {"query": claim.claim_text, "queries": [claim.claim_text]}
+
+    logger.info(f"Generated {len(queries)} search queries: {queries}")
+
+    return {
+        "query": queries[0],
+        "queries": queries,
+        "all_queries": state.all_queries + queries,
+    }
+
+
 async def generate_search_query_node(
     state: ClaimVerifierState,
-) -> Dict[str, str]:
-    """Generate an effective search query for a claim."""
+) -> Dict[str, Any]:
+    """Generate effective search queries for a claim."""
 
     claim = state.claim
     iteration_count = state.iteration_count
@@ -63,19 +127,25 @@ async def generate_search_query_node(
 
     context = " | ".join(context_parts) if context_parts else ""
 
+    if QUERIES_PER_ITERATION > 1:
+        return await _generate_multiple_queries(state, context)
+
     current_time = get_current_timestamp()
 
-    system_prompt = (
-        QUERY_GENERATION_INITIAL_SYSTEM_PROMPT.format(current_time=current_time)
+    messages = (
+        QUERY_GENERATION_INITIAL_PROMPT.invoke(
+            {"current_time": current_time, "claim_text": claim.claim_text}
+        )
         if iteration_count == 0
-        else QUERY_GENERATION_ITERATIVE_SYSTEM_PROMPT.format(
-            iteration_count=iteration_count + 1,
-            context=context,
-            current_time=current_time,
+        else QUERY_GENERATION_ITERATIVE_PROMPT.invoke(
+            {
+                "iteration_count": iteration_count + 1,
+                "context": context,
+                "current_time": current_time,
+                "claim_text": claim.claim_text,
+            }
         )
     )
-    human_prompt = QUERY_GENERATION_HUMAN_PROMPT.format(claim_text=claim.claim_text)
-    messages = [("system", system_prompt), ("human", human_prompt)]
 
     response = await call_llm_with_structured_output(
         llm=llm,
@@ -86,8 +156,12 @@ async def generate_search_query_node(
 
     if not response or not response.query:
         logger.warning(f"Failed to generate query for claim: '{claim.claim_text}'")
-        return {"query": claim.claim_text}
+        return {"query": claim.claim_text, "queries": [claim.claim_text]}
 
     logger.info(f"Generated search query: {response.query}")
 
-    return {"query": response.query, "all_queries": all_queries + [response.query]}
+    return {
+        "query": response.query,
+        "queries": [response.query],
+        "all_queries": all_queries + [response.query],
+    }
@@ -3,14 +3,15 @@
 Uses search queries to retrieve relevant evidence snippets from the web using neural search.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List
-
-from langchain_exa import ExaSearchRetriever
-from langchain_tavily import TavilySearch
+from functools import partial
+from typing import Dict, List
 
 from claim_verifier.config import EVIDENCE_RETRIEVAL_CONFIG
 from claim_verifier.schemas import ClaimVerifierState, Evidence
+from claim_verifier.search_cache import search_cache
+from claim_verifier.search_providers import get_provider
 
 logger = logging.getLogger(__name__)
 
@@ -19,92 +20,50 @@ RESULTS_PER_QUERY = EVIDENCE_RETRIEVAL_CONFIG["results_per_query"]
 SEARCH_PROVIDER = EVIDENCE_RETRIEVAL_CONFIG["search_provider"]
 
 
-class SearchProviders:
-    @staticmethod
-    async def exa(query: str) -> List[Evidence]:
-        logger.info(f"Searching with Exa: '{query}'")
-
-        try:
-            retriever = ExaSearchRetriever(
-                k=RESULTS_PER_QUERY,
-                text_contents_options={"max_characters": 2000},
-                type="neural",
-            )
-
-            results = await retriever.ainvoke(query)
-
-            evidence = [
-                Evidence(
-                    url=doc.metadata.get("url", ""),
-                    text=doc.page_content[:2000],
-                    title=doc.metadata.get("title"),
-                )
-                for doc in results
-            ]
-
-            logger.info(f"Retrieved {len(evidence)} evidence items")
-            return evidence
-
-        except Exception as e:
-            logger.error(f"Exa search failed for '{query}': {e}")
-            return []
-
-    @staticmethod
-    async def tavily(query: str) -> List[Evidence]:
-        logger.info(f"Searching with Tavily: '{query}'")
-
-        try:
-            search = TavilySearch(
-                max_results=RESULTS_PER_QUERY,
-                topic="general",
-                include_raw_content="markdown",
-            )
-
-            results = await search.ainvoke(query)
-            evidence = SearchProviders._parse_tavily_results(results)
-
-            logger.info(f"Retrieved {len(evidence)} evidence items")
-            return evidence
-
-        except Exception as e:
-            logger.error(f"Tavily search failed for '{query}': {e}")
-            return []
-
-    @staticmethod
-    def _parse_tavily_results(results: Any) -> List[Evidence]:
-        match results:
-            case {"results": search_results} if isinstance(search_results, list):
-                return [
-                    Evidence(
-                        url=result.get("url", ""),
-                        text=result.get("raw_content") or result.get("content", ""),
-                        title=result.get("title", ""),
-                    )
-                    for result in search_results
-                    if isinstance(result, dict)
-                ]
-            case str():
-                return [Evidence(url="", text=results, title="Tavily Search Result")]
-            case _:
-                return []
-
 
 async def _search_query(query: str) -> List[Evidence]:
-    match SEARCH_PROVIDER.lower():
-        case "tavily":
-            return await SearchProviders.tavily(query)
-        case _:
-            return await SearchProviders.exa(query)
+    provider = get_provider(SEARCH_PROVIDER)
+
+    # Cached and coalesced with identical concurrent queries
+    return await search_cache.search(
+        provider.name,
+        query,
+        RESULTS_PER_QUERY,
+        provider.options,
+        partial(provider.search, query, RESULTS_PER_QUERY),
+    )
+
+
+def _merge_new_evidence(
+    results: List[List[Evidence]], existing: List[Evidence]
+) -> List[Evidence]:
+    """Flatten per-query results, dropping URLs that were already retrieved."""
+    seen_urls = {item.url for item in existing if item.url}
+    merged = []
+    for evidence in results:
+        for item in evidence:
+            if item.url and item.url in seen_urls:
+                continue
+            if item.url:
+                seen_urls.add(item.url)
+            merged.append(item)
+    return merged
 
 
 async def retrieve_evidence_node(
     state: ClaimVerifierState,
 ) -> Dict[str, List[Evidence]]:
-    if not state.query:
+    queries = state.queries or ([state.query] if state.query else [])
+    if not queries:
         logger.warning("No search query to process")
         return {"evidence": []}
 
-    evidence = await _search_query(state.query)
-    logger.info(f"Retrieved {len(evidence)} total evidence snippets")
+    # All queries of the iteration are searched concurrently
+    results = await asyncio.gather(*[_search_query(query) for query in queries])
+    evidence = _merge_new_evidence(results, state.evidence)
+    logger.info(
+        f"Retrieved {len(evidence)} new evidence snippets from {len(queries)} "
+        f"{'query' if len(queries) == 1 else 'queries'}"
+    )
 
     return {"evidence": [item.model_dump() for item in evidence]}
@@ -3,6 +3,7 @@
 Assesses evidence sufficiency and confidence to decide next steps.
 """
 
+import asyncio
 import logging
 from typing import Literal
 
@@ -10,16 +11,27 @@ from langgraph.graph.state import Command
 from pydantic import BaseModel, Field
 from utils import call_llm_with_structured_output, get_llm
 
-from claim_verifier.config import ITERATIVE_SEARCH_CONFIG
-from claim_verifier.prompts import (
-    SEARCH_DECISION_HUMAN_PROMPT,
-    SEARCH_DECISION_SYSTEM_PROMPT,
-    get_current_timestamp,
+from claim_verifier.config import (
+    EVIDENCE_MANAGEMENT_CONFIG,
+    EVIDENCE_RETRIEVAL_CONFIG,
+    ITERATIVE_SEARCH_CONFIG,
+    QUERY_GENERATION_CONFIG,
+    SUFFICIENCY_CONFIG,
 )
+from claim_verifier.evidence import prepare_evidence
+from claim_verifier.prompts import SEARCH_DECISION_PROMPT, get_current_timestamp
 from claim_verifier.schemas import ClaimVerifierState, IntermediateAssessment
+from claim_verifier.sufficiency import estimate_sufficiency, sufficiency_audit
 
 logger = logging.getLogger(__name__)
 
+# Summarize at least one full round of multi-query results
+EVIDENCE_SUMMARY_LIMIT = max(
+    10,
+    QUERY_GENERATION_CONFIG["queries_per_iteration"]
+    * EVIDENCE_RETRIEVAL_CONFIG["results_per_query"],
+)
+
 
 class SearchDecisionOutput(BaseModel):
     """Evidence sufficiency assessment for claim verification.
@@ -39,6 +51,40 @@ class SearchDecisionOutput(BaseModel):
     )
 
 
+def _route(
+    assessment: IntermediateAssessment,
+    iteration_count: int,
+    max_iterations: int,
+    evidence_count: int,
+) -> Command[Literal["generate_search_query", "evaluate_evidence"]]:
+    """Search again or evaluate, according to the assessment."""
+    should_continue = (
+        assessment.needs_more_evidence and iteration_count < max_iterations
+    )
+
+    if should_continue:
+        logger.info(
+            f"Continuing search - more evidence needed, "
+            f"iteration: {iteration_count + 1}/{max_iterations}, "
+            f"current evidence: {evidence_count} pieces"
+        )
+        return Command(
+            goto="generate_search_query",
+            update={
+                "iteration_count": iteration_count + 1,
+                "intermediate_assessment": assessment,
+            },
+        )
+    else:
+        logger.info(
+            f"Proceeding to final evaluation - evidence sufficient, "
+            f"total evidence: {evidence_count} pieces"
+        )
+        return Command(
+            goto="evaluate_evidence", update={"intermediate_assessment": assessment}
+        )
+
+
 async def search_decision_node(
     state: ClaimVerifierState,
 ) -> Command[Literal["generate_search_query", "evaluate_evidence"]]:
@@ -57,30 +103,56 @@ async def search_decision_node(
         )
         return Command(goto="evaluate_evidence")
 
+    # Judge the most relevant distinct evidence, not the first to arrive
+    ranked_evidence = await asyncio.to_thread(
+        prepare_evidence,
+        claim.claim_text,
+        evidence,
+        EVIDENCE_MANAGEMENT_CONFIG["decision_token_budget"],
+    )
+
+    # Clear-cut cases are decided locally, without the LLM
+    estimate = None
+    if SUFFICIENCY_CONFIG["enabled"]:
+        estimate = await asyncio.to_thread(
+            estimate_sufficiency, claim.claim_text, ranked_evidence
+        )
+        if (
+            estimate.needs_more_evidence is not None
+            and not sufficiency_audit.should_audit()
+        ):
+            sufficiency_audit.record(claim.claim_text, estimate)
+            logger.info(
+                f"Local sufficiency score {estimate.score:.2f} decided the search "
+                f"(needs more evidence: {estimate.needs_more_evidence})"
+            )
+            assessment = IntermediateAssessment(
+                needs_more_evidence=estimate.needs_more_evidence,
+                missing_aspects=estimate.missing_aspects,
+            )
+            return _route(assessment, iteration_count, max_iterations, len(evidence))
+
     # Assess evidence sufficiency with LLM
     llm = get_llm()
 
     evidence_summary = "\n".join(
         [
             f"- {ev.title}: {ev.text[:200]}..." if ev.title else f"- {ev.text[:200]}..."
-            for ev in evidence[:10]
+            for ev in ranked_evidence[:EVIDENCE_SUMMARY_LIMIT]
         ]
     )
 
     current_time = get_current_timestamp()
 
-    system_prompt = SEARCH_DECISION_SYSTEM_PROMPT.format(current_time=current_time)
-    human_prompt = SEARCH_DECISION_HUMAN_PROMPT.format(
-        claim_text=claim.claim_text,
-        evidence_count=len(evidence),
-        evidence_summary=evidence_summary,
+    messages = SEARCH_DECISION_PROMPT.invoke(
+        {
+            "current_time": current_time,
+            "claim_text": claim.claim_text,
+            "evidence_count": len(ranked_evidence),
+            "evidence_summary": evidence_summary,
+        }
     )
 
-    messages = [
-        ("system", system_prompt),
-        ("human", human_prompt),
-    ]
-
     response = await call_llm_with_structured_output(
         llm=llm,
         output_class=SearchDecisionOutput,
@@ -94,32 +166,15 @@ async def search_decision_node(
         )
         return Command(goto="evaluate_evidence")
 
+    if estimate is not None:
+        sufficiency_audit.record(
+            claim.claim_text, estimate, response.needs_more_evidence
+        )
+
     assessment = IntermediateAssessment(
         needs_more_evidence=response.needs_more_evidence,
         missing_aspects=response.missing_aspects,
     )
 
     # Decision logic based on LLM assessment
-    should_continue = response.needs_more_evidence and iteration_count < max_iterations
-
-    if should_continue:
-        logger.info(
-            f"Continuing search - more evidence needed, "
-            f"iteration: {iteration_count + 1}/{max_iterations}, "
-            f"current evidence: {len(evidence)} pieces"
-        )
-        return Command(
-            goto="generate_search_query",
-            update={
-                "iteration_count": iteration_count + 1,
-                "intermediate_assessment": assessment,
-            },
-        )
-    else:
-        logger.info(
-            f"Proceeding to final evaluation - evidence sufficient, "
-            f"total evidence: {len(evidence)} pieces"
-        )
-        return Command(
-            goto="evaluate_evidence", update={"intermediate_assessment": assessment}
-        )
+    return _route(assessment, iteration_count, max_iterations, len(evidence))
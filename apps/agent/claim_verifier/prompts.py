@@ -5,6 +5,8 @@ Contains all system and human prompts for each LLM interaction, organized by wor
 
 from datetime import datetime
 
+from langchain_core.prompts import ChatPromptTemplate
+
 
 def get_current_timestamp() -> str:
     """Get current timestamp for temporal context in prompts."""
@@ -65,6 +67,29 @@ QUERY_GENERATION_HUMAN_PROMPT = """Claim: {claim_text}
 
 Generate a search query to find evidence for fact-checking this claim."""
 
+MULTI_QUERY_GENERATION_SYSTEM_PROMPT = """You are an expert search query generator for fact-checking claims.
+
+Current time: {current_time}
+This is iteration {iteration_count} of an iterative search process.
+Previous context: {context}
+
+Your task: Create {query_count} diverse search queries that will be run in parallel and together find evidence that could verify or refute the given claim.
+
+Requirements:
+- Each query covers a different aspect or angle of the claim (e.g. the core fact, official or primary sources, contradictory evidence or criticism, dates and figures)
+- Include key entities, names, dates, and specific details from the claim
+- Use search-engine-friendly language (no special characters)
+- Keep each query concise (5-15 words optimal)
+- Do not repeat or closely paraphrase each other or any previous query
+- Address the missing aspects mentioned in the context, if any
+- For time-sensitive claims, include relevant temporal constraints
+
+Return only the search queries - no additional text."""
+
+MULTI_QUERY_GENERATION_HUMAN_PROMPT = """Claim: {claim_text}
+
+Generate {query_count} search queries to find evidence for fact-checking this claim."""
+
 # Legacy prompt - can be removed if not used elsewhere
 QUERY_GENERATION_SYSTEM_PROMPT = """You are an expert search query generator for fact-checking claims. Your goal is to create a single, effective search query that will help retrieve evidence to verify a factual claim.
 
@@ -187,3 +212,59 @@ Evidence:
 Based exclusively on the evidence above, provide your fact-checking verdict.
 
 Remember: Base your assessment solely on the provided evidence. Do not use external knowledge."""
+
+CLUSTER_EVALUATION_HUMAN_PROMPT = """Claims:
+{claim_text}
+
+Evidence:
+{evidence_snippets}
+
+Based exclusively on the evidence above, provide a separate fact-checking verdict for each numbered claim, using the claim's number as its index. Judge every claim on its own - one claim being supported or refuted says nothing about the others.
+
+Remember: Base your assessment solely on the provided evidence. Do not use external knowledge."""
+
+
+### COMPILED TEMPLATES ###
+# Parsed once at import time and reused for every request
+
+QUERY_GENERATION_INITIAL_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        ("system", QUERY_GENERATION_INITIAL_SYSTEM_PROMPT),
+        ("human", QUERY_GENERATION_HUMAN_PROMPT),
+    ]
+)
+
+QUERY_GENERATION_ITERATIVE_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        ("system", QUERY_GENERATION_ITERATIVE_SYSTEM_PROMPT),
+        ("human", QUERY_GENERATION_HUMAN_PROMPT),
+    ]
+)
+
+MULTI_QUERY_GENERATION_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        ("system", MULTI_QUERY_GENERATION_SYSTEM_PROMPT),
+        ("human", MULTI_QUERY_GENERATION_HUMAN_PROMPT),
+    ]
+)
+
+SEARCH_DECISION_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        ("system", SEARCH_DECISION_SYSTEM_PROMPT),
+        ("human", SEARCH_DECISION_HUMAN_PROMPT),
+    ]
+)
+
+CLUSTER_EVALUATION_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        ("system", EVIDENCE_EVALUATION_SYSTEM_PROMPT),
+        ("human", CLUSTER_EVALUATION_HUMAN_PROMPT),
+    ]
+)
+
+EVIDENCE_EVALUATION_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        ("system", EVIDENCE_EVALUATION_SYSTEM_PROMPT),
+        ("human", EVIDENCE_EVALUATION_HUMAN_PROMPT),
+    ]
+)
@@ -44,6 +44,10 @@ class Verdict(BaseModel):
     original_index: int = Field(
         description="The index of the original sentence in the source text"
     )
+    source_indices: List[int] = Field(
+        default_factory=list,
+        description="Indices of every sentence the verdict applies to",
+    )
     result: VerificationResult = Field(
         description="The fact-checking verdict (Supported, Refuted, etc.)"
     )
@@ -67,6 +71,10 @@ class ClaimVerifierState(BaseModel):
 
     claim: ValidatedClaim = Field(description="The claim being verified")
     query: Optional[str] = Field(default=None, description="Current search query")
+    queries: List[str] = Field(
+        default_factory=list,
+        description="All search queries of the current iteration",
+    )
     all_queries: List[str] = Field(
         default_factory=list, description="All queries used across iterations"
     )
@@ -0,0 +1,157 @@
+"""Search result caching and request coalescing.
+
+Sits in front of the search providers: identical queries are answered from
+a Redis cache while fresh, and concurrent identical queries within this
+process share a single in-flight provider call.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from utils import redis_client, settings
+from utils.metrics import LatencyHistogram
+
+from claim_verifier.schemas import Evidence
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "search_cache:"
+
+SearchFunction = Callable[[], Awaitable[List[Evidence]]]
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a search query."""
+    return re.sub(r"\s+", " ", query).strip().lower()
+
+
+class SearchCache:
+    """Redis TTL cache plus in-process single-flight for search calls.
+
+    Entries are keyed on (provider, normalized query, k, content options).
+    Empty result lists are never cached, since providers return them on
+    errors too.
+    """
+
+    def __init__(self, ttl_seconds: int = 21600, use_redis: bool = True):
+        self.ttl_seconds = ttl_seconds
+        self.use_redis = use_redis
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.latency: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.redis_errors = 0
+
+    @staticmethod
+    def make_key(provider: str, query: str, k: int, options: Dict[str, Any]) -> str:
+        """Build the cache key for a search request."""
+        payload = json.dumps(
+            [provider, normalize_query(query), k, options], sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def search(
+        self,
+        provider: str,
+        query: str,
+        k: int,
+        options: Dict[str, Any],
+        search_fn: SearchFunction,
+    ) -> List[Evidence]:
+        """Run a search through the cache.
+
+        Args:
+            provider: Provider name, used for keys and latency metrics
+            query: Search query
+            k: Number of results requested
+            options: Provider content options that affect the results
+            search_fn: Performs the actual provider call
+
+        Returns:
+            Search results
+        """
+        key = self.make_key(provider, query, k, options)
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self.coalesced += 1
+            logger.info(f"Joining in-flight {provider} search for '{query}'")
+        else:
+            in_flight = asyncio.ensure_future(self._load(key, provider, search_fn))
+            self._in_flight[key] = in_flight
+            in_flight.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        # Shield so one cancelled caller doesn't cancel the shared call
+        return list(await asyncio.shield(in_flight))
+
+    async def _load(
+        self, key: str, provider: str, search_fn: SearchFunction
+    ) -> List[Evidence]:
+        cached = await self._get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        started = time.perf_counter()
+        results = await search_fn()
+        self.latency[provider].observe(time.perf_counter() - started)
+
+        if results:
+            await self._set(key, results)
+        return results
+
+    async def _get(self, key: str) -> Optional[List[Evidence]]:
+        if not self.use_redis:
+            return None
+        try:
+            async with redis_client() as client:
+                raw = await client.get(f"{CACHE_KEY_PREFIX}{key}")
+        except Exception as e:
+            self.redis_errors += 1
+            logger.warning(f"Search cache Redis lookup failed: {e}")
+            return None
+
+        if raw is None:
+            return None
+        return [Evidence.model_validate(item) for item in json.loads(raw)]
+
+    async def _set(self, key: str, results: List[Evidence]) -> None:
+        if not self.use_redis:
+            return
+        raw = json.dumps([item.model_dump() for item in results])
+        try:
+            async with redis_client() as client:
+                await client.set(f"{CACHE_KEY_PREFIX}{key}", raw, ex=self.ttl_seconds)
+        except Exception as e:
+            self.redis_errors += 1
+            logger.warning(f"Search cache Redis write failed: {e}")
+
+    def stats(self) -> dict:
+        """Cache counters and per-provider latency histograms."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "in_flight": len(self._in_flight),
+            "redis_errors": self.redis_errors,
+            "latency": {
+                provider: histogram.snapshot()
+                for provider, histogram in self.latency.items()
+            },
+        }
+
+
+search_cache = SearchCache(
+    ttl_seconds=settings.search_cache_ttl_seconds,
+    use_redis=settings.search_cache_enabled,
+)
@@ -0,0 +1,249 @@
+"""Search provider backends.
+
+Each provider is a long-lived object that talks to its API over one shared,
+pooled HTTP client, with its own concurrency limit and request timeout.
+New backends are added with register_provider().
+"""
+
+import asyncio
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+from utils import settings
+from utils.rate_limit import is_rate_limit_error, rate_scheduler, retry_after_seconds
+
+from claim_verifier.config import EVIDENCE_RETRIEVAL_CONFIG
+from claim_verifier.schemas import Evidence
+
+logger = logging.getLogger(__name__)
+
+PROVIDER_CONFIG = EVIDENCE_RETRIEVAL_CONFIG["providers"]
+
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_lock = threading.Lock()
+
+
+def get_search_http_client() -> httpx.AsyncClient:
+    """Get the pooled HTTP client shared by all search providers."""
+    global _http_client
+
+    with _http_client_lock:
+        if _http_client is None or _http_client.is_closed:
+            _http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.search_http_max_connections,
+                    max_keepalive_connections=settings.search_http_max_keepalive,
+                ),
+            )
+        return _http_client
+
+
+class SearchProvider(ABC):
+    """A search backend returning evidence for a query.
+
+    Subclasses implement _search(); search() adds the concurrency limit,
+    shared rate limit, timeout and error handling.
+    """
+
+    name: str = ""
+
+    def __init__(self, max_concurrency: int = 10, timeout: float = 30.0):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self.requests = 0
+        self.failures = 0
+
+    @property
+    def options(self) -> Dict[str, Any]:
+        """Request options that affect the results (part of cache keys)."""
+        return {}
+
+    @abstractmethod
+    async def _search(
+        self, client: httpx.AsyncClient, query: str, k: int
+    ) -> List[Evidence]:
+        """Call the provider API."""
+
+    async def search(self, query: str, k: int) -> List[Evidence]:
+        """Search for evidence, returning an empty list on failure.
+
+        Args:
+            query: Search query
+            k: Number of results to request
+
+        Returns:
+            Evidence from the search results
+        """
+        logger.info(f"Searching with {self.name}: '{query}'")
+
+        async with self._semaphore:
+            for attempt in range(settings.rate_limit_retries + 1):
+                # Shared per-upstream query rate; 429s pause everyone and retry
+                await rate_scheduler.acquire(self.name)
+                self.requests += 1
+                try:
+                    evidence = await asyncio.wait_for(
+                        self._search(get_search_http_client(), query, k), self.timeout
+                    )
+                    break
+                except Exception as e:
+                    if is_rate_limit_error(e) and attempt < settings.rate_limit_retries:
+                        rate_scheduler.pause(
+                            self.name, retry_after_seconds(e, 2.0**attempt)
+                        )
+                        continue
+                    self.failures += 1
+                    logger.error(f"{self.name} search failed for '{query}': {e!r}")
+                    return []
+
+        logger.info(f"Retrieved {len(evidence)} evidence items")
+        return evidence
+
+    def stats(self) -> Dict[str, Any]:
+        """Request counters and current concurrency."""
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "max_concurrency": self.max_concurrency,
+            "available_slots": self._semaphore._value,
+        }
+
+
+class ExaProvider(SearchProvider):
+    """Exa neural search."""
+
+    name = "exa"
+    api_url = "https://api.exa.ai/search"
+
+    @property
+    def options(self) -> Dict[str, Any]:
+        return {"type": "neural", "max_characters": 2000}
+
+    async def _search(
+        self, client: httpx.AsyncClient, query: str, k: int
+    ) -> List[Evidence]:
+        if not settings.exa_api_key:
+            raise ValueError("Exa API key not found in environment variables")
+
+        response = await client.post(
+            self.api_url,
+            headers={"x-api-key": settings.exa_api_key},
+            timeout=httpx.Timeout(self.timeout),
+            json={
+                "query": query,
+                "numResults": k,
+                "type": self.options["type"],
+                "contents": {
+                    "text": {"maxCharacters": self.options["max_characters"]}
+                },
+            },
+        )
+        response.raise_for_status()
+
+        return [
+            Evidence(
+                url=result.get("url", ""),
+                text=(result.get("text") or "")[: self.options["max_characters"]],
+                title=result.get("title"),
+            )
+            for result in response.json().get("results", [])
+        ]
+
+
+class TavilyProvider(SearchProvider):
+    """Tavily web search."""
+
+    name = "tavily"
+    api_url = "https://api.tavily.com/search"
+
+    @property
+    def options(self) -> Dict[str, Any]:
+        return {"topic": "general", "include_raw_content": "markdown"}
+
+    async def _search(
+        self, client: httpx.AsyncClient, query: str, k: int
+    ) -> List[Evidence]:
+        if not settings.tavily_api_key:
+            raise ValueError("Tavily API key not found in environment variables")
+
+        response = await client.post(
+            self.api_url,
+            headers={"Authorization": f"Bearer {settings.tavily_api_key}"},
+            timeout=httpx.Timeout(self.timeout),
+            json={"query": query, "max_results": k, **self.options},
+        )
+        response.raise_for_status()
+        return self._parse_results(response.json())
+
+    @staticmethod
+    def _parse_results(results: Any) -> List[Evidence]:
+        match results:
+            case {"results": search_results} if isinstance(search_results, list):
+                return [
+                    Evidence(
+                        url=result.get("url", ""),
+                        text=result.get("raw_content") or result.get("content", ""),
+                        title=result.get("title", ""),
+                    )
+                    for result in search_results
+                    if isinstance(result, dict)
+                ]
+            case str():
+                return [Evidence(url="", text=results, title="Tavily Search Result")]
+            case _:
+                return []
+
+
+# Used when EVIDENCE_RETRIEVAL_CONFIG names an unregistered provider
+DEFAULT_PROVIDER = "exa"
+
+ProviderFactory = Callable[[Dict[str, Any]], SearchProvider]
+
+_factories: Dict[str, ProviderFactory] = {}
+_providers: Dict[str, SearchProvider] = {}
+_providers_lock = threading.Lock()
+
+
+def register_provider(name: str, factory: ProviderFactory) -> None:
+    """Register a search backend.
+
+    Args:
+        name: Name used in EVIDENCE_RETRIEVAL_CONFIG["search_provider"]
+        factory: Builds the provider from its PROVIDER_CONFIG entry
+    """
+    with _providers_lock:
+        _factories[name.lower()] = factory
+        _providers.pop(name.lower(), None)
+
+
+def get_provider(name: str) -> SearchProvider:
+    """Get the long-lived instance of a registered provider.
+
+    Unknown names fall back to Exa.
+    """
+    key = name.lower()
+    with _providers_lock:
+        if key not in _factories:
+            logger.warning(
+                f"Unknown search provider '{name}' (registered: "
+                f"{', '.join(sorted(_factories))}), falling back to {DEFAULT_PROVIDER}"
+            )
+            key = DEFAULT_PROVIDER
+        provider = _providers.get(key)
+        if provider is None:
+            provider = _factories[key](PROVIDER_CONFIG.get(key, {}))
+            _providers[key] = provider
+        return provider
+
+
+def get_provider_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every provider instantiated so far."""
+    return {name: provider.stats() for name, provider in _providers.items()}
+
+
+register_provider("exa", lambda config: ExaProvider(**config))
+register_provider("tavily", lambda config: TavilyProvider(**config))
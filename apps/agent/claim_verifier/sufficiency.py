@@ -0,0 +1,266 @@
+"""Local evidence-sufficiency estimate.
+
+Scores the evidence gathered so far from its count, source diversity,
+relevance to the claim and how consistently it points one way. Clear-cut
+cases skip the search decision LLM call; the rest still go to the LLM.
+Decisions are written to an audit log so the thresholds can be checked
+against the LLM's judgement.
+"""
+
+import json
+import logging
+import random
+import re
+from collections import Counter
+from typing import List, Optional, Sequence
+from urllib.parse import urlsplit
+
+from pydantic import BaseModel, Field
+from utils.embeddings import encode_texts
+
+from claim_verifier.config import SUFFICIENCY_CONFIG
+from claim_verifier.schemas import Evidence
+
+logger = logging.getLogger(__name__)
+audit_logger = logging.getLogger(f"{__name__}.audit")
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_NUMBER_PATTERN = re.compile(r"\d+(?:[.,]\d+)*")
+
+_STOPWORDS = set(
+    "a an the and or but of in on at to for from by with as is are was were be "
+    "been being has have had do does did will would can could may might that "
+    "this these those it its their his her they he she we you i which who whom "
+    "than then there here over under into about after before also not no".split()
+)
+
+# Wording that marks a snippet as disputing what it reports
+_REFUTATION_CUES = re.compile(
+    r"\b(false|fake|hoax|myth|debunk\w*|misleading|no evidence|not true|untrue|"
+    r"incorrect|inaccurate|fabricated|baseless|unfounded|denie[sd]|disproven)\b",
+    re.IGNORECASE,
+)
+
+
+class SufficiencyEstimate(BaseModel):
+    """Local estimate of whether the evidence is enough for a verdict."""
+
+    score: float = Field(description="Weighted sufficiency score in [0, 1]")
+    needs_more_evidence: Optional[bool] = Field(
+        default=None, description="Confident decision, or None to ask the LLM"
+    )
+    evidence_count: int = Field(default=0, description="Distinct evidence items")
+    domain_count: int = Field(default=0, description="Distinct source domains")
+    relevance: float = Field(default=0.0, description="Mean top relevance to claim")
+    agreement: float = Field(
+        default=0.0, description="Share of relevant evidence taking the majority stance"
+    )
+    missing_aspects: List[str] = Field(
+        default_factory=list, description="What more evidence should cover"
+    )
+
+
+def _content_terms(text: str) -> set:
+    return {
+        token
+        for token in _TOKEN_PATTERN.findall(text.lower())
+        if token not in _STOPWORDS
+    }
+
+
+def _lexical_relevance(claim_text: str, documents: Sequence[str]) -> List[float]:
+    """Share of the claim's content terms found in each document."""
+    claim_terms = _content_terms(claim_text)
+    if not claim_terms:
+        return [0.0] * len(documents)
+    return [
+        len(claim_terms & _content_terms(document)) / len(claim_terms)
+        for document in documents
+    ]
+
+
+def _embedding_relevance(claim_text: str, documents: Sequence[str]) -> List[float]:
+    """Cosine similarity of each document to the claim, clipped to [0, 1]."""
+    embeddings = encode_texts([claim_text, *documents], SUFFICIENCY_CONFIG["encoder"])
+    return [
+        min(1.0, max(0.0, float(score))) for score in embeddings[1:] @ embeddings[0]
+    ]
+
+
+def _relevance_scores(claim_text: str, documents: Sequence[str]) -> List[float]:
+    if SUFFICIENCY_CONFIG["relevance_method"] == "embedding":
+        try:
+            return _embedding_relevance(claim_text, documents)
+        except Exception as e:
+            logger.warning(f"Embedding relevance unavailable, using lexical: {e}")
+    return _lexical_relevance(claim_text, documents)
+
+
+def _stance(claim_text: str, document: str) -> Optional[str]:
+    """Entailment-style stance of a relevant document towards the claim.
+
+    A document refutes the claim if it uses debunking language the claim
+    itself doesn't, supports it if the claim has numbers and the document
+    repeats all of them, and takes no stance otherwise.
+    """
+    if _REFUTATION_CUES.search(document) and not _REFUTATION_CUES.search(claim_text):
+        return "refutes"
+    claim_numbers = set(_NUMBER_PATTERN.findall(claim_text))
+    if claim_numbers and claim_numbers <= set(_NUMBER_PATTERN.findall(document)):
+        return "supports"
+    return None
+
+
+def _domain(url: str) -> str:
+    return urlsplit(url).netloc.lower().removeprefix("www.")
+
+
+def estimate_sufficiency(
+    claim_text: str, evidence: Sequence[Evidence]
+) -> SufficiencyEstimate:
+    """Score how well the evidence covers the claim.
+
+    Args:
+        claim_text: The claim being verified
+        evidence: Distinct evidence, most relevant first
+
+    Returns:
+        The estimate; needs_more_evidence is set only when the score is past
+        one of the configured thresholds
+    """
+    config = SUFFICIENCY_CONFIG
+    if not evidence:
+        return SufficiencyEstimate(
+            score=0.0,
+            needs_more_evidence=True,
+            missing_aspects=["any source addressing the claim"],
+        )
+
+    documents = [f"{item.title or ''} {item.text}" for item in evidence]
+    relevance = _relevance_scores(claim_text, documents)
+    top_relevance = sorted(relevance, reverse=True)[:3]
+    mean_relevance = sum(top_relevance) / len(top_relevance)
+
+    stances = Counter(
+        _stance(claim_text, document)
+        for document, score in zip(documents, relevance)
+        if score >= config["relevance_floor"]
+    )
+    stances.pop(None, None)
+    taking_stance = sum(stances.values())
+    agreement = max(stances.values()) / taking_stance if taking_stance else 0.0
+
+    domains = {_domain(item.url) for item in evidence if item.url}
+
+    signals = {
+        "count": min(1.0, len(evidence) / config["target_evidence"]),
+        "diversity": min(1.0, len(domains) / config["target_domains"]),
+        "relevance": mean_relevance,
+        "agreement": agreement,
+    }
+    weights = config["weights"]
+    score = sum(weights[name] * value for name, value in signals.items()) / sum(
+        weights.values()
+    )
+
+    missing_aspects = []
+    if mean_relevance < config["relevance_floor"]:
+        missing_aspects.append("sources directly addressing the claim")
+    if signals["diversity"] < 1.0:
+        missing_aspects.append("independent sources from other outlets")
+    if taking_stance and agreement < 1.0:
+        missing_aspects.append("authoritative sources resolving conflicting reports")
+
+    needs_more_evidence = None
+    if score >= config["stop_threshold"] and len(evidence) >= config[
+        "min_evidence_to_stop"
+    ]:
+        needs_more_evidence = False
+    elif score <= config["continue_threshold"]:
+        needs_more_evidence = True
+
+    return SufficiencyEstimate(
+        score=round(score, 4),
+        needs_more_evidence=needs_more_evidence,
+        evidence_count=len(evidence),
+        domain_count=len(domains),
+        relevance=round(mean_relevance, 4),
+        agreement=round(agreement, 4),
+        missing_aspects=missing_aspects,
+    )
+
+
+class SufficiencyAudit:
+    """Audit log and counters comparing local and LLM search decisions.
+
+    Each decision is logged as one JSON line on the
+    "claim_verifier.sufficiency.audit" logger.
+    """
+
+    def __init__(self, sample_rate: float = 0.0):
+        self.sample_rate = sample_rate
+        self.local_decisions = 0
+        self.llm_decisions = 0
+        self.audited = 0
+        self.disagreements = 0
+
+    def should_audit(self) -> bool:
+        """Whether to check a confident local decision against the LLM."""
+        return random.random() < self.sample_rate
+
+    def record(
+        self,
+        claim_text: str,
+        estimate: SufficiencyEstimate,
+        llm_needs_more_evidence: Optional[bool] = None,
+    ) -> None:
+        """Log one search decision.
+
+        Args:
+            claim_text: The claim being verified
+            estimate: The local estimate
+            llm_needs_more_evidence: The LLM's decision, if it was asked
+        """
+        local = estimate.needs_more_evidence
+        if llm_needs_more_evidence is None:
+            self.local_decisions += 1
+        else:
+            self.llm_decisions += 1
+            if local is not None:
+                self.audited += 1
+                if local != llm_needs_more_evidence:
+                    self.disagreements += 1
+
+        audit_logger.info(
+            json.dumps(
+                {
+                    "claim": claim_text,
+                    "local": local,
+                    "llm": llm_needs_more_evidence,
+                    "score": estimate.score,
+                    "evidence_count": estimate.evidence_count,
+                    "domain_count": estimate.domain_count,
+                    "relevance": estimate.relevance,
+                    "agreement": estimate.agreement,
+                }
+            )
+        )
+
+    def stats(self) -> dict:
+        """Decision counts and local/LLM agreement on audited decisions."""
+        total = self.local_decisions + self.llm_decisions
+        return {
+            "local_decisions": self.local_decisions,
+            "llm_decisions": self.llm_decisions,
+            "llm_calls_saved_rate": self.local_decisions / total if total else 0.0,
+            "audited": self.audited,
+            "disagreements": self.disagreements,
+            "agreement_rate": (
+                1 - self.disagreements / self.audited if self.audited else None
+            ),
+        }
+
+
+sufficiency_audit = SufficiencyAudit(
+    sample_rate=SUFFICIENCY_CONFIG["audit_sample_rate"]
+)
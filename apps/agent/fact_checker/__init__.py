@@ -5,6 +5,7 @@ Integrates claim extraction and verification into a complete workflow.
 
 from fact_checker.agent import create_graph, graph
 from fact_checker.schemas import FactCheckReport, State
+from fact_checker.verdict_cache import get_verdict_cache_stats
 
 __all__ = [
     # Main functionality
@@ -13,4 +14,6 @@ __all__ = [
     # Data models
     "State",
     "FactCheckReport",
+    # Monitoring
+    "get_verdict_cache_stats",
 ]
@@ -6,11 +6,14 @@ from langgraph.graph.state import CompiledStateGraph
 
 from fact_checker.nodes import (
     claim_verifier_node,
+    cluster_verifier_node,
     dispatch_claims_for_verification,
     extract_claims,
     generate_report_node,
 )
+from fact_checker.progress import track_progress
 from fact_checker.schemas import State
+from utils import track_run_slot
 
 load_dotenv()
 
@@ -33,6 +36,7 @@ def create_graph() -> CompiledStateGraph:
     # Add nodes
     workflow.add_node("extract_claims", extract_claims)
     workflow.add_node("claim_verifier", claim_verifier_node)
+    workflow.add_node("cluster_verifier", cluster_verifier_node)
     workflow.add_node("generate_report_node", generate_report_node)
 
     # Set entry point
@@ -40,9 +44,12 @@ def create_graph() -> CompiledStateGraph:
 
     # Connect the nodes in sequence
     workflow.add_conditional_edges(
-        "extract_claims", dispatch_claims_for_verification, ["claim_verifier", END]
+        "extract_claims",
+        dispatch_claims_for_verification,
+        ["claim_verifier", "cluster_verifier", END],
     )
     workflow.add_edge("claim_verifier", "generate_report_node")
+    workflow.add_edge("cluster_verifier", "generate_report_node")
 
     # Set finish point
     workflow.set_finish_point("generate_report_node")
@@ -50,4 +57,6 @@ def create_graph() -> CompiledStateGraph:
     return workflow.compile()
 
 
-graph = create_graph()
+# Runs started through the server hold their API key's concurrency slot, and
+# every run streams its own progress
+graph = track_run_slot(track_progress(create_graph()))
@@ -0,0 +1,126 @@
+"""Claim clustering for batch verification.
+
+Groups claims from one document that concern the same entities (or are
+close in embedding space), so each group can share query generation,
+retrieval and evaluation.
+"""
+
+import logging
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from claim_extractor import ValidatedClaim
+from utils.anchors import extract_entities
+from utils.embeddings import cosine_similarity_matrix, encode_texts
+
+from fact_checker.config import CLUSTERED_VERIFICATION_CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+class _Clusters:
+    """Union-find over claim indices with a cap on cluster size."""
+
+    def __init__(self, size: int, max_cluster_size: int):
+        self.parent = list(range(size))
+        self.size = [1] * size
+        self.max_cluster_size = max_cluster_size
+
+    def find(self, index: int) -> int:
+        while self.parent[index] != index:
+            self.parent[index] = self.parent[self.parent[index]]
+            index = self.parent[index]
+        return index
+
+    def union(self, first: int, second: int) -> None:
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return
+        if self.size[first] + self.size[second] > self.max_cluster_size:
+            return
+        if self.size[first] < self.size[second]:
+            first, second = second, first
+        self.parent[second] = first
+        self.size[first] += self.size[second]
+
+
+def _similarities(claims: Sequence[ValidatedClaim]) -> Optional[np.ndarray]:
+    try:
+        embeddings = encode_texts(
+            [claim.claim_text for claim in claims],
+            CLUSTERED_VERIFICATION_CONFIG["encoder"],
+        )
+    except Exception as e:
+        logger.warning(f"Claim embeddings unavailable, clustering on entities: {e}")
+        return None
+    return cosine_similarity_matrix(embeddings)
+
+
+def cluster_claims(
+    claims: Sequence[ValidatedClaim],
+    similarity_threshold: float = CLUSTERED_VERIFICATION_CONFIG[
+        "similarity_threshold"
+    ],
+    max_cluster_size: int = CLUSTERED_VERIFICATION_CONFIG["max_cluster_size"],
+) -> List[List[ValidatedClaim]]:
+    """Group claims that share an entity or are semantically close.
+
+    Pairs are merged strongest first (most shared entities, then highest
+    similarity) as long as the merged cluster stays within max_cluster_size.
+
+    Args:
+        claims: Claims extracted from one document
+        similarity_threshold: Min cosine similarity to group claims with no
+            entity in common
+        max_cluster_size: Maximum claims per cluster
+
+    Returns:
+        Clusters in order of their first claim, claims in input order
+    """
+    if len(claims) < 2:
+        return [list(claims)]
+
+    entities = [extract_entities(claim.claim_text) for claim in claims]
+    similarities = _similarities(claims)
+
+    edges = []
+    for first in range(len(claims)):
+        for second in range(first + 1, len(claims)):
+            shared = len(entities[first] & entities[second])
+            similarity = (
+                float(similarities[first, second]) if similarities is not None else 0.0
+            )
+            if shared or similarity >= similarity_threshold:
+                edges.append((shared, similarity, first, second))
+
+    clusters = _Clusters(len(claims), max_cluster_size)
+    for _, _, first, second in sorted(edges, reverse=True):
+        clusters.union(first, second)
+
+    grouped = {}
+    for index, claim in enumerate(claims):
+        grouped.setdefault(clusters.find(index), []).append(claim)
+
+    result = list(grouped.values())
+    logger.info(f"Grouped {len(claims)} claims into {len(result)} clusters")
+    return result
+
+
+def make_cluster_claim(claims: Sequence[ValidatedClaim]) -> ValidatedClaim:
+    """Combine a cluster into one claim to drive shared evidence retrieval."""
+    claim_text = " ".join(claim.claim_text for claim in claims)
+    return ValidatedClaim(
+        claim_text=claim_text,
+        is_complete_declarative=True,
+        disambiguated_sentence=claim_text,
+        original_sentence=claims[0].original_sentence,
+        original_index=claims[0].original_index,
+        source_indices=sorted(
+            {
+                index
+                for claim in claims
+                for index in claim.source_indices or [claim.original_index]
+            }
+        ),
+    )
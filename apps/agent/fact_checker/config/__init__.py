@@ -0,0 +1,15 @@
+"""Configuration for the fact checker.
+
+Central storage for all configuration settings.
+"""
+
+from fact_checker.config.nodes import (
+    CLUSTERED_VERIFICATION_CONFIG,
+    VERDICT_CACHE_CONFIG,
+)
+
+__all__ = [
+    # Node configurations
+    "CLUSTERED_VERIFICATION_CONFIG",
+    "VERDICT_CACHE_CONFIG",
+]
@@ -0,0 +1,28 @@
+"""Node configuration settings.
+
+Contains settings for the fact checker workflow nodes.
+"""
+
+# Cross-request verdict cache (enable with VERDICT_CACHE_ENABLED)
+VERDICT_CACHE_CONFIG = {
+    # How long a verdict stays valid, by claim type (see classify_claim_type)
+    "ttl_seconds": {
+        "current_events": 6 * 3600,  # Claims about recent or ongoing events
+        "statistic": 7 * 86400,  # Figures that get revised
+        "general": 30 * 86400,
+    },
+    "encoder": "all-MiniLM-L6-v2",  # sentence-transformers model
+    "similarity_threshold": 0.95,  # Min cosine similarity for a neighbour hit
+    "hash_bits": 10,  # Random-hyperplane bits per neighbourhood bucket
+    "hash_tables": 8,  # Independent bucketings; a lookup reads one bucket of each
+    "max_bucket_size": 32,  # Entries kept per bucket, latest-expiring first
+}
+
+# Verify claims about the same entities together: shared query generation and
+# retrieval per cluster, then one evaluation call over the pooled evidence
+CLUSTERED_VERIFICATION_CONFIG = {
+    "enabled": False,
+    "encoder": "all-MiniLM-L6-v2",  # sentence-transformers model
+    "similarity_threshold": 0.6,  # Min cosine similarity to group without entities
+    "max_cluster_size": 5,  # Claims verified together at most
+}
@@ -3,11 +3,13 @@
 from fact_checker.nodes.extract_claims import extract_claims
 from fact_checker.nodes.dispatch_claims import dispatch_claims_for_verification
 from fact_checker.nodes.claim_verifier import claim_verifier_node
+from fact_checker.nodes.cluster_verifier import cluster_verifier_node
 from fact_checker.nodes.generate_report import generate_report_node
 
 __all__ = [
     "extract_claims",
     "dispatch_claims_for_verification",
     "claim_verifier_node",
+    "cluster_verifier_node",
     "generate_report_node",
 ]
@@ -4,42 +4,83 @@ Interfaces with the claim verifier subsystem to check factual accuracy.
 """
 
 import logging
-from typing import Dict
+import time
+from typing import Dict, List, Optional
 
+from claim_extractor import ValidatedClaim
 from claim_verifier import Verdict
 from claim_verifier import graph as claim_verifier_graph
+from utils import settings
+from utils.rate_limit import run_scope
+
+from fact_checker.progress import publish_verdicts
+from fact_checker.verdict_cache import verdict_cache
 
 logger = logging.getLogger(__name__)
 
 
-async def claim_verifier_node(inputs: Dict) -> Dict[str, Verdict]:
-    """Process a single claim through the claim verifier.
+async def verify_claim(
+    claim: ValidatedClaim, run_id: Optional[str]
+) -> Optional[Verdict]:
+    """Verify a single claim, using the verdict cache when enabled.
 
     Args:
-        inputs: Dictionary with the claim to verify
+        claim: The claim to verify
+        run_id: Run the upstream calls are attributed to
 
     Returns:
-        Dictionary with verdict key
+        The verdict, or None if verification failed
     """
-    claim = inputs.get("claim")
-    if not claim:
-        logger.warning("No claim provided to verifier")
-        return {}
+    # Claims checked by an earlier request skip verification entirely
+    if settings.verdict_cache_enabled:
+        cached_verdict = await verdict_cache.get(claim)
+        if cached_verdict:
+            return cached_verdict
 
     logger.info(f"Verifying claim: '{claim.claim_text}'")
 
     verifier_payload = {"claim": claim}
 
     try:
-        verifier_result = await claim_verifier_graph.ainvoke(verifier_payload)
+        started = time.perf_counter()
+        with run_scope(run_id):
+            verifier_result = await claim_verifier_graph.ainvoke(verifier_payload)
         verdict = verifier_result.get("verdict")
 
         if verdict:
             logger.info(f"Verdict for '{claim.claim_text}': {verdict.result}")
-            return {"verification_results": [verdict]}
+            if settings.verdict_cache_enabled:
+                await verdict_cache.set(
+                    claim, verdict, time.perf_counter() - started
+                )
+            return verdict
         else:
             logger.warning(f"No verdict returned for claim: '{claim.claim_text}'")
-            return {}
+            return None
     except Exception as e:
         logger.error(f"Error in claim verification: {str(e)}")
+        return None
+
+
+async def claim_verifier_node(inputs: Dict) -> Dict[str, List[Verdict]]:
+    """Process a single claim through the claim verifier.
+
+    The verdict is streamed as soon as it is ready (see fact_checker.progress).
+
+    Args:
+        inputs: Dictionary with the claim to verify and the run id
+
+    Returns:
+        Dictionary with verification_results key
+    """
+    claim = inputs.get("claim")
+    if not claim:
+        logger.warning("No claim provided to verifier")
         return {}
+
+    run_id = inputs.get("run_id")
+    verdict = await verify_claim(claim, run_id)
+    verdicts = [verdict] if verdict else []
+    publish_verdicts(run_id, verdicts, claims_done=1)
+
+    return {"verification_results": verdicts} if verdicts else {}
@@ -0,0 +1,88 @@
+"""Cluster verifier node - verifies a group of related claims together.
+
+Runs one evidence search for the whole group, then evaluates every claim
+against the pooled evidence.
+"""
+
+import logging
+import time
+from typing import Dict, List, Optional
+
+from claim_extractor import ValidatedClaim
+from claim_verifier import Evidence, Verdict, evaluate_claims, evidence_graph
+from utils import settings
+from utils.rate_limit import run_scope
+
+from fact_checker.clustering import make_cluster_claim
+from fact_checker.nodes.claim_verifier import verify_claim
+from fact_checker.progress import publish_verdicts
+from fact_checker.verdict_cache import verdict_cache
+
+logger = logging.getLogger(__name__)
+
+
+async def _verify_cluster(
+    claims: List[ValidatedClaim], run_id: Optional[str]
+) -> List[Verdict]:
+    """Verdicts for the claims that could be verified, cached ones first."""
+    verdicts = []
+    pending = []
+    for claim in claims:
+        cached_verdict = (
+            await verdict_cache.get(claim) if settings.verdict_cache_enabled else None
+        )
+        if cached_verdict:
+            verdicts.append(cached_verdict)
+        else:
+            pending.append(claim)
+
+    if len(pending) == 1:
+        verdict = await verify_claim(pending[0], run_id)
+        return verdicts + [verdict] if verdict else verdicts
+    if not pending:
+        return verdicts
+
+    logger.info(f"Verifying {len(pending)} related claims together")
+
+    try:
+        started = time.perf_counter()
+        with run_scope(run_id):
+            search_result = await evidence_graph.ainvoke(
+                {"claim": make_cluster_claim(pending)}
+            )
+            evidence = [
+                Evidence.model_validate(item)
+                for item in search_result.get("evidence", [])
+            ]
+            cluster_verdicts = await evaluate_claims(pending, evidence)
+    except Exception as e:
+        logger.error(f"Error in cluster verification: {str(e)}")
+        return verdicts
+
+    if settings.verdict_cache_enabled:
+        elapsed_per_claim = (time.perf_counter() - started) / len(pending)
+        for claim, verdict in zip(pending, cluster_verdicts):
+            await verdict_cache.set(claim, verdict, elapsed_per_claim)
+
+    return verdicts + cluster_verdicts
+
+
+async def cluster_verifier_node(inputs: Dict) -> Dict[str, List[Verdict]]:
+    """Verify related claims with shared retrieval and evaluation.
+
+    The verdicts are streamed as soon as they are ready (see
+    fact_checker.progress).
+
+    Args:
+        inputs: Dictionary with the cluster's claims and the run id
+
+    Returns:
+        Dictionary with verification_results key
+    """
+    claims: List[ValidatedClaim] = inputs.get("claims") or []
+    run_id = inputs.get("run_id")
+
+    verdicts = await _verify_cluster(claims, run_id)
+    publish_verdicts(run_id, verdicts, claims_done=len(claims))
+
+    return {"verification_results": verdicts}
@@ -3,20 +3,26 @@
 Sends each claim to a separate verification process.
 """
 
+import asyncio
 import logging
 from typing import List
 
 from langgraph.graph import END
 from langgraph.graph.state import Send
 
+from fact_checker.clustering import cluster_claims
+from fact_checker.config import CLUSTERED_VERIFICATION_CONFIG
 from fact_checker.schemas import State
 
 logger = logging.getLogger(__name__)
 
 
-def dispatch_claims_for_verification(state: State) -> List[Send] | str:
+async def dispatch_claims_for_verification(state: State) -> List[Send] | str:
     """Dispatch extracted claims for parallel verification.
 
+    In clustered mode, claims about the same entities are sent together to
+    the cluster verifier; claims without related ones are verified alone.
+
     Args:
         state: Current workflow state
 
@@ -31,5 +37,18 @@ def dispatch_claims_for_verification(state: State) -> List[Send] | str:
 
     logger.info(f"Dispatching {len(claims)} claims for parallel verification")
 
-    # Create Send objects for each claim to be verified in parallel
-    return [Send("claim_verifier", {"claim": claim}) for claim in claims]
+    if CLUSTERED_VERIFICATION_CONFIG["enabled"]:
+        clusters = await asyncio.to_thread(cluster_claims, claims)
+        return [
+            Send("cluster_verifier", {"claims": cluster, "run_id": state.run_id})
+            if len(cluster) > 1
+            else Send("claim_verifier", {"claim": cluster[0], "run_id": state.run_id})
+            for cluster in clusters
+        ]
+
+    # Create Send objects for each claim to be verified in parallel; their
+    # upstream calls are paced by the process-wide rate scheduler
+    return [
+        Send("claim_verifier", {"claim": claim, "run_id": state.run_id})
+        for claim in claims
+    ]
@@ -4,31 +4,40 @@ import logging
 from typing import Any, Dict
 
 from claim_extractor import graph as claim_extractor_graph
+from langchain_core.runnables import RunnableConfig
+from utils.rate_limit import run_scope
 
+from fact_checker.progress import progress_run_id, start_run
 from fact_checker.schemas import State
 
 logger = logging.getLogger(__name__)
 
 
-async def extract_claims(state: State) -> Dict[str, Any]:
+async def extract_claims(state: State, config: RunnableConfig) -> Dict[str, Any]:
     """Extract claims from the answer text.
 
     Args:
         state: Current workflow state containing text to extract claims from
+        config: Run config, carrying this invocation's run id
 
     Returns:
-        Dictionary with extracted_claims key
+        Dictionary with extracted_claims and run_id keys
     """
     logger.info("Starting claim extraction process")
 
+    # Not state.run_id: that is checkpointed from the thread's previous run
+    run_id = progress_run_id(config)
     extractor_payload = {"answer_text": state.answer}
 
     try:
-        extractor_result = await claim_extractor_graph.ainvoke(extractor_payload)
+        with run_scope(run_id):
+            extractor_result = await claim_extractor_graph.ainvoke(extractor_payload)
         validated_claims = extractor_result.get("validated_claims", [])
         logger.info(f"Extracted {len(validated_claims)} validated claims")
-        return {"extracted_claims": validated_claims}
+        if validated_claims:
+            start_run(run_id, len(validated_claims))
+        return {"extracted_claims": validated_claims, "run_id": run_id}
     except Exception as e:
         logger.error(f"Claim extraction failed: {e}")
         # Return empty list so the pipeline can continue
-        return {"extracted_claims": []}
+        return {"extracted_claims": [], "run_id": run_id}
@@ -8,7 +8,10 @@ from datetime import datetime
 from typing import Dict
 
 from claim_verifier.schemas import VerificationResult
+from fact_checker.progress import finish_run
 from fact_checker.schemas import FactCheckReport, State
+from fact_checker.verdict_cache import get_verdict_cache_stats
+from utils import settings
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +38,12 @@ async def generate_report_node(state: State) -> Dict[str, FactCheckReport]:
             logger.info(f"Verdict for '{verdict.claim_text}': {verdict.result}")
             result_counts[verdict.result] += 1
 
+    # Merged paraphrases cover several sentences; attribute to each of them
+    claims_by_sentence = {}
+    for verdict in state.verification_results:
+        for index in verdict.source_indices or [verdict.original_index]:
+            claims_by_sentence.setdefault(index, []).append(verdict.claim_text)
+
     # Generate summary text
     summary = (
         f"Fact-check complete. Of {len(state.verification_results)} claims verified: "
@@ -47,9 +56,14 @@ async def generate_report_node(state: State) -> Dict[str, FactCheckReport]:
         answer=state.answer,
         claims_verified=len(state.verification_results),
         verified_claims=state.verification_results,
+        claims_by_sentence=dict(sorted(claims_by_sentence.items())),
         summary=summary,
         timestamp=datetime.now(),
     )
 
+    finish_run(state.run_id)
+
     logger.info(f"Report generated: {summary}")
+    if settings.verdict_cache_enabled:
+        logger.info(f"Verdict cache stats: {get_verdict_cache_stats()}")
     return {"final_report": report}
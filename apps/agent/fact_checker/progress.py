@@ -0,0 +1,144 @@
+"""Incremental verdict streaming.
+
+Verdicts are emitted as custom stream events as soon as each verifier branch
+produces them, together with a running summary of the run, so clients see
+results before the final report. Stream the graph with stream_mode="custom"
+(alongside any other modes) to receive them:
+
+    {"type": "summary", "total": 12, "supported": 3, "refuted": 1, "pending": 8}
+    {"type": "verdict", "verdict": {...Verdict fields...}}
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, TypeVar
+from uuid import uuid4
+
+from claim_verifier import Verdict, VerificationResult
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import merge_configs
+from langgraph.config import get_stream_writer
+from langgraph.pregel import Pregel
+
+G = TypeVar("G", bound=Pregel)
+
+logger = logging.getLogger(__name__)
+
+# Configurable key carrying the id of the current invocation (see track_progress)
+PROGRESS_RUN_ID = "progress_run_id"
+
+
+@dataclass
+class RunProgress:
+    """Verification progress of one fact-checking run."""
+
+    total: int
+    done: int = 0
+    supported: int = 0
+    refuted: int = 0
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            "type": "summary",
+            "total": self.total,
+            "supported": self.supported,
+            "refuted": self.refuted,
+            "pending": max(0, self.total - self.done),
+        }
+
+
+# Branches of one run share its progress through the run id
+_runs: Dict[str, RunProgress] = {}
+
+
+def _emit(event: Dict[str, object]) -> None:
+    try:
+        get_stream_writer()(event)
+    except Exception as e:
+        # Called outside a graph run
+        logger.debug(f"Dropping stream event: {e}")
+
+
+def start_run(run_id: Optional[str], total: int) -> None:
+    """Register a run's claims and emit its first summary."""
+    if not run_id:
+        return
+    _runs[run_id] = RunProgress(total=total)
+    _emit(_runs[run_id].summary())
+
+
+def publish_verdicts(
+    run_id: Optional[str], verdicts: List[Verdict], claims_done: int
+) -> None:
+    """Emit new verdicts and the updated run summary.
+
+    Args:
+        run_id: The run the verdicts belong to
+        verdicts: Verdicts just produced
+        claims_done: Claims finished by the branch, including any that failed
+            without a verdict
+    """
+    for verdict in verdicts:
+        _emit({"type": "verdict", "verdict": verdict.model_dump(mode="json")})
+
+    progress = _runs.get(run_id) if run_id else None
+    if progress is None:
+        return
+
+    progress.done += claims_done
+    for verdict in verdicts:
+        if verdict.result == VerificationResult.SUPPORTED:
+            progress.supported += 1
+        elif verdict.result == VerificationResult.REFUTED:
+            progress.refuted += 1
+    _emit(progress.summary())
+
+
+def finish_run(run_id: Optional[str]) -> None:
+    """Forget a finished run."""
+    if run_id:
+        _runs.pop(run_id, None)
+
+
+def progress_run_id(config: Optional[RunnableConfig]) -> str:
+    """The current invocation's run id, or a new one outside track_progress."""
+    configurable = (config or {}).get("configurable") or {}
+    return configurable.get(PROGRESS_RUN_ID) or uuid4().hex
+
+
+_progress_tracked_classes: Dict[type, type] = {}
+
+
+def track_progress(graph: G) -> G:
+    """Give every invocation of a compiled graph its own progress run.
+
+    The run id is new per invocation, so runs on the same thread never share
+    progress, and the run's progress is dropped when it ends, however it ends.
+
+    Args:
+        graph: Compiled fact checker graph
+
+    Returns:
+        A copy of the graph whose astream (and so ainvoke) passes the run id
+        in config["configurable"][PROGRESS_RUN_ID]
+    """
+    base = type(graph)
+    tracked = _progress_tracked_classes.get(base)
+    if tracked is None:
+
+        class ProgressTrackedGraph(base):
+            async def astream(self, input: Any, config=None, **kwargs: Any):
+                run_id = uuid4().hex
+                config = merge_configs(
+                    config, {"configurable": {PROGRESS_RUN_ID: run_id}}
+                )
+                try:
+                    async for chunk in super().astream(input, config, **kwargs):
+                        yield chunk
+                finally:
+                    finish_run(run_id)
+
+        tracked = _progress_tracked_classes[base] = ProgressTrackedGraph
+
+    # Same construction as Pregel.copy, so copies keep the subclass
+    return tracked(**graph.__dict__)
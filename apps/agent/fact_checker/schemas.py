@@ -4,7 +4,7 @@ All the structured types used throughout the orchestration workflow.
 """
 
 from datetime import datetime
-from typing import Annotated, List, Optional
+from typing import Annotated, Dict, List, Optional
 
 from operator import add
 from pydantic import BaseModel, Field
@@ -21,6 +21,10 @@ class FactCheckReport(BaseModel):
     verified_claims: List[Verdict] = Field(
         description="Results for each verified claim"
     )
+    claims_by_sentence: Dict[int, List[str]] = Field(
+        default_factory=dict,
+        description="Texts of the verified claims covering each sentence index",
+    )
     summary: str = Field(description="A concise summary of the fact-checking results")
     timestamp: datetime = Field(
         default_factory=datetime.now, description="When the fact-check was performed"
@@ -31,6 +35,13 @@ class State(BaseModel):
     """The state for the main fact checker workflow."""
 
     answer: str = Field(description="The text to extract claims from")
+    run_id: Optional[str] = Field(
+        default=None,
+        description=(
+            "Id of the current invocation; groups its upstream API calls for fair "
+            "rate limiting and its streamed progress"
+        ),
+    )
     extracted_claims: List[ValidatedClaim] = Field(
         default_factory=list, description="Claims extracted from the text"
     )
@@ -0,0 +1,358 @@
+"""Cross-request verdict cache.
+
+Stores verdicts in Redis so claims that were already checked, verbatim or as
+a near-identical paraphrase, skip the claim verifier entirely.
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+import time
+import unicodedata
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from claim_extractor import ValidatedClaim
+from claim_verifier import Verdict
+from utils import redis_client
+from utils.anchors import claim_anchors, is_negated
+from utils.embeddings import encode_texts
+
+from fact_checker.config import VERDICT_CACHE_CONFIG
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "verdict_cache:"
+
+_CURRENT_EVENTS_PATTERN = re.compile(
+    r"\b(currently|current|now|today|this (week|month|year)|latest|recent(ly)?|"
+    r"ongoing|as of|so far|upcoming|incumbent)\b",
+    re.IGNORECASE,
+)
+_STATISTIC_PATTERN = re.compile(
+    r"\d[\d,.]*\s*(%|percent|million|billion|trillion)|\$\s?\d", re.IGNORECASE
+)
+_YEAR_PATTERN = re.compile(r"\b(19|20)\d{2}\b")
+
+
+def normalize_claim_text(claim_text: str) -> str:
+    """Normalize a claim for exact-match lookups.
+
+    Unicode forms, case, brackets, quotes, whitespace and trailing punctuation
+    are ignored.
+    """
+    text = unicodedata.normalize("NFKC", claim_text).lower()
+    text = re.sub(r"[\[\]\"“”‘’']", "", text)
+    text = re.sub(r"\s+", " ", text)
+    return text.strip().rstrip(".!;:")
+
+
+def _anchors(claim_text: str) -> Tuple[Tuple[Set[str], Set[str]], bool]:
+    """What a neighbour has to share with a claim to reuse its verdict."""
+    return claim_anchors(claim_text), is_negated(claim_text)
+
+
+def classify_claim_type(claim_text: str) -> str:
+    """Pick the TTL bucket for a claim.
+
+    Returns:
+        "current_events", "statistic" or "general"
+    """
+    current_year = datetime.now().year
+    years = {int(match.group(0)) for match in _YEAR_PATTERN.finditer(claim_text)}
+    if _CURRENT_EVENTS_PATTERN.search(claim_text) or any(
+        year >= current_year - 1 for year in years
+    ):
+        return "current_events"
+    if _STATISTIC_PATTERN.search(claim_text):
+        return "statistic"
+    return "general"
+
+
+class CachedVerdict(BaseModel):
+    """A verdict as stored in the cache."""
+
+    verdict: Verdict = Field(description="The cached verdict with its sources")
+    normalized_text: str = Field(description="Normalized text of the claim")
+    claim_type: str = Field(description="TTL bucket the claim was stored under")
+    stored_at: float = Field(description="Unix time the verdict was stored")
+    verification_seconds: float = Field(
+        description="How long the verifier took to produce the verdict"
+    )
+
+
+class VerdictCache:
+    """Redis verdict cache with exact and embedding-neighbourhood lookups.
+
+    Exact hits are keyed on the normalized claim text. For near-identical
+    claims, each entry's embedding is stored next to it and the entry is filed
+    in one random-hyperplane bucket per hash table. Buckets are sorted sets
+    scored by entry expiry, capped at max_bucket_size and purged of expired
+    entries on every lookup, so a lookup reads at most
+    hash_tables * max_bucket_size embeddings however large the cache grows.
+    A neighbour is only reused if it has the same numbers and named entities
+    as the claim (see claim_anchors) and is negated only if the claim is.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: Dict[str, int],
+        similarity_threshold: float = 0.95,
+        hash_bits: int = 10,
+        hash_tables: int = 8,
+        max_bucket_size: int = 32,
+        encoder: str = "all-MiniLM-L6-v2",
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self.hash_bits = hash_bits
+        self.hash_tables = hash_tables
+        self.max_bucket_size = max_bucket_size
+        self.encoder = encoder
+        self._hyperplanes: Optional[np.ndarray] = None
+        self._embeddings_available = True
+        self.exact_hits = 0
+        self.neighbour_hits = 0
+        self.misses = 0
+        self.redis_errors = 0
+        self.hit_age_total = 0.0
+        self.hit_age_max = 0.0
+        self.latency_saved_seconds = 0.0
+
+    @staticmethod
+    def _digest(normalized_text: str) -> str:
+        return hashlib.sha256(normalized_text.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _entry_key(digest: str) -> str:
+        return f"{CACHE_KEY_PREFIX}entry:{digest}"
+
+    @staticmethod
+    def _vector_key(digest: str) -> str:
+        return f"{CACHE_KEY_PREFIX}vector:{digest}"
+
+    @staticmethod
+    def _bucket_key(table: int, bucket: int) -> str:
+        return f"{CACHE_KEY_PREFIX}bucket:{table}:{bucket}"
+
+    async def _embed(self, normalized_text: str) -> Optional[np.ndarray]:
+        """Embed a claim, or None when no encoder is available."""
+        if not self._embeddings_available:
+            return None
+        try:
+            embeddings = await asyncio.to_thread(
+                encode_texts, [normalized_text], self.encoder
+            )
+            return embeddings[0]
+        except Exception as e:
+            self._embeddings_available = False
+            logger.warning(f"Verdict cache neighbour lookups disabled: {e}")
+            return None
+
+    def _bucket_keys(self, embedding: np.ndarray) -> List[str]:
+        """The embedding's bucket in each hash table."""
+        if self._hyperplanes is None or self._hyperplanes.shape[1] != len(embedding):
+            # Fixed seed so every process files embeddings the same way
+            rng = np.random.default_rng(0)
+            self._hyperplanes = rng.standard_normal(
+                (self.hash_tables * self.hash_bits, len(embedding))
+            )
+        bits = (self._hyperplanes @ embedding > 0).reshape(
+            self.hash_tables, self.hash_bits
+        )
+        buckets = bits.astype(np.int64) @ (1 << np.arange(self.hash_bits))
+        return [
+            self._bucket_key(table, int(bucket)) for table, bucket in enumerate(buckets)
+        ]
+
+    def _record_hit(self, entry: CachedVerdict, exact: bool, lookup_seconds: float):
+        age = time.time() - entry.stored_at
+        if exact:
+            self.exact_hits += 1
+        else:
+            self.neighbour_hits += 1
+        self.hit_age_total += age
+        self.hit_age_max = max(self.hit_age_max, age)
+        self.latency_saved_seconds += max(
+            0.0, entry.verification_seconds - lookup_seconds
+        )
+
+    async def get(self, claim: ValidatedClaim) -> Optional[Verdict]:
+        """Look up a verdict for a claim.
+
+        Args:
+            claim: Claim about to be verified
+
+        Returns:
+            The cached verdict re-attributed to this claim, or None
+        """
+        started = time.perf_counter()
+        normalized = normalize_claim_text(claim.claim_text)
+
+        entry = None
+        exact = False
+        try:
+            async with redis_client() as client:
+                raw = await client.get(self._entry_key(self._digest(normalized)))
+                if raw is not None:
+                    entry = CachedVerdict.model_validate_json(raw)
+                    exact = True
+                else:
+                    embedding = await self._embed(normalized)
+                    if embedding is not None:
+                        entry = await self._find_neighbour(
+                            client, embedding, _anchors(claim.claim_text)
+                        )
+        except Exception as e:
+            self.redis_errors += 1
+            logger.warning(f"Verdict cache lookup failed: {e}")
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._record_hit(entry, exact, time.perf_counter() - started)
+        logger.info(
+            f"Verdict cache {'exact' if exact else 'neighbour'} hit for "
+            f"'{claim.claim_text}' (cached as '{entry.verdict.claim_text}')"
+        )
+
+        return entry.verdict.model_copy(
+            update={
+                "claim_text": claim.claim_text,
+                "disambiguated_sentence": claim.disambiguated_sentence,
+                "original_sentence": claim.original_sentence,
+                "original_index": claim.original_index,
+                "source_indices": claim.source_indices or [claim.original_index],
+            }
+        )
+
+    async def _find_neighbour(
+        self,
+        client,
+        embedding: np.ndarray,
+        anchors: Tuple[Tuple[Set[str], Set[str]], bool],
+    ) -> Optional[CachedVerdict]:
+        """Most similar close-enough entry with the same anchors (see _anchors)."""
+        buckets = self._bucket_keys(embedding)
+        async with client.pipeline(transaction=False) as pipe:
+            for bucket_key in buckets:
+                # Members are scored by expiry; drop the expired ones
+                pipe.zremrangebyscore(bucket_key, "-inf", time.time())
+                pipe.zrange(bucket_key, 0, -1)
+            results = await pipe.execute()
+
+        digests = list(
+            dict.fromkeys(
+                member.decode() for members in results[1::2] for member in members
+            )
+        )
+        if not digests:
+            return None
+        vectors = await client.mget([self._vector_key(digest) for digest in digests])
+
+        candidates = []
+        for digest, vector in zip(digests, vectors):
+            if vector is None:
+                continue
+            stored = np.frombuffer(vector, dtype=np.float32)
+            if len(stored) == len(embedding):
+                similarity = float(stored @ embedding)
+                if similarity >= self.similarity_threshold:
+                    candidates.append((similarity, digest))
+
+        for _, digest in sorted(candidates, reverse=True):
+            raw = await client.get(self._entry_key(digest))
+            if raw is None:
+                continue
+            entry = CachedVerdict.model_validate_json(raw)
+            if _anchors(entry.verdict.claim_text) == anchors:
+                return entry
+
+        return None
+
+    async def set(
+        self, claim: ValidatedClaim, verdict: Verdict, verification_seconds: float
+    ) -> None:
+        """Store a verdict.
+
+        Verdicts without sources (evaluation failures, searches that found
+        nothing) are not cached.
+
+        Args:
+            claim: The verified claim
+            verdict: Its verdict
+            verification_seconds: How long verification took
+        """
+        if not verdict.sources:
+            return
+
+        normalized = normalize_claim_text(claim.claim_text)
+        claim_type = classify_claim_type(claim.claim_text)
+        ttl = self.ttl_seconds.get(claim_type, self.ttl_seconds["general"])
+        entry = CachedVerdict(
+            verdict=verdict,
+            normalized_text=normalized,
+            claim_type=claim_type,
+            stored_at=time.time(),
+            verification_seconds=verification_seconds,
+        )
+        digest = self._digest(normalized)
+        embedding = await self._embed(normalized)
+
+        try:
+            async with redis_client() as client:
+                async with client.pipeline(transaction=False) as pipe:
+                    pipe.set(self._entry_key(digest), entry.model_dump_json(), ex=ttl)
+                    if embedding is not None:
+                        pipe.set(
+                            self._vector_key(digest),
+                            np.asarray(embedding, dtype=np.float32).tobytes(),
+                            ex=ttl,
+                        )
+                        for bucket_key in self._bucket_keys(embedding):
+                            pipe.zadd(bucket_key, {digest: entry.stored_at + ttl})
+                            # Keep the latest-expiring max_bucket_size members
+                            pipe.zremrangebyrank(
+                                bucket_key, 0, -(self.max_bucket_size + 1)
+                            )
+                            pipe.expire(bucket_key, max(self.ttl_seconds.values()))
+                    await pipe.execute()
+        except Exception as e:
+            self.redis_errors += 1
+            logger.warning(f"Verdict cache write failed: {e}")
+
+    def stats(self) -> dict:
+        """Hit rate, staleness and latency-saved counters for monitoring."""
+        hits = self.exact_hits + self.neighbour_hits
+        lookups = hits + self.misses
+        return {
+            "exact_hits": self.exact_hits,
+            "neighbour_hits": self.neighbour_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "mean_hit_age_seconds": self.hit_age_total / hits if hits else 0.0,
+            "max_hit_age_seconds": self.hit_age_max,
+            "latency_saved_seconds": self.latency_saved_seconds,
+            "redis_errors": self.redis_errors,
+        }
+
+
+def get_verdict_cache_stats() -> Dict[str, Any]:
+    """Counters of the shared verdict cache."""
+    return verdict_cache.stats()
+
+
+verdict_cache = VerdictCache(
+    ttl_seconds=VERDICT_CACHE_CONFIG["ttl_seconds"],
+    similarity_threshold=VERDICT_CACHE_CONFIG["similarity_threshold"],
+    hash_bits=VERDICT_CACHE_CONFIG["hash_bits"],
+    hash_tables=VERDICT_CACHE_CONFIG["hash_tables"],
+    max_bucket_size=VERDICT_CACHE_CONFIG["max_bucket_size"],
+    encoder=VERDICT_CACHE_CONFIG["encoder"],
+)
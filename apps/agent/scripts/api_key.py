@@ -7,7 +7,7 @@ from typing import Optional
 
 from security.api_keys import (
     generate_secure_api_key,
-    get_api_keys,
+    iter_api_keys,
     revoke_api_key,
     store_api_key,
 )
@@ -51,22 +51,24 @@ async def handle_generate(description: Optional[str] = None) -> None:
 
 
 async def handle_list() -> None:
-    """Handle listing API keys."""
-    api_keys = await get_api_keys()
-
-    if not api_keys:
-        print("📭 No API keys found in Redis.")
-        return
-
-    print(f"📋 Found {len(api_keys)} API key(s):")
-    print("-" * 60)
-
-    for key_data in api_keys:
+    """Handle listing API keys, printing each page as it arrives."""
+    count = 0
+
+    async for key_data in iter_api_keys():
+        if count == 0:
+            print("📋 API keys:")
+            print("-" * 60)
+        count += 1
         print(f"🔑 Key: {key_data['key']}")
         print(f"📝 Description: {key_data['description']}")
         print(f"📅 Created: {key_data['created_at']}")
         print(f"✅ Active: {key_data['active']}")
-        print("-" * 60)
+        print("-" * 60, flush=True)
+
+    if count == 0:
+        print("📭 No API keys found in Redis.")
+    else:
+        print(f"📋 Found {count} API key(s).")
 
 
 async def handle_revoke(api_key: str) -> None:
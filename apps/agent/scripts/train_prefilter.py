@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Train the local selection pre-filter from logged LLM selection decisions."""
+
+import sys
+from pathlib import Path
+
+from claim_extractor.config import PREFILTER_CONFIG
+from claim_extractor.prefilter import (
+    EmbeddingPrefilter,
+    PrefilterDecision,
+    classify_sentences,
+    load_selection_log,
+)
+
+
+def print_usage() -> None:
+    """Print usage information."""
+    print("""
+    🧪 Selection Pre-filter Trainer
+
+    Usage:
+        python train_prefilter.py <decision_log.jsonl> [model_path]
+
+    The decision log is written by the selection node when
+    PREFILTER_CONFIG["decision_log_path"] is set. The model is saved to
+    PREFILTER_CONFIG["model_path"] unless a path is given.
+    """)
+
+
+def main() -> None:
+    """Train, report held-out quality at the configured threshold, and save."""
+    if len(sys.argv) < 2:
+        print_usage()
+        return
+
+    log_path = sys.argv[1]
+    model_path = sys.argv[2] if len(sys.argv) > 2 else PREFILTER_CONFIG["model_path"]
+    threshold = PREFILTER_CONFIG["threshold"]
+
+    sentences, labels = load_selection_log(log_path)
+    if len(set(labels)) < 2:
+        print("❌ Need both selected and rejected sentences in the log to train.")
+        return
+
+    print(f"📋 Loaded {len(sentences)} labelled sentences ({sum(labels)} selected)")
+
+    # Hold out every fifth sentence to measure the decided-path accuracy
+    train = [i for i in range(len(sentences)) if i % 5]
+    held_out = [i for i in range(len(sentences)) if not i % 5]
+
+    if held_out and len(set(labels[i] for i in train)) == 2:
+        prefilter = EmbeddingPrefilter().fit(
+            [sentences[i] for i in train], [labels[i] for i in train]
+        )
+        decisions = classify_sentences(
+            prefilter, [sentences[i] for i in held_out], threshold
+        )
+        decided = [
+            (decision == PrefilterDecision.VERIFIABLE, labels[i])
+            for decision, i in zip(decisions, held_out)
+            if decision != PrefilterDecision.UNCERTAIN
+        ]
+        correct = sum(predicted == actual for predicted, actual in decided)
+        print(
+            f"📊 Threshold {threshold}: {len(decided)}/{len(held_out)} held-out "
+            f"sentences decided locally, {correct}/{len(decided) or 1} correct"
+        )
+
+    prefilter = EmbeddingPrefilter().fit(sentences, labels)
+    Path(model_path).parent.mkdir(parents=True, exist_ok=True)
+    prefilter.save(model_path)
+    print(f"✅ Pre-filter saved to {model_path}")
+
+
+if __name__ == "__main__":
+    main()
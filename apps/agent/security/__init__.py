@@ -1,17 +1,28 @@
 """Security utilities for authentication and API key management."""
 
 from .api_keys import (
+    api_key_digest,
     generate_secure_api_key,
     get_api_keys,
+    iter_api_keys,
     revoke_api_key,
     store_api_key,
     validate_api_key,
 )
+from .key_cache import ApiKeyCache, api_key_cache
+from .limits import KeyLimiter, LimitExceeded, key_limiter
 
 __all__ = [
+    "api_key_digest",
     "generate_secure_api_key",
     "get_api_keys",
+    "iter_api_keys",
     "revoke_api_key",
     "store_api_key",
     "validate_api_key",
+    "ApiKeyCache",
+    "api_key_cache",
+    "KeyLimiter",
+    "LimitExceeded",
+    "key_limiter",
 ]
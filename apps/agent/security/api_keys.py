@@ -1,8 +1,10 @@
 """API key management utilities for generation, storage, and validation."""
 
+import hashlib
 import secrets
 import string
 from datetime import datetime
+from typing import AsyncIterator
 
 from utils.redis import redis_client
 
@@ -10,16 +12,23 @@ from utils.redis import redis_client
 API_KEY_LENGTH = 32
 API_KEY_PREFIX = "api_key:"
 API_KEYS_SET = "api_keys"
+# Published with a key's digest whenever its validity may have changed
+API_KEY_INVALIDATION_CHANNEL = "api_keys:invalidate"
 ALPHABET = string.ascii_letters + string.digits
 
 
+def api_key_digest(api_key: str) -> str:
+    """SHA-256 of an API key, used to refer to keys without exposing them."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
 def generate_secure_api_key(length: int = API_KEY_LENGTH) -> str:
     """Generate a cryptographically secure API key."""
     return "".join(secrets.choice(ALPHABET) for _ in range(length))
 
 
 async def store_api_key(api_key: str, description: str = "") -> None:
-    """Store API key in Redis with metadata."""
+    """Store API key in Redis with metadata (in one transaction)."""
     async with redis_client() as client:
         key_data = {
             "created_at": datetime.now().isoformat(),
@@ -27,45 +36,78 @@ async def store_api_key(api_key: str, description: str = "") -> None:
             "active": "true",
         }
 
-        await client.hset(f"{API_KEY_PREFIX}{api_key}", mapping=key_data)
-        await client.sadd(API_KEYS_SET, api_key)
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.hset(f"{API_KEY_PREFIX}{api_key}", mapping=key_data)
+            pipe.sadd(API_KEYS_SET, api_key)
+            pipe.publish(API_KEY_INVALIDATION_CHANNEL, api_key_digest(api_key))
+            await pipe.execute()
 
 
-async def get_api_keys() -> list[dict]:
-    """Get all stored API keys with their metadata."""
+def _decode_key_data(api_key: str, key_data: dict) -> dict:
+    return {
+        "key": api_key,
+        "description": key_data.get(b"description", b"").decode(),
+        "created_at": key_data.get(b"created_at", b"").decode(),
+        "active": key_data.get(b"active", b"").decode(),
+    }
+
+
+async def iter_api_keys(batch_size: int = 500) -> AsyncIterator[dict]:
+    """Stream stored API keys with their metadata.
+
+    Walks the key set with SSCAN and fetches each page's metadata in one
+    pipelined round-trip, so Redis is never blocked by a full SMEMBERS and
+    memory stays bounded by the page size. SSCAN may return a key on more
+    than one page (e.g. while the set is rehashed), so a key can rarely be
+    yielded twice.
+
+    Args:
+        batch_size: SSCAN page size hint
+
+    Yields:
+        Key metadata dicts, in no particular order
+    """
     async with redis_client() as client:
-        api_keys = await client.smembers(API_KEYS_SET)
+        cursor = 0
+        while True:
+            cursor, members = await client.sscan(
+                API_KEYS_SET, cursor, count=batch_size
+            )
+            page = list(dict.fromkeys(member.decode() for member in members))
+
+            if page:
+                async with client.pipeline(transaction=False) as pipe:
+                    for api_key in page:
+                        pipe.hgetall(f"{API_KEY_PREFIX}{api_key}")
+                    results = await pipe.execute()
 
-        if not api_keys:
-            return []
+                for api_key, key_data in zip(page, results):
+                    if key_data:
+                        yield _decode_key_data(api_key, key_data)
 
-        keys_data = []
-        for api_key in api_keys:
-            key_str = api_key.decode()
-            key_data = await client.hgetall(f"{API_KEY_PREFIX}{key_str}")
+            if cursor == 0:
+                break
 
-            if key_data:
-                keys_data.append(
-                    {
-                        "key": key_str,
-                        "description": key_data.get(b"description", b"").decode(),
-                        "created_at": key_data.get(b"created_at", b"").decode(),
-                        "active": key_data.get(b"active", b"").decode(),
-                    }
-                )
 
-        return keys_data
+async def get_api_keys() -> list[dict]:
+    """Get all stored API keys with their metadata."""
+    keys = {}
+    async for key_data in iter_api_keys():
+        keys[key_data["key"]] = key_data
+    return list(keys.values())
 
 
 async def revoke_api_key(api_key: str) -> bool:
     """Revoke an API key by removing it from Redis. Returns True if key existed."""
     async with redis_client() as client:
-        if not await client.exists(f"{API_KEY_PREFIX}{api_key}"):
-            return False
-
-        await client.delete(f"{API_KEY_PREFIX}{api_key}")
-        await client.srem(API_KEYS_SET, api_key)
-        return True
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.delete(f"{API_KEY_PREFIX}{api_key}")
+            pipe.srem(API_KEYS_SET, api_key)
+            # Drop the key from every process's validation cache
+            pipe.publish(API_KEY_INVALIDATION_CHANNEL, api_key_digest(api_key))
+            deleted, _, _ = await pipe.execute()
+
+        return bool(deleted)
 
 
 async def validate_api_key(api_key: str) -> bool:
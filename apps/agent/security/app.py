@@ -0,0 +1,43 @@
+"""Custom HTTP app mounted into the LangGraph server.
+
+Its middleware wraps every route, including the built-in ones, and adds the
+per-API-key limit state gathered during authentication and run admission
+(see security/limits.py) to the response headers.
+"""
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from security.limits import limit_headers_scope
+
+
+class LimitHeadersMiddleware:
+    """Return the limit state of the request's API key in response headers."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with limit_headers_scope() as limit_headers:
+
+            async def send_with_limits(message: Message) -> None:
+                if message["type"] == "http.response.start" and limit_headers:
+                    headers = list(message.get("headers", []))
+                    present = {name.lower() for name, _ in headers}
+                    for name, value in limit_headers.items():
+                        encoded = name.lower().encode("latin-1")
+                        # Error responses already carry them
+                        if encoded not in present:
+                            headers.append((encoded, value.encode("latin-1")))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_limits)
+
+
+app = Starlette(middleware=[Middleware(LimitHeadersMiddleware)])
@@ -1,33 +1,21 @@
-import redis.asyncio as redis
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator
-
 from langgraph_sdk import Auth
-from utils.settings import settings
-from security.api_keys import API_KEY_PREFIX
+from utils.quota import API_KEY_ID_METADATA, RUN_LEASE_METADATA
+
+from security.api_keys import API_KEY_PREFIX, api_key_digest
+from security.key_cache import api_key_cache
+from security.limits import LimitExceeded, key_limiter
 
 auth = Auth()
 
 BEARER_SCHEME = "bearer"
 
-
-@asynccontextmanager
-async def redis_client() -> AsyncGenerator[redis.Redis, None]:
-    """Redis client context manager for proper connection handling."""
-    client = redis.from_url(str(settings.redis_uri))
-    try:
-        yield client
-    finally:
-        await client.aclose()
+# Hex digits of the key digest used to identify a key in limits and run metadata
+KEY_ID_LENGTH = 16
 
 
 async def _verify_api_key(api_key: str) -> bool:
-    """Verify API key exists in Redis."""
-    try:
-        async with redis_client() as client:
-            return bool(await client.exists(f"{API_KEY_PREFIX}{api_key}"))
-    except redis.RedisError:
-        return False
+    """Verify API key exists and is active (cached in process)."""
+    return await api_key_cache.is_valid(api_key)
 
 
 def _parse_authorization(authorization: str) -> str:
@@ -46,9 +34,13 @@ def _parse_authorization(authorization: str) -> str:
     return token
 
 
+def _too_many_requests(error: LimitExceeded) -> Auth.exceptions.HTTPException:
+    return Auth.exceptions.HTTPException(429, error.detail, headers=error.headers)
+
+
 @auth.authenticate
 async def get_current_user(authorization: str | None) -> Auth.types.MinimalUserDict:
-    """Authenticate user via API key stored in Redis."""
+    """Authenticate user via API key stored in Redis and apply its rate limit."""
     if not authorization:
         raise Auth.exceptions.HTTPException(401, "Missing authorization header")
 
@@ -57,4 +49,40 @@ async def get_current_user(authorization: str | None) -> Auth.types.MinimalUserD
     if not await _verify_api_key(token):
         raise Auth.exceptions.HTTPException(401, "Invalid API key")
 
-    return {"identity": f"{API_KEY_PREFIX}{token[:8]}..."}
+    key_id = api_key_digest(token)[:KEY_ID_LENGTH]
+    try:
+        await key_limiter.check_request(key_id)
+    except LimitExceeded as e:
+        raise _too_many_requests(e)
+
+    return {"identity": f"{API_KEY_PREFIX}{token[:8]}...", "api_key_id": key_id}
+
+
+@auth.on.threads.create_run
+async def admit_run(ctx: Auth.types.AuthContext, value: Auth.types.RunsCreate) -> None:
+    """Admit a run against its key's concurrency cap and token budget.
+
+    The key id and the run's lease id are added to the run metadata, so the
+    run can charge its token usage and hold its concurrency slot while it runs.
+    """
+    try:
+        key_id = ctx.user[API_KEY_ID_METADATA]
+    except (KeyError, TypeError):
+        # Not authenticated with an API key (e.g. LangGraph Studio)
+        return
+
+    run_id = value.get("run_id")
+    try:
+        lease = await key_limiter.admit_run(
+            key_id, str(run_id) if run_id else None
+        )
+    except LimitExceeded as e:
+        raise _too_many_requests(e)
+
+    tags = {API_KEY_ID_METADATA: key_id, RUN_LEASE_METADATA: lease}
+    value["metadata"] = {**(value.get("metadata") or {}), **tags}
+
+    # The graph reads them from its config metadata
+    config = (value.get("kwargs") or {}).get("config")
+    if isinstance(config, dict):
+        config["metadata"] = {**(config.get("metadata") or {}), **tags}
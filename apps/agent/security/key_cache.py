@@ -0,0 +1,173 @@
+"""In-process API key validation cache.
+
+Remembers recent validation results (valid for a while, invalid for a
+shorter while), so most requests authenticate without touching Redis.
+Entries are dropped as soon as a key is revoked anywhere: revoke_api_key
+publishes the key's digest on a Redis channel every process listens to.
+Positive results are only trusted while that subscription is live.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from redis.exceptions import RedisError
+from utils.redis import create_subscriber_client
+from utils.settings import settings
+
+from security.api_keys import (
+    API_KEY_INVALIDATION_CHANNEL,
+    api_key_digest,
+    validate_api_key,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before resubscribing after the listener loses Redis
+RESUBSCRIBE_DELAY = 1.0
+
+# Longest wait for a message before the subscription's health is checked
+LISTEN_POLL_SECONDS = 5.0
+
+
+class ApiKeyCache:
+    """TTL cache of API key validity with pub/sub invalidation.
+
+    Args:
+        ttl_seconds: How long a valid key is trusted
+        negative_ttl_seconds: How long an invalid key is rejected locally
+        max_entries: Least recently used entries beyond this are evicted
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60.0,
+        negative_ttl_seconds: float = 10.0,
+        max_entries: int = 10000,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        # digest -> (valid, expires_at)
+        self._entries: "OrderedDict[str, Tuple[bool, float]]" = OrderedDict()
+        self._listener: Optional[asyncio.Task] = None
+        self._listener_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._subscribed = False
+        # Set until the first subscription after a (re)connect is confirmed
+        self._resync_needed = True
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    async def is_valid(self, api_key: str) -> bool:
+        """Whether an API key exists and is active.
+
+        Args:
+            api_key: The key presented by the client
+
+        Returns:
+            True if the key is valid; Redis errors count as invalid
+        """
+        self._ensure_listener()
+        digest = api_key_digest(api_key)
+
+        entry = self._entries.get(digest)
+        if entry is not None:
+            valid, expires_at = entry
+            # Without the invalidation channel a revoked key could linger
+            if time.monotonic() < expires_at and (self._subscribed or not valid):
+                self._entries.move_to_end(digest)
+                self.hits += 1
+                return valid
+            self._entries.pop(digest, None)
+
+        self.misses += 1
+        invalidations_before = self.invalidations
+        try:
+            valid = await validate_api_key(api_key)
+        except RedisError as e:
+            logger.warning(f"API key validation failed: {e}")
+            return False
+
+        # A revocation that raced the lookup may have made the result stale
+        if self.invalidations != invalidations_before:
+            return valid
+
+        ttl = self.ttl_seconds if valid else self.negative_ttl_seconds
+        self._entries[digest] = (valid, time.monotonic() + ttl)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return valid
+
+    def invalidate(self, digest: str) -> None:
+        """Drop the cached result for a key digest."""
+        self._entries.pop(digest, None)
+        self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        self._entries.clear()
+
+    def _ensure_listener(self) -> None:
+        loop = asyncio.get_running_loop()
+        listener = self._listener
+        if self._listener_loop is loop and listener and not listener.done():
+            return
+        self._subscribed = False
+        self._listener_loop = loop
+        self._listener = loop.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        while True:
+            client = create_subscriber_client()
+            try:
+                async with client.pubsub() as pubsub:
+                    await pubsub.subscribe(API_KEY_INVALIDATION_CHANNEL)
+                    while True:
+                        # Returning between messages lets the health check run
+                        message = await pubsub.get_message(
+                            timeout=LISTEN_POLL_SECONDS
+                        )
+                        if message is not None:
+                            self._handle(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"API key invalidation listener disconnected: {e}")
+            finally:
+                self._subscribed = False
+                self._resync_needed = True
+                await client.aclose()
+            await asyncio.sleep(RESUBSCRIBE_DELAY)
+
+    def _handle(self, message: Dict) -> None:
+        if message["type"] == "subscribe":
+            if self._resync_needed:
+                # Revocations may have been missed while disconnected
+                self.clear()
+                self._resync_needed = False
+            self._subscribed = True
+        elif message["type"] == "message":
+            data = message["data"]
+            self.invalidate(data.decode() if isinstance(data, bytes) else data)
+
+    def stats(self) -> dict:
+        """Cache counters and listener state."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "subscribed": self._subscribed,
+        }
+
+
+api_key_cache = ApiKeyCache(
+    ttl_seconds=settings.api_key_cache_ttl_seconds,
+    negative_ttl_seconds=settings.api_key_cache_negative_ttl_seconds,
+    max_entries=settings.api_key_cache_max_entries,
+)
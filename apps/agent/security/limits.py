@@ -0,0 +1,217 @@
+"""Per-API-key limits enforced at authentication time.
+
+Every authenticated request counts against a sliding-window request rate.
+Creating a run additionally needs a free concurrency slot and some token
+budget left. Slots are leases that the run takes when it starts and gives
+back when it finishes (or that expire), and the budget is charged with the
+tokens the run's LLM calls report (see utils/quota.py). The state is kept in
+Redis, so it holds across server processes.
+
+The current state of each limit is collected for the request being served
+and returned in response headers by the middleware in security/app.py.
+Limits fail open when Redis is unreachable.
+"""
+
+import logging
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+from uuid import uuid4
+
+from redis.exceptions import RedisError
+from utils.quota import (
+    count_run_leases,
+    get_token_usage,
+    request_window_key,
+    token_budget_window,
+)
+from utils.redis import redis_client
+from utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Headers describing the limits checked for the request being served
+_response_headers: ContextVar[Optional[Dict[str, str]]] = ContextVar(
+    "limit_response_headers", default=None
+)
+
+
+class LimitExceeded(Exception):
+    """An API key is over one of its limits.
+
+    Args:
+        detail: What was exceeded, for the error response
+        headers: Limit state, including Retry-After when it is known
+    """
+
+    def __init__(self, detail: str, headers: Dict[str, str]):
+        super().__init__(detail)
+        self.detail = detail
+        self.headers = headers
+
+
+@contextmanager
+def limit_headers_scope() -> Iterator[Dict[str, str]]:
+    """Collect the limit headers produced while serving one request."""
+    headers: Dict[str, str] = {}
+    token = _response_headers.set(headers)
+    try:
+        yield headers
+    finally:
+        _response_headers.reset(token)
+
+
+def _publish(headers: Dict[str, str]) -> None:
+    collected = _response_headers.get()
+    if collected is not None:
+        collected.update(headers)
+
+
+def _seconds(value: float) -> str:
+    return str(max(0, math.ceil(value)))
+
+
+class KeyLimiter:
+    """Redis-backed request, concurrency and token limits per API key.
+
+    Args:
+        requests_per_window: Requests allowed per sliding window
+        request_window_seconds: Length of the request window
+        max_concurrent_runs: Runs a key may have in flight
+        token_budget: LLM tokens a key may spend per budget window (the
+            window length is API_KEY_TOKEN_BUDGET_WINDOW_SECONDS)
+
+    A limit of 0 disables it.
+    """
+
+    def __init__(
+        self,
+        requests_per_window: int = 120,
+        request_window_seconds: int = 60,
+        max_concurrent_runs: int = 4,
+        token_budget: int = 1000000,
+    ):
+        self.requests_per_window = requests_per_window
+        self.request_window_seconds = request_window_seconds
+        self.max_concurrent_runs = max_concurrent_runs
+        self.token_budget = token_budget
+
+    async def check_request(self, key_id: str) -> None:
+        """Count a request against the key's sliding window.
+
+        Args:
+            key_id: API key id
+
+        Raises:
+            LimitExceeded: If the window is full; the request is not counted
+        """
+        if not self.requests_per_window:
+            return
+
+        key = request_window_key(key_id)
+        now = time.time()
+        member = f"{now}:{uuid4().hex[:8]}"
+        try:
+            async with redis_client() as client:
+                async with client.pipeline(transaction=True) as pipe:
+                    pipe.zremrangebyscore(key, 0, now - self.request_window_seconds)
+                    pipe.zadd(key, {member: now})
+                    pipe.zcard(key)
+                    pipe.zrange(key, 0, 0, withscores=True)
+                    pipe.expire(key, self.request_window_seconds)
+                    _, _, count, oldest, _ = await pipe.execute()
+                if count > self.requests_per_window:
+                    await client.zrem(key, member)
+        except RedisError as e:
+            logger.warning(f"Request limit check failed for key {key_id}: {e}")
+            return
+
+        oldest_at = oldest[0][1] if oldest else now
+        reset = oldest_at + self.request_window_seconds - now
+        headers = {
+            "X-RateLimit-Limit": str(self.requests_per_window),
+            "X-RateLimit-Remaining": str(max(0, self.requests_per_window - count)),
+            "X-RateLimit-Reset": _seconds(reset),
+        }
+        _publish(headers)
+
+        if count > self.requests_per_window:
+            raise LimitExceeded(
+                "Request rate limit exceeded",
+                {**headers, "Retry-After": _seconds(reset)},
+            )
+
+    async def admit_run(self, key_id: str, run_id: Optional[str] = None) -> str:
+        """Admit a new run against the key's token budget and concurrency cap.
+
+        The run takes its slot only once it starts (see
+        utils.quota.hold_run_slot), so a run whose creation fails after
+        admission holds none.
+
+        Args:
+            key_id: API key id
+            run_id: Run being created, used as the lease id when given
+
+        Returns:
+            Lease id the run holds its slot under
+
+        Raises:
+            LimitExceeded: If the budget is spent or every slot is taken
+        """
+        await self._check_token_budget(key_id)
+
+        lease = run_id or uuid4().hex
+        if not self.max_concurrent_runs:
+            return lease
+
+        try:
+            active = await count_run_leases(key_id)
+        except RedisError as e:
+            logger.warning(f"Concurrency check failed for key {key_id}: {e}")
+            return lease
+
+        headers = {
+            "X-Concurrency-Limit": str(self.max_concurrent_runs),
+            "X-Concurrency-Remaining": str(
+                max(0, self.max_concurrent_runs - active - 1)
+            ),
+        }
+        _publish(headers)
+
+        if active >= self.max_concurrent_runs:
+            raise LimitExceeded("Too many concurrent runs", headers)
+        return lease
+
+    async def _check_token_budget(self, key_id: str) -> None:
+        if not self.token_budget:
+            return
+
+        try:
+            used = await get_token_usage(key_id)
+        except RedisError as e:
+            logger.warning(f"Token budget check failed for key {key_id}: {e}")
+            return
+
+        window = settings.api_key_token_budget_window_seconds
+        reset = (token_budget_window() + 1) * window - time.time()
+        headers = {
+            "X-TokenBudget-Limit": str(self.token_budget),
+            "X-TokenBudget-Remaining": str(max(0, self.token_budget - used)),
+            "X-TokenBudget-Reset": _seconds(reset),
+        }
+        _publish(headers)
+
+        if used >= self.token_budget:
+            raise LimitExceeded(
+                "Token budget exhausted", {**headers, "Retry-After": _seconds(reset)}
+            )
+
+
+key_limiter = KeyLimiter(
+    requests_per_window=settings.api_key_requests_per_window,
+    request_window_seconds=settings.api_key_request_window_seconds,
+    max_concurrent_runs=settings.api_key_max_concurrent_runs,
+    token_budget=settings.api_key_token_budget,
+)
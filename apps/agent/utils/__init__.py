@@ -3,35 +3,105 @@
 Common tools shared across all components.
 """
 
+from .anchors import claim_anchors, extract_entities, is_negated
+from .cache import LLMResponseCache, llm_cache
+from .embeddings import cosine_similarity_matrix, encode_texts, get_sentence_encoder
 from .llm import (
+    VotingStats,
     call_llm_with_structured_output,
+    get_structured_llm,
+    precompile_structured_outputs,
     process_with_voting,
+    vote_on_item,
     estimate_token_count,
+    pack_batches,
+    pack_to_token_budget,
     truncate_evidence_for_token_limit,
 )
-from .models import get_llm, get_default_llm
-from .redis import redis_client, test_redis_connection
+from .metrics import LatencyHistogram
+from .models import get_default_llm, get_http_async_client, get_llm, get_pool_stats
+from .quota import (
+    RunSlotUnavailable,
+    hold_run_slot,
+    record_token_usage,
+    track_run_slot,
+)
+from .rate_limit import RateScheduler, rate_scheduler, run_scope
+from .redis import (
+    close_redis_pool,
+    create_subscriber_client,
+    get_redis,
+    get_redis_pool,
+    get_redis_pool_stats,
+    redis_client,
+    test_redis_connection,
+)
 from .settings import settings
-from .text import remove_following_sentences
+from .tokenizer import (
+    count_prompt_tokens,
+    count_tokens,
+    get_tokenizer,
+    set_tokenizer,
+    truncate_to_tokens,
+)
 
 __all__ = [
     # Checkpointer utilities
     "create_checkpointer",
     "setup_checkpointer",
     "create_checkpointer_sync",
+    # Claim anchors
+    "claim_anchors",
+    "extract_entities",
+    "is_negated",
+    # LLM response cache
+    "LLMResponseCache",
+    "llm_cache",
     # LLM utilities
     "call_llm_with_structured_output",
+    "get_structured_llm",
+    "precompile_structured_outputs",
     "process_with_voting",
+    "VotingStats",
+    "vote_on_item",
     "estimate_token_count",
+    "pack_batches",
+    "pack_to_token_budget",
     "truncate_evidence_for_token_limit",
+    # Sentence embeddings
+    "get_sentence_encoder",
+    "encode_texts",
+    "cosine_similarity_matrix",
     # LLM models
     "get_llm",
     "get_default_llm",
+    "get_http_async_client",
+    "get_pool_stats",
+    # Metrics
+    "LatencyHistogram",
+    # Per-API-key usage accounting
+    "record_token_usage",
+    "hold_run_slot",
+    "RunSlotUnavailable",
+    "track_run_slot",
+    # Upstream rate limiting
+    "RateScheduler",
+    "rate_scheduler",
+    "run_scope",
     # Redis utilities
     "redis_client",
+    "get_redis",
+    "get_redis_pool",
+    "get_redis_pool_stats",
+    "close_redis_pool",
+    "create_subscriber_client",
     "test_redis_connection",
     # Settings
     "settings",
-    # Text utilities
-    "remove_following_sentences",
+    # Token counting
+    "count_tokens",
+    "count_prompt_tokens",
+    "get_tokenizer",
+    "set_tokenizer",
+    "truncate_to_tokens",
 ]
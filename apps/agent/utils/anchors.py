@@ -0,0 +1,90 @@
+"""Lexical anchors of a claim: its numbers, named entities and negation.
+
+Claims that differ only in a date, figure, name or a "not" embed almost
+identically, so anything that treats near-identical embeddings as the same
+claim (paraphrase merging, the verdict cache) also compares these.
+"""
+
+import re
+from typing import Set, Tuple
+
+_NUMBER_PATTERN = re.compile(r"\d+(?:[.,]\d+)*")
+
+_NEGATION_PATTERN = re.compile(
+    r"\b(not|no|never|none|nobody|nothing|neither|nor|without|cannot)\b|n['’]t\b",
+    re.IGNORECASE,
+)
+
+# Runs of capitalized words (allowing "of"/"the" inside), optionally followed
+# by a number, e.g. "Apollo 11", "Bank of England", "NASA"
+_ENTITY_PATTERN = re.compile(
+    r"[A-Z][\w'’.&-]*(?:\s+(?:(?:of|the|de|and)\s+)?[A-Z][\w'’.&-]*)*(?:\s+\d+)?"
+)
+
+# Capitalized only because they open a sentence
+_NON_ENTITIES = set(
+    "a an the this that these those it its in on at by for from to of and or but "
+    "he she they we i you his her their our there here during after before "
+    "while when if as some many most all several according however also".split()
+)
+
+
+def _is_sentence_start(text: str, position: int) -> bool:
+    prefix = text[:position].rstrip(" \"'“‘([")
+    return not prefix or prefix.endswith((".", "!", "?"))
+
+
+def _capitalized_elsewhere(text: str, word: str, position: int) -> bool:
+    return any(
+        match.start() != position and not _is_sentence_start(text, match.start())
+        for match in re.finditer(rf"\b{re.escape(word)}\b", text)
+    )
+
+
+def extract_entities(text: str) -> Set[str]:
+    """Lowercased named-entity-like spans of a claim.
+
+    A single capitalized word opening a sentence ("Studies show...",
+    "Revenue rose...") only counts if it is all caps or also capitalized
+    elsewhere in the text.
+    """
+    entities = set()
+    for match in _ENTITY_PATTERN.finditer(text):
+        words = match.group(0).rstrip(".").split()
+        position = match.start()
+        while words and words[0].lower() in _NON_ENTITIES:
+            position = text.index(words[1], position) if len(words) > 1 else -1
+            words = words[1:]
+        # Nothing left, or only a number ("In 1969")
+        if not words or not words[0][:1].isupper():
+            continue
+
+        word = words[0]
+        if (
+            len(words) == 1
+            and position == match.start()
+            and _is_sentence_start(text, position)
+            and not (word.isupper() and len(word) > 1)
+            and not _capitalized_elsewhere(text, word, position)
+        ):
+            continue
+        entities.add(" ".join(words).lower())
+    return entities
+
+
+def claim_anchors(claim_text: str) -> Tuple[Set[str], Set[str]]:
+    """Numbers and named entities of a claim.
+
+    Paraphrases share them; claims that differ only in a date, figure or name
+    ("landed in 1969" vs "landed in 1970") embed almost identically but do not.
+    """
+    numbers = {
+        match.group(0).replace(",", "")
+        for match in _NUMBER_PATTERN.finditer(claim_text)
+    }
+    return numbers, extract_entities(claim_text)
+
+
+def is_negated(claim_text: str) -> bool:
+    """Whether a claim contains a negation ("not", "never", "didn't", ...)."""
+    return _NEGATION_PATTERN.search(claim_text) is not None
@@ -0,0 +1,178 @@
+"""LLM response caching.
+
+Content-addressed, two-tier cache for structured LLM outputs: an in-process
+LRU in front of a shared Redis tier.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Optional, Tuple, Type, TypeVar
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.prompt_values import PromptValue
+from pydantic import BaseModel
+
+from .redis import redis_client
+from .settings import settings
+
+M = TypeVar("M", bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "llm_cache:"
+
+
+@lru_cache(maxsize=None)
+def _schema_fingerprint(output_class: Type[BaseModel]) -> str:
+    """Hash the JSON schema of an output class (computed once per class)."""
+    schema = json.dumps(output_class.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode("utf-8")).hexdigest()
+
+
+def _serialize_messages(messages: Any) -> str:
+    """Turn tuples, BaseMessages or a PromptValue into a stable string."""
+    if isinstance(messages, PromptValue):
+        messages = messages.to_messages()
+
+    parts = []
+    for message in messages:
+        if isinstance(message, BaseMessage):
+            parts.append((message.type, message.content))
+        else:
+            role, content = message
+            parts.append((role, content))
+
+    return json.dumps(parts, sort_keys=True, default=str)
+
+
+def _model_identity(llm: BaseChatModel) -> Tuple[str, Optional[float]]:
+    """Get the model name and temperature an LLM instance was built with."""
+    model_name = (
+        getattr(llm, "model_name", None)
+        or getattr(llm, "model", None)
+        or type(llm).__name__
+    )
+    return str(model_name), getattr(llm, "temperature", None)
+
+
+class LLMResponseCache:
+    """Two-tier (local LRU + Redis) cache for structured LLM responses.
+
+    Entries are keyed on the model name, temperature, output schema and a
+    hash of the message list, so a hit is only possible for an identical
+    request. Values are stored as JSON and re-validated on read.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: int = 86400,
+        use_redis: bool = True,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.use_redis = use_redis
+        self._entries: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.redis_errors = 0
+
+    @staticmethod
+    def make_key(
+        llm: BaseChatModel, output_class: Type[BaseModel], messages: Any
+    ) -> str:
+        """Build the content-addressed key for a request."""
+        model_name, temperature = _model_identity(llm)
+        payload = "|".join(
+            [
+                model_name,
+                repr(temperature),
+                f"{output_class.__module__}.{output_class.__qualname__}",
+                _schema_fingerprint(output_class),
+                _serialize_messages(messages),
+            ]
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str, output_class: Type[M]) -> Optional[M]:
+        """Look up a response, checking the local tier before Redis."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, raw = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.local_hits += 1
+                return output_class.model_validate_json(raw)
+            del self._entries[key]
+
+        if self.use_redis:
+            try:
+                async with redis_client() as client:
+                    raw = await client.get(f"{CACHE_KEY_PREFIX}{key}")
+            except Exception as e:
+                self.redis_errors += 1
+                logger.warning(f"LLM cache Redis lookup failed: {e}")
+                raw = None
+
+            if raw is not None:
+                self.redis_hits += 1
+                raw = raw.decode() if isinstance(raw, bytes) else raw
+                self._store_local(key, raw)
+                return output_class.model_validate_json(raw)
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: BaseModel) -> None:
+        """Store a response in both tiers."""
+        raw = value.model_dump_json()
+        self._store_local(key, raw)
+
+        if self.use_redis:
+            try:
+                async with redis_client() as client:
+                    await client.set(
+                        f"{CACHE_KEY_PREFIX}{key}", raw, ex=self.ttl_seconds
+                    )
+            except Exception as e:
+                self.redis_errors += 1
+                logger.warning(f"LLM cache Redis write failed: {e}")
+
+    def clear(self) -> None:
+        """Drop all local entries (Redis entries expire via TTL)."""
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss counters for monitoring."""
+        lookups = self.local_hits + self.redis_hits + self.misses
+        hits = self.local_hits + self.redis_hits
+        return {
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "redis_errors": self.redis_errors,
+            "size": len(self._entries),
+        }
+
+    def _store_local(self, key: str, raw: str) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, raw)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+llm_cache = LLMResponseCache(
+    max_entries=settings.llm_cache_max_entries,
+    ttl_seconds=settings.llm_cache_ttl_seconds,
+    use_redis=settings.llm_cache_redis_enabled,
+)
@@ -0,0 +1,62 @@
+"""Local sentence embeddings.
+
+Shared sentence-transformers encoders plus the similarity helpers built on
+them. The heavy dependencies are imported on first use.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENCODER = "all-MiniLM-L6-v2"
+
+_encoders: Dict[str, Any] = {}
+_encoders_lock = threading.Lock()
+
+
+def get_sentence_encoder(model_name: str = DEFAULT_ENCODER) -> Any:
+    """Get a shared SentenceTransformer, loading it on first use."""
+    with _encoders_lock:
+        encoder = _encoders.get(model_name)
+        if encoder is None:
+            from sentence_transformers import SentenceTransformer
+
+            logger.info(f"Loading sentence encoder '{model_name}'")
+            encoder = SentenceTransformer(model_name)
+            _encoders[model_name] = encoder
+        return encoder
+
+
+def encode_texts(
+    texts: Sequence[str],
+    model_name: str = DEFAULT_ENCODER,
+    batch_size: int = 64,
+) -> np.ndarray:
+    """Embed texts in batches as unit-length vectors.
+
+    Args:
+        texts: Texts to embed
+        model_name: sentence-transformers model to use
+        batch_size: Texts per forward pass
+
+    Returns:
+        Array of shape (len(texts), dimensions)
+    """
+    if not texts:
+        return np.zeros((0, 0), dtype=np.float32)
+
+    return np.asarray(
+        get_sentence_encoder(model_name).encode(
+            list(texts), batch_size=batch_size, normalize_embeddings=True
+        ),
+        dtype=np.float32,
+    )
+
+
+def cosine_similarity_matrix(embeddings: np.ndarray) -> np.ndarray:
+    """Pairwise cosine similarities of unit-length embeddings."""
+    return embeddings @ embeddings.T
@@ -5,10 +5,33 @@ Helper functions for working with language models.
 
 import asyncio
 import logging
-from typing import Any, Callable, List, Optional, Tuple, Type, TypeVar
+import threading
+import time
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from langchain_core.callbacks import UsageMetadataCallbackHandler
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import Runnable
+from langchain_core.tracers.context import register_configure_hook
+
+from .cache import LLMResponseCache, llm_cache
+from .models import get_llm
+from .quota import record_token_usage
+from .rate_limit import is_rate_limit_error, rate_scheduler, retry_after_seconds
+from .settings import settings
+from .tokenizer import count_prompt_tokens, count_tokens
 
 T = TypeVar("T")
 R = TypeVar("R")
@@ -16,9 +39,104 @@ M = TypeVar("M", bound=BaseModel)
 
 logger = logging.getLogger(__name__)
 
+# (id(llm), output_class) -> (llm, bound runnable). Holding the llm keeps its
+# id from being reused while the entry exists.
+_structured_runnables: Dict[Tuple[int, type], Tuple[BaseChatModel, Runnable]] = {}
+_structured_runnables_lock = threading.Lock()
+
+# Output tokens reserved per call when charging the OpenAI tokens-per-minute limit
+EXPECTED_OUTPUT_TOKENS = 500
+
+# Collects the usage metadata of the LLM calls made while it is set
+_usage_callback: ContextVar[Optional[UsageMetadataCallbackHandler]] = ContextVar(
+    "llm_usage_callback", default=None
+)
+register_configure_hook(_usage_callback, inheritable=True)
+
 
 def estimate_token_count(text: str) -> int:
-    return len(text) // 4
+    return count_tokens(text)
+
+
+def pack_batches(
+    items: List[T],
+    cost_fn: Callable[[T], int],
+    max_items: int,
+    max_tokens: int,
+) -> List[List[T]]:
+    """Group items, in order, into batches bounded by count and token cost.
+
+    An item that alone exceeds max_tokens gets a batch of its own.
+
+    Args:
+        items: Items to group
+        cost_fn: Token cost of one item
+        max_items: Maximum items per batch
+        max_tokens: Maximum summed cost per batch
+
+    Returns:
+        List of batches
+    """
+    batches: List[List[T]] = []
+    current: List[T] = []
+    current_tokens = 0
+
+    for item in items:
+        cost = cost_fn(item)
+        if current and (
+            len(current) >= max_items or current_tokens + cost > max_tokens
+        ):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(item)
+        current_tokens += cost
+
+    if current:
+        batches.append(current)
+
+    return batches
+
+
+def pack_to_token_budget(
+    items: List[T],
+    format_item: Callable[[int, T], str],
+    max_tokens: int,
+    separator: str = "\n\n",
+) -> List[int]:
+    """Pick the longest prefix of items whose joined rendering fits a budget.
+
+    Each item is formatted and counted once, so this is linear in the number
+    of items. Tokens can merge across item boundaries, so the picked items
+    are joined and counted once more, dropping trailing items while the
+    exact count is over the budget.
+
+    Args:
+        items: Items in priority order
+        format_item: Renders one item given its position and value
+        max_tokens: Token budget for the joined rendering
+        separator: String the rendered items are joined with
+
+    Returns:
+        Indices of the items that fit
+    """
+    separator_tokens = count_tokens(separator) if separator else 0
+    rendered: List[str] = []
+    used = 0
+
+    for index, item in enumerate(items):
+        text = format_item(index, item)
+        cost = count_tokens(text)
+        if rendered:
+            cost += separator_tokens
+        if used + cost > max_tokens:
+            break
+        rendered.append(text)
+        used += cost
+
+    while rendered and count_prompt_tokens(separator.join(rendered)) > max_tokens:
+        rendered.pop()
+
+    return list(range(len(rendered)))
 
 
 def truncate_evidence_for_token_limit(
@@ -27,18 +145,34 @@ def truncate_evidence_for_token_limit(
     system_prompt: str,
     human_prompt_template: str,
     max_tokens: int = 120000,
-    format_evidence_func: Callable[[List[Any]], str] = None,
+    format_item_func: Optional[Callable[[int, Any], str]] = None,
+    separator: str = "\n\n",
 ) -> List[Any]:
+    """Keep the leading evidence items that fit in the prompt's token budget.
+
+    Evidence is expected most relevant first, so the tail is dropped.
+
+    Args:
+        evidence_items: Evidence, in priority order
+        claim_text: Claim the prompt is about
+        system_prompt: System prompt text
+        human_prompt_template: Human prompt with {claim_text} and
+            {evidence_snippets} placeholders
+        max_tokens: Context budget for the whole prompt
+        format_item_func: Renders one item given its position and value
+        separator: String the rendered items are joined with
+
+    Returns:
+        The evidence items that fit
+    """
     if not evidence_items:
         return evidence_items
 
-    format_func = format_evidence_func or (
-        lambda items: "\n\n".join(
-            f"Evidence {i + 1}: {str(item)}" for i, item in enumerate(items)
-        )
+    format_item = format_item_func or (
+        lambda i, item: f"Evidence {i + 1}: {str(item)}"
     )
 
-    base_tokens = estimate_token_count(
+    base_tokens = count_prompt_tokens(
         system_prompt
         + human_prompt_template.format(claim_text=claim_text, evidence_snippets="")
     )
@@ -47,15 +181,10 @@ def truncate_evidence_for_token_limit(
     if available_tokens <= 0:
         return evidence_items[:1]
 
-    selected = []
-    for evidence in reversed(evidence_items):
-        test_tokens = estimate_token_count(format_func(selected + [evidence]))
-        if test_tokens <= available_tokens:
-            selected.append(evidence)
-        else:
-            break
-
-    result = [e for e in evidence_items if e in selected]
+    kept = pack_to_token_budget(
+        evidence_items, format_item, available_tokens, separator
+    )
+    result = [evidence_items[i] for i in kept]
 
     if len(result) < len(evidence_items):
         logger.info(f"Truncated evidence: {len(evidence_items)} → {len(result)} items")
@@ -63,11 +192,70 @@ def truncate_evidence_for_token_limit(
     return result
 
 
+def _messages_text(messages: Any) -> str:
+    """Text of a prompt value or (role, content) message list."""
+    if hasattr(messages, "to_messages"):
+        messages = messages.to_messages()
+    return "\n".join(
+        str(message[1] if isinstance(message, tuple) else message.content)
+        for message in messages
+    )
+
+
+def get_structured_llm(llm: BaseChatModel, output_class: Type[M]) -> Runnable:
+    """Get the structured-output runnable for an LLM and schema.
+
+    Binding the schema is done once per (llm, output_class) pair instead of
+    on every call.
+
+    Args:
+        llm: LLM instance
+        output_class: Pydantic model for structured output
+
+    Returns:
+        Runnable returning instances of output_class
+    """
+    key = (id(llm), output_class)
+
+    with _structured_runnables_lock:
+        entry = _structured_runnables.get(key)
+        if entry is None:
+            entry = (llm, llm.with_structured_output(output_class))
+            _structured_runnables[key] = entry
+        return entry[1]
+
+
+def precompile_structured_outputs(
+    specs: Iterable[Tuple[Dict[str, Any], Type[BaseModel]]],
+) -> int:
+    """Build structured-output runnables ahead of the first request.
+
+    Args:
+        specs: (get_llm keyword arguments, output class) pairs
+
+    Returns:
+        Number of runnables built
+    """
+    count = 0
+    for llm_kwargs, output_class in specs:
+        try:
+            get_structured_llm(get_llm(**llm_kwargs), output_class)
+            count += 1
+        except ValueError as e:
+            # No API key yet (e.g. importing the graph for inspection)
+            logger.debug(f"Skipping structured output precompilation: {e}")
+            break
+
+    return count
+
+
 async def call_llm_with_structured_output(
     llm: BaseChatModel,
     output_class: Type[M],
     messages: List[Tuple[str, str]],
     context_desc: str = "",
+    use_cache: bool = False,
+    cache: Optional[LLMResponseCache] = None,
 ) -> Optional[M]:
     """Call LLM with structured output and consistent error handling.
 
@@ -76,16 +264,176 @@ async def call_llm_with_structured_output(
         output_class: Pydantic model for structured output
         messages: Messages to send to the LLM
         context_desc: Description for error logs
+        use_cache: Serve/store the response through the LLM response cache.
+            Only meant for deterministic (temperature 0) stages.
+        cache: Cache to use instead of the shared one
 
     Returns:
         Structured output or None if error
     """
+    response_cache = None
+    if use_cache and settings.llm_cache_enabled:
+        response_cache = cache or llm_cache
+
+    cache_key = None
+    if response_cache:
+        try:
+            cache_key = response_cache.make_key(llm, output_class, messages)
+            cached = await response_cache.get(cache_key, output_class)
+            if cached is not None:
+                logger.debug(f"LLM cache hit for {context_desc}")
+                return cached
+        except Exception as e:
+            logger.warning(f"LLM cache lookup failed for {context_desc}: {e}")
+
+    # Wait for OpenAI capacity; 429s pause everyone and are retried
+    estimated_tokens = (
+        count_prompt_tokens(_messages_text(messages)) + EXPECTED_OUTPUT_TOKENS
+    )
+    usage = UsageMetadataCallbackHandler()
+    usage_token = _usage_callback.set(usage)
     try:
-        return await llm.with_structured_output(output_class).ainvoke(messages)
-    except Exception as e:
-        logger.error(f"Error in LLM call for {context_desc}: {e}")
+        for attempt in range(settings.rate_limit_retries + 1):
+            await rate_scheduler.acquire(
+                "openai", requests=1, tokens=estimated_tokens
+            )
+            try:
+                response = await get_structured_llm(llm, output_class).ainvoke(
+                    messages
+                )
+                break
+            except Exception as e:
+                if is_rate_limit_error(e) and attempt < settings.rate_limit_retries:
+                    rate_scheduler.pause(
+                        "openai", retry_after_seconds(e, 2.0**attempt)
+                    )
+                    continue
+                logger.error(f"Error in LLM call for {context_desc}: {e}")
+                return None
+    finally:
+        _usage_callback.reset(usage_token)
+        # Charge the run's API key for what the upstream actually billed
+        await record_token_usage(
+            sum(u.get("total_tokens", 0) for u in usage.usage_metadata.values())
+        )
+
+    if cache_key and response is not None:
+        await response_cache.set(cache_key, response)
+
+    return response
+
+
+class VotingStats(BaseModel):
+    """Timing collected by process_with_voting for concurrency tuning."""
+
+    items: int = Field(default=0, description="Number of items processed")
+    accepted: int = Field(default=0, description="Items that reached consensus")
+    item_latencies: List[float] = Field(
+        default_factory=list,
+        description="Seconds spent voting on each item, in input order",
+    )
+    total_seconds: float = Field(
+        default=0.0, description="Wall-clock seconds for the whole batch"
+    )
+    calls_saved: int = Field(
+        default=0, description="Attempts cancelled once a vote was decided"
+    )
+
+
+async def _attempt_all(
+    item: T, processor: Callable, llm: Any, completions: int
+) -> List[Tuple[bool, Optional[R]]]:
+    """Run every attempt and wait for all of them."""
+    return await asyncio.gather(*[processor(item, llm) for _ in range(completions)])
+
+
+async def _attempt_until_decided(
+    item: T, processor: Callable, llm: Any, completions: int, min_successes: int
+) -> Tuple[List[Tuple[bool, Optional[R]]], int]:
+    """Run attempts until consensus is reached or becomes impossible.
+
+    Returns:
+        (finished attempts, number of attempts cancelled)
+    """
+    tasks = [asyncio.create_task(processor(item, llm)) for _ in range(completions)]
+    attempts: List[Tuple[bool, Optional[R]]] = []
+    successes = failures = 0
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            success, result = await next_done
+            attempts.append((success, result))
+            if success:
+                successes += 1
+            else:
+                failures += 1
+
+            if successes >= min_successes or failures > completions - min_successes:
+                break
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+
+    return attempts, len(pending)
+
+
+async def vote_on_item(
+    item: T,
+    processor: Callable[[T, Any], Tuple[bool, Optional[R]]],
+    llm: Any,
+    completions: int,
+    min_successes: int,
+    result_factory: Callable[[R, T], Any],
+    description: str = "item",
+    early_stop: bool = False,
+    stats: Optional[VotingStats] = None,
+) -> Optional[Any]:
+    """Run consensus voting for a single item.
+
+    Args:
+        item: Item to process
+        processor: Function that processes the item
+        llm: LLM instance
+        completions: How many attempts
+        min_successes: How many must succeed
+        result_factory: Function to create final result
+        description: Item type for logs
+        early_stop: Stop once the outcome is decided, cancelling the rest
+        stats: Optional collector; cancelled attempts are added to calls_saved
+
+    Returns:
+        The processed result, or None without consensus
+    """
+    # Make multiple attempts
+    if early_stop:
+        attempts, cancelled = await _attempt_until_decided(
+            item, processor, llm, completions, min_successes
+        )
+        if stats is not None:
+            stats.calls_saved += cancelled
+    else:
+        attempts = await _attempt_all(item, processor, llm, completions)
+
+    # Count successes
+    success_count = sum(1 for success, _ in attempts if success)
+
+    # Only proceed if we have enough successes
+    if success_count < min_successes:
+        logger.info(
+            f"Not enough successes ({success_count}/{min_successes}) for {description}"
+        )
         return None
 
+    # Use the first successful result
+    for success, result in attempts:
+        if success and result is not None:
+            processed_result = result_factory(result, item)
+            if processed_result:
+                return processed_result
+
+    return None
+
 
 async def process_with_voting(
     items: List[T],
@@ -95,9 +443,17 @@ async def process_with_voting(
     min_successes: int,
     result_factory: Callable[[R, T], Any],
     description: str = "item",
+    max_concurrency: int = 10,
+    early_stop: bool = False,
+    stats: Optional[VotingStats] = None,
 ) -> List[Any]:
     """Process items with multiple LLM attempts and consensus voting.
 
+    Items are voted on concurrently (at most max_concurrency at a time);
+    results keep the input order. With early_stop, an item is decided as soon
+    as min_successes attempts succeed or that becomes impossible, and the
+    attempts still in flight are cancelled.
+
     Args:
         items: Items to process
         processor: Function that processes each item
@@ -106,34 +462,50 @@ async def process_with_voting(
         min_successes: How many must succeed
         result_factory: Function to create final result
         description: Item type for logs
+        max_concurrency: How many items to vote on at once
+        early_stop: Stop each vote once its outcome is decided
+        stats: Optional collector for per-item latency and wall-clock time
 
     Returns:
         List of successfully processed results
     """
-    results = []
+    batch_stats = VotingStats(items=len(items), item_latencies=[0.0] * len(items))
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    started = time.perf_counter()
 
-    for item in items:
-        # Make multiple attempts
-        attempts = await asyncio.gather(
-            *[processor(item, llm) for _ in range(completions)]
-        )
+    async def vote(index: int, item: T) -> Optional[Any]:
+        async with semaphore:
+            item_started = time.perf_counter()
+            try:
+                return await vote_on_item(
+                    item,
+                    processor,
+                    llm,
+                    completions,
+                    min_successes,
+                    result_factory,
+                    description=description,
+                    early_stop=early_stop,
+                    stats=batch_stats,
+                )
+            finally:
+                batch_stats.item_latencies[index] = time.perf_counter() - item_started
 
-        # Count successes
-        success_count = sum(1 for success, _ in attempts if success)
+    outcomes = await asyncio.gather(
+        *(vote(index, item) for index, item in enumerate(items))
+    )
+    results = [outcome for outcome in outcomes if outcome]
 
-        # Only proceed if we have enough successes
-        if success_count < min_successes:
-            logger.info(
-                f"Not enough successes ({success_count}/{min_successes}) for {description}"
-            )
-            continue
-
-        # Use the first successful result
-        for success, result in attempts:
-            if success and result is not None:
-                processed_result = result_factory(result, item)
-                if processed_result:
-                    results.append(processed_result)
-                    break
+    batch_stats.accepted = len(results)
+    batch_stats.total_seconds = time.perf_counter() - started
+    logger.info(
+        f"Voted on {len(items)} {description}(s) in {batch_stats.total_seconds:.2f}s "
+        f"(concurrency {max_concurrency}, {len(results)} accepted, "
+        f"{batch_stats.calls_saved} calls saved)"
+    )
+
+    if stats is not None:
+        for field, value in batch_stats:
+            setattr(stats, field, value)
 
     return results
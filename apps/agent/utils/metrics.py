@@ -0,0 +1,42 @@
+"""Lightweight in-process metrics.
+
+Counters are kept in memory and exposed as plain dicts through stats()
+methods, so they can be logged or served by whatever wraps the graphs.
+"""
+
+import bisect
+from typing import Dict, Sequence
+
+DEFAULT_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class LatencyHistogram:
+    """Cumulative-bucket latency histogram (Prometheus style)."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one duration."""
+        self._counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def snapshot(self) -> Dict[str, object]:
+        """Cumulative bucket counts plus count, sum and mean."""
+        cumulative = {}
+        running = 0
+        for bound, count in zip(self.buckets, self._counts):
+            running += count
+            cumulative[f"le_{bound:g}"] = running
+        cumulative["le_inf"] = self.count
+
+        return {
+            "buckets": cumulative,
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+        }
@@ -1,29 +1,96 @@
 """Unified LLM model instances and factory functions.
 
 Provides access to configured language model instances for all modules.
+Instances are shared through a registry keyed on their configuration, and
+all of them reuse a single pooled async HTTP client.
 """
 
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
 from langchain.chat_models import init_chat_model
 from langchain_core.language_models.chat_models import BaseChatModel
 
 from utils.settings import settings
 
+logger = logging.getLogger(__name__)
+
+_registry: Dict[Tuple[Any, ...], BaseChatModel] = {}
+_registry_lock = threading.Lock()
+_registry_hits = 0
+
+_http_async_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_http_client_lock = threading.Lock()
+_http_client_resets = 0
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        # Synchronous caller, e.g. structured output precompilation
+        return None
+
+
+def get_http_async_client() -> httpx.AsyncClient:
+    """Get the process-wide async HTTP client used by every model instance.
+
+    Pooled connections belong to the event loop that opened them, so a new
+    client is created if the client is used from a different loop or was
+    closed. Cached model instances hold the old client, so the registry is
+    cleared at the same time.
+    """
+    global _http_async_client, _http_client_loop, _http_client_resets
+
+    loop = _running_loop()
+    with _http_client_lock:
+        client = _http_async_client
+        loop_changed = loop is not None and _http_client_loop not in (None, loop)
+        if client is None or client.is_closed or loop_changed:
+            if client is not None:
+                _http_client_resets += 1
+                logger.info("Event loop changed or client closed, new HTTP client")
+                with _registry_lock:
+                    _registry.clear()
+            _http_async_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.llm_http_max_connections,
+                    max_keepalive_connections=settings.llm_http_max_keepalive,
+                    keepalive_expiry=settings.llm_http_keepalive_expiry,
+                ),
+                timeout=httpx.Timeout(settings.llm_http_timeout),
+            )
+        if loop is not None:
+            _http_client_loop = loop
+        return _http_async_client
+
 
 def get_llm(
     model_name: str = "openai:gpt-4o-mini",
     temperature: float = 0.0,
     completions: int = 1,
+    **provider_options: Any,
 ) -> BaseChatModel:
     """Get LLM with specified configuration.
 
+    Instances are cached, so repeated calls with the same configuration
+    return the same (thread-safe) model object.
+
     Args:
         model_name: The model to use
         temperature: Temperature for generation
         completions: How many completions we need (affects temperature for diversity)
+        **provider_options: Extra keyword arguments for init_chat_model
 
     Returns:
         Configured LLM instance
     """
+    global _registry_hits
+
     # Use higher temp when doing multiple completions for diversity
     if completions > 1 and temperature == 0.0:
         temperature = 0.2
@@ -31,13 +98,52 @@ def get_llm(
     if not settings.openai_api_key:
         raise ValueError("OpenAI API key not found in environment variables")
 
-    return init_chat_model(
-        model=model_name,
-        api_key=settings.openai_api_key,
-        temperature=temperature if model_name.startswith("openai:gpt") else None,
-    )
+    key = (model_name, temperature, tuple(sorted(provider_options.items())))
+    # Before the registry lookup, so instances holding a stale client are gone
+    http_async_client = get_http_async_client()
+
+    with _registry_lock:
+        llm = _registry.get(key)
+        if llm is not None:
+            _registry_hits += 1
+            return llm
+
+        llm = init_chat_model(
+            model=model_name,
+            api_key=settings.openai_api_key,
+            temperature=temperature if model_name.startswith("openai:gpt") else None,
+            http_async_client=http_async_client,
+            **provider_options,
+        )
+        _registry[key] = llm
+        return llm
 
 
 def get_default_llm() -> BaseChatModel:
     """Get default LLM instance."""
     return get_llm()
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """Registry and HTTP connection pool statistics."""
+    stats: Dict[str, Any] = {
+        "model_instances": len(_registry),
+        "registry_hits": _registry_hits,
+        "client_resets": _http_client_resets,
+        "max_connections": settings.llm_http_max_connections,
+        "max_keepalive_connections": settings.llm_http_max_keepalive,
+    }
+
+    client = _http_async_client
+    # httpx does not expose its pool publicly, so read it defensively
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "connections", None)
+    if connections is not None:
+        stats["open_connections"] = len(connections)
+        stats["idle_connections"] = sum(
+            1
+            for conn in connections
+            if callable(getattr(conn, "is_idle", None)) and conn.is_idle()
+        )
+
+    return stats
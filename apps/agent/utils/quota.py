@@ -0,0 +1,230 @@
+"""Per-API-key usage accounting inside graph runs.
+
+The auth layer (security/limits.py) admits runs against per-key limits and
+tags each run's metadata with the key id and a lease id. This module is the
+run-side half: it charges the LLM tokens a run spends to its key's budget,
+and takes the run's concurrency slot when the run starts, keeps it leased
+while the run is active and gives it back when it finishes (see
+track_run_slot).
+Runs started without a key (e.g. local scripts) are not accounted.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, TypeVar
+
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import ensure_config
+from langgraph.config import get_config
+from langgraph.pregel import Pregel
+from redis.exceptions import RedisError
+
+from .redis import redis_client
+from .settings import settings
+
+G = TypeVar("G", bound=Pregel)
+
+logger = logging.getLogger(__name__)
+
+# Run metadata keys set by the auth layer
+API_KEY_ID_METADATA = "api_key_id"
+RUN_LEASE_METADATA = "api_key_run_lease"
+
+LIMITS_PREFIX = "api_key_limits"
+
+
+def request_window_key(key_id: str) -> str:
+    """Sorted set of the key's recent request timestamps."""
+    return f"{LIMITS_PREFIX}:{key_id}:requests"
+
+
+def run_leases_key(key_id: str) -> str:
+    """Sorted set of the key's run leases, scored by expiry time."""
+    return f"{LIMITS_PREFIX}:{key_id}:runs"
+
+
+def token_budget_window(now: Optional[float] = None) -> int:
+    """Index of the current token budget window."""
+    window = max(1, settings.api_key_token_budget_window_seconds)
+    return int((time.time() if now is None else now) // window)
+
+
+def token_usage_key(key_id: str, window: int) -> str:
+    """Counter of tokens the key spent in one budget window."""
+    return f"{LIMITS_PREFIX}:{key_id}:tokens:{window}"
+
+
+def _run_metadata() -> Dict[str, Any]:
+    try:
+        return get_config().get("metadata") or {}
+    except RuntimeError:
+        # Called outside a graph run
+        return {}
+
+
+class RunSlotUnavailable(Exception):
+    """A run started while its API key had every concurrency slot taken."""
+
+
+def current_api_key_id() -> Optional[str]:
+    """The API key id the current graph run was started with."""
+    return _run_metadata().get(API_KEY_ID_METADATA)
+
+
+async def get_token_usage(key_id: str) -> int:
+    """Tokens the key has spent in the current budget window."""
+    async with redis_client() as client:
+        used = await client.get(token_usage_key(key_id, token_budget_window()))
+    return int(used or 0)
+
+
+async def record_token_usage(tokens: int) -> None:
+    """Charge tokens to the current run's API key budget.
+
+    Args:
+        tokens: Input plus output tokens reported by the LLM
+    """
+    key_id = current_api_key_id()
+    if not key_id or tokens <= 0:
+        return
+
+    key = token_usage_key(key_id, token_budget_window())
+    try:
+        async with redis_client() as client:
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.incrby(key, tokens)
+                pipe.expire(key, settings.api_key_token_budget_window_seconds * 2)
+                await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Failed to record token usage for key {key_id}: {e}")
+
+
+async def count_run_leases(key_id: str) -> int:
+    """Unexpired concurrency leases the key holds."""
+    key = run_leases_key(key_id)
+    async with redis_client() as client:
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(key, "-inf", time.time())
+            pipe.zcard(key)
+            _, active = await pipe.execute()
+    return active
+
+
+async def _take_lease(key_id: str, lease: str) -> bool:
+    """Lease a concurrency slot, or return False if every slot is taken."""
+    key = run_leases_key(key_id)
+    lease_seconds = settings.api_key_run_lease_seconds
+    now = time.time()
+    try:
+        async with redis_client() as client:
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.zremrangebyscore(key, "-inf", now)
+                pipe.zadd(key, {lease: now + lease_seconds})
+                pipe.zcard(key)
+                pipe.expire(key, lease_seconds)
+                _, _, active, _ = await pipe.execute()
+            if active > settings.api_key_max_concurrent_runs:
+                await client.zrem(key, lease)
+                return False
+    except RedisError as e:
+        logger.warning(f"Failed to take run slot for key {key_id}: {e}")
+    return True
+
+
+async def _renew_lease(key_id: str, lease: str) -> None:
+    """Push a run's lease expiry forward until cancelled."""
+    key = run_leases_key(key_id)
+    lease_seconds = settings.api_key_run_lease_seconds
+    while True:
+        await asyncio.sleep(lease_seconds / 3)
+        try:
+            async with redis_client() as client:
+                async with client.pipeline(transaction=True) as pipe:
+                    pipe.zadd(key, {lease: time.time() + lease_seconds})
+                    pipe.expire(key, lease_seconds)
+                    await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Failed to renew run slot for key {key_id}: {e}")
+
+
+async def _release_lease(key_id: str, lease: str) -> None:
+    try:
+        async with redis_client() as client:
+            await client.zrem(run_leases_key(key_id), lease)
+    except RedisError as e:
+        logger.warning(f"Failed to release run slot for key {key_id}: {e}")
+
+
+@asynccontextmanager
+async def hold_run_slot(config: Optional[RunnableConfig]) -> AsyncIterator[None]:
+    """Hold a run's concurrency slot for as long as the block runs.
+
+    The slot is taken on entry, renewed while the run is active and released
+    when it ends, however it ends. Admission already checked that a slot was
+    free; runs admitted together can still find them all taken once they
+    start, and then fail. Graphs invoked from inside another graph's nodes
+    share the outer run's slot and leave it alone.
+
+    Args:
+        config: Config the graph was invoked with
+
+    Raises:
+        RunSlotUnavailable: If every slot of the run's key is taken
+    """
+    config = ensure_config(config)
+    metadata = config.get("metadata") or {}
+    key_id = metadata.get(API_KEY_ID_METADATA)
+    lease = metadata.get(RUN_LEASE_METADATA)
+    # Node metadata is only present when called from inside a running graph
+    if (
+        not key_id
+        or not lease
+        or "langgraph_node" in metadata
+        or not settings.api_key_max_concurrent_runs
+    ):
+        yield
+        return
+
+    if not await _take_lease(key_id, lease):
+        raise RunSlotUnavailable(
+            f"API key {key_id} already has "
+            f"{settings.api_key_max_concurrent_runs} runs in flight"
+        )
+
+    renewer = asyncio.create_task(_renew_lease(key_id, lease))
+    try:
+        yield
+    finally:
+        renewer.cancel()
+        await _release_lease(key_id, lease)
+
+
+_slot_tracked_classes: Dict[type, type] = {}
+
+
+def track_run_slot(graph: G) -> G:
+    """Make every top-level run of a compiled graph hold its concurrency slot.
+
+    Args:
+        graph: Compiled graph exposed by the server
+
+    Returns:
+        A copy of the graph whose astream (and so ainvoke) runs inside
+        hold_run_slot
+    """
+    base = type(graph)
+    tracked = _slot_tracked_classes.get(base)
+    if tracked is None:
+
+        class SlotTrackedGraph(base):
+            async def astream(self, input: Any, config=None, **kwargs: Any):
+                async with hold_run_slot(config):
+                    async for chunk in super().astream(input, config, **kwargs):
+                        yield chunk
+
+        tracked = _slot_tracked_classes[base] = SlotTrackedGraph
+
+    # Same construction as Pregel.copy, so copies keep the subclass
+    return tracked(**graph.__dict__)
@@ -0,0 +1,260 @@
+"""Process-wide rate limiting for upstream APIs.
+
+Every call to OpenAI, Exa or Tavily first acquires capacity from a token
+bucket per upstream limit (requests and tokens per minute, queries per
+second). Waiting calls are queued per run and served round-robin, so one
+large document cannot starve the other runs sharing the process.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterator, Optional
+
+from .metrics import LatencyHistogram
+from .settings import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RUN = "default"
+
+_current_run: ContextVar[str] = ContextVar("rate_limit_run", default=DEFAULT_RUN)
+
+
+@contextmanager
+def run_scope(run_key: Optional[str]) -> Iterator[None]:
+    """Attribute upstream calls made inside the block to one run.
+
+    Tasks started inside the block (e.g. subgraph nodes) inherit the run.
+    """
+    token = _current_run.set(run_key or DEFAULT_RUN)
+    try:
+        yield
+    finally:
+        _current_run.reset(token)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Whether an exception is an upstream HTTP 429."""
+    response = getattr(error, "response", None)
+    status = getattr(error, "status_code", None) or getattr(
+        response, "status_code", None
+    )
+    return status == 429 or type(error).__name__ == "RateLimitError"
+
+
+def retry_after_seconds(error: BaseException, default: float) -> float:
+    """The Retry-After delay of a 429 response, or default."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return max(0.0, float(headers.get("retry-after", default)))
+    except (TypeError, ValueError):
+        return default
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate."""
+
+    def __init__(self, rate_per_second: float, capacity: float):
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated) * self.rate_per_second
+        )
+        self.updated = now
+
+    def delay(self, amount: float, now: float) -> float:
+        """Seconds until amount is available (capped at a full bucket)."""
+        self._refill(now)
+        missing = min(amount, self.capacity) - self.tokens
+        return max(0.0, missing / self.rate_per_second)
+
+    def consume(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self.tokens -= min(amount, self.capacity)
+
+
+@dataclass
+class _Request:
+    costs: Dict[str, float]
+    future: asyncio.Future
+    queued_at: float = field(default_factory=time.perf_counter)
+
+
+class UpstreamScheduler:
+    """Fair, rate-limited admission to one upstream API.
+
+    Requests wait in a FIFO queue per run; a single dispatcher task grants
+    them round-robin across runs as the buckets allow.
+
+    Args:
+        name: Upstream name, for logs and metrics
+        buckets: Token bucket per limited quantity (e.g. "requests", "tokens")
+    """
+
+    def __init__(self, name: str, buckets: Dict[str, TokenBucket]):
+        self.name = name
+        self.buckets = buckets
+        self._queues: "OrderedDict[str, Deque[_Request]]" = OrderedDict()
+        self._paused_until = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self.wait_time = LatencyHistogram()
+        self.granted = 0
+        self.throttled = 0
+
+    async def acquire(self, run_key: Optional[str] = None, **costs: float) -> None:
+        """Wait for capacity, then consume it.
+
+        Args:
+            run_key: Run to queue under (defaults to the current run_scope)
+            **costs: Amount per bucket; unspecified buckets cost 1
+        """
+        if not self.buckets:
+            return
+
+        self._ensure_dispatcher()
+        request = _Request(
+            costs={name: costs.get(name, 1) for name in self.buckets},
+            future=self._loop.create_future(),
+        )
+        self._queues.setdefault(run_key or _current_run.get(), deque()).append(
+            request
+        )
+        self._wakeup.set()
+
+        # A cancelled waiter is skipped by the dispatcher
+        await request.future
+        self.wait_time.observe(time.perf_counter() - request.queued_at)
+
+    def pause(self, seconds: float) -> None:
+        """Hold all grants for a while, e.g. after the upstream returned 429."""
+        self.throttled += 1
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        logger.warning(f"{self.name} rate limited, pausing grants for {seconds:.1f}s")
+
+    def _ensure_dispatcher(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or not self._dispatcher or self._dispatcher.done():
+            # Requests queued on another (closed) loop can never be granted
+            self._queues.clear()
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._dispatcher = loop.create_task(self._dispatch())
+
+    async def _dispatch(self) -> None:
+        while True:
+            if not self._queues:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            run_key, queue = next(iter(self._queues.items()))
+            request = queue[0]
+            if request.future.done():
+                self._pop(run_key)
+                continue
+
+            now = time.monotonic()
+            delay = max(
+                self._paused_until - now,
+                *(
+                    bucket.delay(request.costs[name], now)
+                    for name, bucket in self.buckets.items()
+                ),
+            )
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            for name, bucket in self.buckets.items():
+                bucket.consume(request.costs[name], now)
+            self.granted += 1
+            request.future.set_result(None)
+            self._pop(run_key)
+
+            # Round-robin: the run goes to the back of the line
+            if run_key in self._queues:
+                self._queues.move_to_end(run_key)
+
+    def _pop(self, run_key: str) -> None:
+        queue = self._queues[run_key]
+        queue.popleft()
+        if not queue:
+            del self._queues[run_key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth per run, grant counters and wait-time histogram."""
+        depth = {run_key: len(queue) for run_key, queue in self._queues.items()}
+        return {
+            "queue_depth": sum(depth.values()),
+            "queue_depth_by_run": depth,
+            "granted": self.granted,
+            "throttled": self.throttled,
+            "wait_time": self.wait_time.snapshot(),
+            "available": {
+                name: round(bucket.tokens, 2) for name, bucket in self.buckets.items()
+            },
+        }
+
+
+def _per_minute(limit: float) -> Optional[TokenBucket]:
+    # Allow bursts of up to ten seconds' worth
+    return TokenBucket(limit / 60, max(1.0, limit / 6)) if limit > 0 else None
+
+
+def _per_second(limit: float) -> Optional[TokenBucket]:
+    return TokenBucket(limit, max(1.0, limit)) if limit > 0 else None
+
+
+def _buckets_from_settings(upstream: str) -> Dict[str, TokenBucket]:
+    limits = {
+        "openai": {
+            "requests": _per_minute(settings.openai_requests_per_minute),
+            "tokens": _per_minute(settings.openai_tokens_per_minute),
+        },
+        "exa": {"requests": _per_second(settings.exa_queries_per_second)},
+        "tavily": {"requests": _per_second(settings.tavily_queries_per_second)},
+    }.get(upstream, {})
+    return {name: bucket for name, bucket in limits.items() if bucket is not None}
+
+
+class RateScheduler:
+    """Registry of upstream schedulers shared by every graph in the process."""
+
+    def __init__(self):
+        self._upstreams: Dict[str, UpstreamScheduler] = {}
+
+    def upstream(self, name: str) -> UpstreamScheduler:
+        """Get the scheduler of an upstream, built from settings on first use."""
+        scheduler = self._upstreams.get(name)
+        if scheduler is None:
+            scheduler = UpstreamScheduler(name, _buckets_from_settings(name))
+            self._upstreams[name] = scheduler
+        return scheduler
+
+    async def acquire(self, upstream: str, **costs: float) -> None:
+        """Wait for capacity on an upstream; see UpstreamScheduler.acquire."""
+        await self.upstream(upstream).acquire(**costs)
+
+    def pause(self, upstream: str, seconds: float) -> None:
+        """Hold grants on an upstream; see UpstreamScheduler.pause."""
+        self.upstream(upstream).pause(seconds)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Stats for every upstream used so far."""
+        return {
+            name: scheduler.stats() for name, scheduler in self._upstreams.items()
+        }
+
+
+rate_scheduler = RateScheduler()
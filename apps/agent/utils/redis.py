@@ -1,21 +1,129 @@
-"""Redis utilities for connection management and common operations."""
+"""Redis utilities for connection management and common operations.
 
+All Redis users in the process (auth, API key management, caches) share one
+async connection pool, so a command costs a pooled round-trip instead of a
+fresh connect.
+"""
+
+import asyncio
+import logging
+import threading
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict, Optional
 
 import redis.asyncio as redis
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff, NoBackoff
+from redis.exceptions import ConnectionError, TimeoutError
 
 from .settings import settings
 
+logger = logging.getLogger(__name__)
+
+_pool: Optional[redis.BlockingConnectionPool] = None
+_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+_pool_lock = threading.Lock()
+_pool_resets = 0
+
+
+def _create_pool() -> redis.BlockingConnectionPool:
+    return redis.BlockingConnectionPool.from_url(
+        str(settings.redis_uri),
+        max_connections=settings.redis_max_connections,
+        # Seconds to wait for a free connection when all are in use
+        timeout=settings.redis_pool_timeout,
+        health_check_interval=settings.redis_health_check_interval,
+        socket_connect_timeout=settings.redis_socket_timeout,
+        socket_timeout=settings.redis_socket_timeout,
+        socket_keepalive=True,
+        retry=Retry(
+            ExponentialBackoff(
+                cap=settings.redis_backoff_cap, base=settings.redis_backoff_base
+            ),
+            settings.redis_retry_attempts,
+        ),
+        retry_on_error=[ConnectionError, TimeoutError],
+    )
+
+
+def get_redis_pool() -> redis.BlockingConnectionPool:
+    """Get the process-wide connection pool.
+
+    Pooled connections belong to the event loop that opened them, so a new
+    pool is created if the pool is used from a different loop.
+    """
+    global _pool, _pool_loop, _pool_resets
+
+    loop = asyncio.get_running_loop()
+    with _pool_lock:
+        if _pool is None or _pool_loop is not loop:
+            if _pool is not None:
+                _pool_resets += 1
+                logger.info("Event loop changed, creating a new Redis pool")
+            _pool = _create_pool()
+            _pool_loop = loop
+        return _pool
+
+
+def create_subscriber_client() -> redis.Redis:
+    """Create a client with its own connection for a long-lived subscription.
+
+    Subscriptions sit idle between messages, so there is no socket read
+    timeout. Disconnects are raised instead of retried, so the subscriber
+    knows it may have missed messages. Close the client when done.
+    """
+    return redis.Redis.from_url(
+        str(settings.redis_uri),
+        socket_connect_timeout=settings.redis_socket_timeout,
+        socket_timeout=None,
+        socket_keepalive=True,
+        health_check_interval=settings.redis_health_check_interval,
+        retry=Retry(NoBackoff(), 0),
+    )
+
+
+def get_redis() -> redis.Redis:
+    """Get a client backed by the shared pool."""
+    return redis.Redis(connection_pool=get_redis_pool())
+
 
 @asynccontextmanager
 async def redis_client() -> AsyncGenerator[redis.Redis, None]:
-    """Context manager for Redis connections."""
-    client = redis.from_url(str(settings.redis_uri))
-    try:
-        yield client
-    finally:
-        await client.aclose()
+    """Context manager for a client on the shared pool.
+
+    Connections go back to the pool after each command; nothing is closed
+    on exit.
+    """
+    yield get_redis()
+
+
+async def close_redis_pool() -> None:
+    """Disconnect every pooled connection (e.g. on shutdown)."""
+    global _pool, _pool_loop
+
+    with _pool_lock:
+        pool, _pool, _pool_loop = _pool, None, None
+    if pool is not None:
+        await pool.disconnect()
+
+
+def get_redis_pool_stats() -> Dict[str, Any]:
+    """Connection pool size and usage."""
+    stats: Dict[str, Any] = {
+        "max_connections": settings.redis_max_connections,
+        "pool_resets": _pool_resets,
+    }
+
+    pool = _pool
+    # redis-py does not expose pool usage publicly, so read it defensively
+    in_use = getattr(pool, "_in_use_connections", None)
+    available = getattr(pool, "_available_connections", None)
+    if in_use is not None and available is not None:
+        stats["in_use_connections"] = len(in_use)
+        stats["idle_connections"] = len(available)
+        stats["open_connections"] = len(in_use) + len(available)
+
+    return stats
 
 
 async def test_redis_connection() -> bool:
@@ -42,6 +42,100 @@ class Settings(BaseSettings):
     tavily_api_key: TavilyAPIKey = Field(default=None, alias="TAVILY_API_KEY")
     redis_uri: RedisDsn = Field(default="redis://localhost:6379", alias="REDIS_URL")
 
+    # Shared Redis connection pool
+    redis_max_connections: int = Field(default=50, alias="REDIS_MAX_CONNECTIONS")
+    redis_pool_timeout: float = Field(default=5.0, alias="REDIS_POOL_TIMEOUT")
+    redis_health_check_interval: int = Field(
+        default=30, alias="REDIS_HEALTH_CHECK_INTERVAL"
+    )
+    redis_socket_timeout: float = Field(default=5.0, alias="REDIS_SOCKET_TIMEOUT")
+    redis_retry_attempts: int = Field(default=3, alias="REDIS_RETRY_ATTEMPTS")
+    redis_backoff_base: float = Field(default=0.05, alias="REDIS_BACKOFF_BASE")
+    redis_backoff_cap: float = Field(default=2.0, alias="REDIS_BACKOFF_CAP")
+
+    # In-process API key validation cache
+    api_key_cache_ttl_seconds: float = Field(
+        default=60.0, alias="API_KEY_CACHE_TTL_SECONDS"
+    )
+    api_key_cache_negative_ttl_seconds: float = Field(
+        default=10.0, alias="API_KEY_CACHE_NEGATIVE_TTL_SECONDS"
+    )
+    api_key_cache_max_entries: int = Field(
+        default=10000, alias="API_KEY_CACHE_MAX_ENTRIES"
+    )
+
+    # Per-API-key limits (0 disables a limit)
+    api_key_requests_per_window: int = Field(
+        default=120, alias="API_KEY_REQUESTS_PER_WINDOW"
+    )
+    api_key_request_window_seconds: int = Field(
+        default=60, alias="API_KEY_REQUEST_WINDOW_SECONDS"
+    )
+    api_key_max_concurrent_runs: int = Field(
+        default=4, alias="API_KEY_MAX_CONCURRENT_RUNS"
+    )
+    api_key_run_lease_seconds: int = Field(
+        default=900, alias="API_KEY_RUN_LEASE_SECONDS"
+    )
+    api_key_token_budget: int = Field(default=1000000, alias="API_KEY_TOKEN_BUDGET")
+    api_key_token_budget_window_seconds: int = Field(
+        default=86400, alias="API_KEY_TOKEN_BUDGET_WINDOW_SECONDS"
+    )
+
+    # LLM response cache
+    llm_cache_enabled: bool = Field(default=False, alias="LLM_CACHE_ENABLED")
+    llm_cache_redis_enabled: bool = Field(
+        default=True, alias="LLM_CACHE_REDIS_ENABLED"
+    )
+    llm_cache_ttl_seconds: int = Field(default=86400, alias="LLM_CACHE_TTL_SECONDS")
+    llm_cache_max_entries: int = Field(default=1024, alias="LLM_CACHE_MAX_ENTRIES")
+
+    # Cross-request verdict cache
+    verdict_cache_enabled: bool = Field(default=False, alias="VERDICT_CACHE_ENABLED")
+
+    # Search result cache (Redis)
+    search_cache_enabled: bool = Field(default=False, alias="SEARCH_CACHE_ENABLED")
+    search_cache_ttl_seconds: int = Field(
+        default=21600, alias="SEARCH_CACHE_TTL_SECONDS"
+    )
+
+    # Shared HTTP connection pool for search providers
+    search_http_max_connections: int = Field(
+        default=50, alias="SEARCH_HTTP_MAX_CONNECTIONS"
+    )
+    search_http_max_keepalive: int = Field(
+        default=20, alias="SEARCH_HTTP_MAX_KEEPALIVE"
+    )
+
+    # Shared HTTP connection pool for LLM clients
+    llm_http_max_connections: int = Field(
+        default=100, alias="LLM_HTTP_MAX_CONNECTIONS"
+    )
+    llm_http_max_keepalive: int = Field(default=20, alias="LLM_HTTP_MAX_KEEPALIVE")
+    llm_http_keepalive_expiry: float = Field(
+        default=30.0, alias="LLM_HTTP_KEEPALIVE_EXPIRY"
+    )
+    llm_http_timeout: float = Field(default=120.0, alias="LLM_HTTP_TIMEOUT")
+
+    # Upstream rate limits shared by all graphs in the process (0 = unlimited)
+    openai_requests_per_minute: int = Field(
+        default=500, alias="OPENAI_REQUESTS_PER_MINUTE"
+    )
+    openai_tokens_per_minute: int = Field(
+        default=200000, alias="OPENAI_TOKENS_PER_MINUTE"
+    )
+    exa_queries_per_second: float = Field(default=5.0, alias="EXA_QUERIES_PER_SECOND")
+    tavily_queries_per_second: float = Field(
+        default=2.0, alias="TAVILY_QUERIES_PER_SECOND"
+    )
+    rate_limit_retries: int = Field(default=3, alias="RATE_LIMIT_RETRIES")
+
+    # Token counting
+    tokenizer_encoding: str = Field(default="o200k_base", alias="TOKENIZER_ENCODING")
+    tokenizer_vocab_path: str | None = Field(
+        default=None, alias="TOKENIZER_VOCAB_PATH"
+    )
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -0,0 +1,156 @@
+"""Token counting.
+
+A pluggable tokenizer behind a memoized count_tokens(). By default this is
+tiktoken with the encoding of our OpenAI models, optionally loaded from a
+local vocabulary file; without tiktoken it falls back to a length heuristic.
+"""
+
+import logging
+import threading
+from functools import lru_cache
+from typing import Optional, Protocol
+
+from .settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Pre-tokenization patterns of the OpenAI encodings, needed to build an
+# encoding from a local vocabulary file (copied from tiktoken_ext)
+_ENCODING_PATTERNS = {
+    "cl100k_base": r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}++|\p{N}{1,3}+| ?[^\s\p{L}\p{N}]++[\r\n]*+|\s++$|\s*[\r\n]|\s+(?!\S)|\s""",
+    "o200k_base": "|".join(
+        [
+            r"""[^\r\n\p{L}\p{N}]?[\p{Lu}\p{Lt}\p{Lm}\p{Lo}\p{M}]*[\p{Ll}\p{Lm}\p{Lo}\p{M}]+(?i:'s|'t|'re|'ve|'m|'ll|'d)?""",
+            r"""[^\r\n\p{L}\p{N}]?[\p{Lu}\p{Lt}\p{Lm}\p{Lo}\p{M}]+[\p{Ll}\p{Lm}\p{Lo}\p{M}]*(?i:'s|'t|'re|'ve|'m|'ll|'d)?""",
+            r"""\p{N}{1,3}""",
+            r""" ?[^\s\p{L}\p{N}]+[\r\n/]*""",
+            r"""\s*[\r\n]+""",
+            r"""\s+(?!\S)""",
+            r"""\s+""",
+        ]
+    ),
+}
+
+
+class Tokenizer(Protocol):
+    """Anything that can count the tokens of a string."""
+
+    def count(self, text: str) -> int:
+        """Number of tokens in text."""
+        ...
+
+
+class HeuristicTokenizer:
+    """Roughly four characters per token; used when no vocabulary is available."""
+
+    def count(self, text: str) -> int:
+        return len(text) // 4
+
+
+class TiktokenTokenizer:
+    """BPE token counts from tiktoken.
+
+    Args:
+        encoding_name: tiktoken encoding, e.g. "o200k_base" for gpt-4o/4.1
+        vocab_path: Local .tiktoken vocabulary file; when omitted tiktoken
+            loads the encoding from its cache (or downloads it)
+    """
+
+    def __init__(
+        self, encoding_name: str = "o200k_base", vocab_path: Optional[str] = None
+    ):
+        import tiktoken
+
+        if vocab_path:
+            from tiktoken.load import load_tiktoken_bpe
+
+            if encoding_name not in _ENCODING_PATTERNS:
+                raise ValueError(
+                    f"No pre-tokenization pattern known for '{encoding_name}'"
+                )
+            self.encoding = tiktoken.Encoding(
+                name=encoding_name,
+                pat_str=_ENCODING_PATTERNS[encoding_name],
+                mergeable_ranks=load_tiktoken_bpe(vocab_path),
+                special_tokens={},
+            )
+        else:
+            self.encoding = tiktoken.get_encoding(encoding_name)
+
+    def count(self, text: str) -> int:
+        return len(self.encoding.encode_ordinary(text))
+
+
+_tokenizer: Optional[Tokenizer] = None
+_tokenizer_lock = threading.Lock()
+
+
+def get_tokenizer() -> Tokenizer:
+    """Get the process-wide tokenizer, building it from settings on first use."""
+    global _tokenizer
+
+    with _tokenizer_lock:
+        if _tokenizer is None:
+            try:
+                _tokenizer = TiktokenTokenizer(
+                    settings.tokenizer_encoding, settings.tokenizer_vocab_path
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Tokenizer '{settings.tokenizer_encoding}' unavailable, "
+                    f"estimating tokens from length: {e}"
+                )
+                _tokenizer = HeuristicTokenizer()
+        return _tokenizer
+
+
+def set_tokenizer(tokenizer: Tokenizer) -> None:
+    """Replace the process-wide tokenizer (and drop memoized counts)."""
+    global _tokenizer
+
+    with _tokenizer_lock:
+        _tokenizer = tokenizer
+    count_tokens.cache_clear()
+
+
+@lru_cache(maxsize=8192)
+def count_tokens(text: str) -> int:
+    """Count tokens with the process-wide tokenizer, memoized per string.
+
+    Meant for short, repeated strings (sentences, claims, evidence items).
+    """
+    return get_tokenizer().count(text)
+
+
+def count_prompt_tokens(text: str) -> int:
+    """Count tokens without memoizing.
+
+    Full prompts are large and nearly always unique, so caching them would
+    only hold memory.
+    """
+    return get_tokenizer().count(text)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Longest prefix of text that is at most max_tokens tokens long.
+
+    Bisects on the prefix length, so it works with any tokenizer and counts
+    O(log len(text)) prefixes. Prefixes are not memoized.
+    """
+    if len(text) <= max_tokens:
+        # No token is shorter than one character
+        return text
+
+    tokenizer = get_tokenizer()
+    if tokenizer.count(text) <= max_tokens:
+        return text
+
+    # text[:fits] is within the budget, text[:too_long] is not
+    fits, too_long = 0, len(text)
+    while too_long - fits > 1:
+        middle = (fits + too_long) // 2
+        if tokenizer.count(text[:middle]) <= max_tokens:
+            fits = middle
+        else:
+            too_long = middle
+    return text[:fits]